@@ -604,15 +604,15 @@ LIMIT 1;"""
 GFSC_TC_ALREADY_EXIST = """
 SELECT EXISTS (
     WITH selected_inputs AS (
-        SELECT unnest(ARRAY{}) AS raw_input_id
+        SELECT unnest(%s::text[]) AS raw_input_id
     ),
     candidate_triggers AS (
         SELECT r2v.trigger_validation_id
         FROM hrwsi.raw2valid r2v
         JOIN hrwsi.trigger_validation tv ON tv.id = r2v.trigger_validation_id
         WHERE r2v.raw_input_id IN (SELECT raw_input_id FROM selected_inputs)
-          AND tv.triggering_condition_name = '{}'
-          AND tv.artificial_measurement_day = {}
+          AND tv.triggering_condition_name = %s
+          AND tv.artificial_measurement_day = %s
         GROUP BY r2v.trigger_validation_id
         HAVING COUNT(*) = (SELECT COUNT(*) FROM selected_inputs)
     ),
@@ -1153,8 +1153,9 @@ class Triggerer:
 
                             if fsc_and_sws_products_in_the_last_7_days :
                                 # Check if GFSC trigger already exist with the exact same input
-                                req = GFSC_TC_ALREADY_EXIST.format([row['id'] for row in fsc_and_sws_products_in_the_last_7_days], tc_name, last_gfsc_processing_date)
-                                res = HRWSIDatabaseApiManager.execute_request_in_database(cur, req)
+                                gfsc_tc_already_exist_data = (([row['id'] for row in fsc_and_sws_products_in_the_last_7_days], tc_name, last_gfsc_processing_date),)
+                                res = HRWSIDatabaseApiManager.execute_request_in_database(cur, self.GFSC_TC_ALREADY_EXIST,
+                                                                                          gfsc_tc_already_exist_data)
                                 gfsc_tc_already_exist = res.fetchone()['exists']
                                 self.logger.info(f"gfsc_tc_already_exist : {gfsc_tc_already_exist}")
                                 if not gfsc_tc_already_exist:
@@ -1190,7 +1191,7 @@ class Triggerer:
 
         error_message = 'The wics1s2_daily_tasks method failed: {}'
         tc_name = 'WICS1S2_TC'
-        raw2valid_data = ()
+        raw2valid_data = []
 
         try:
             today_str = datetime.datetime.now().strftime('%Y%m%d')
@@ -1232,14 +1233,13 @@ class Triggerer:
                                                                                   trigger_validation_data)
                         trigger_validation_id = cur.fetchone()['id']
 
-                        raw2valid_data += ((trigger_validation_id, wics1_id),)
-                        # Loop on wics2 id
-                        for wics2_id in wics2_ids:
-                            raw2valid_data += ((trigger_validation_id, wics2_id),)
+                        raw2valid_data.append((trigger_validation_id, wics1_id))
+                        raw2valid_data.extend((trigger_validation_id, wics2_id) for wics2_id in wics2_ids)
 
                 # If pairs exist, insert data in raw2valid table
                 if raw2valid_data:
-                    _ = HRWSIDatabaseApiManager.execute_request_in_database(cur, self.INSERT_RAW2VALID, raw2valid_data)
+                    _ = HRWSIDatabaseApiManager.execute_request_in_database(cur, self.INSERT_RAW2VALID,
+                                                                            tuple(raw2valid_data))
 
         except psycopg2.OperationalError as error:
             self.logger.error(error_message.format(error))
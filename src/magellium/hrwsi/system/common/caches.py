@@ -0,0 +1,59 @@
+import time
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """Cache LRU borné dont les entrées expirent au bout de `ttl` secondes"""
+
+    __MISSING = object()
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize doit être supérieur ou égal à 1")
+        if ttl <= 0:
+            raise ValueError("ttl doit être strictement positif")
+        self.__maxsize: int = maxsize
+        self.__ttl: float = ttl
+        self.__timer: Callable[[], float] = timer
+        self.__entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.__lock: RLock = RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self.__lock:
+            entry = self.__entries.get(key, self.__MISSING)
+            if entry is self.__MISSING:
+                return default
+            expires_at, value = entry
+            if self.__timer() >= expires_at:
+                del self.__entries[key]
+                return default
+            self.__entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self.__lock:
+            self.__entries[key] = (self.__timer() + self.__ttl, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Retourne la valeur en cache, ou la calcule et la met en cache si absente ou expirée
+        """
+        with self.__lock:
+            value = self.get(key, self.__MISSING)
+            if value is self.__MISSING:
+                value = compute()
+                self.set(key, value)
+            return value
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
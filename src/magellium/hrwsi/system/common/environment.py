@@ -0,0 +1,52 @@
+from enum import Enum
+from os import environ
+from typing import Any, Callable
+
+from magellium.hrwsi.system.common.modes import RunMode
+
+
+# (variable, configuration field, caster, validator, expected value description, required)
+EnvironmentVariablesSchema = tuple[tuple[Enum, str, Callable[[str], Any], Callable[[Any], bool]|None, str, bool], ...]
+
+
+def parse_run_mode(value: str) -> RunMode:
+    run_mode: RunMode|None = RunMode.from_string(value)
+    if (run_mode is None):
+        raise ValueError(value)
+    return run_mode
+
+
+def parse_port(value: str) -> int:
+    # Digits only: the common case needs no exception, and signs or blanks are rejected
+    if (not (value.isascii() and value.isdigit())):
+        raise ValueError(value)
+    return int(value)
+
+
+def _load_variables(environment: dict[str, str], schema: EnvironmentVariablesSchema, values: dict[str, Any]) -> None:
+    for variable, field, caster, validator, expected, required in schema:
+        raw_value: str|None = environment.get(variable.value)
+        if (raw_value is None):
+            if (required):
+                raise ValueError(f"{variable.value} environment variable is not set")
+            continue
+        try:
+            value = caster(raw_value)
+        except ValueError:
+            raise ValueError(f"{variable.value} environment variable must be {expected}")
+        if ((validator is not None) and (not validator(value))):
+            raise ValueError(f"{variable.value} environment variable must be {expected}")
+        values[field] = value
+
+
+def load_environment_variables(schema: EnvironmentVariablesSchema, archive_schema: EnvironmentVariablesSchema = ()) -> dict[str, Any]:
+    """
+    Reads and validates the variables of `schema` from a single snapshot of the environment, keyed by configuration field.
+    `archive_schema` is only read when the loaded `run_mode` is ARCHIVE, so that a stale value cannot stop another run mode from starting.
+    """
+    environment: dict[str, str] = dict(environ)
+    values: dict[str, Any] = {}
+    _load_variables(environment, schema, values)
+    if (values.get("run_mode") == RunMode.ARCHIVE):
+        _load_variables(environment, archive_schema, values)
+    return values
@@ -2,9 +2,31 @@ from dataclasses import dataclass
 from datetime import datetime as DateTime
 
 from magellium.hrwsi.system.core.products_types import ProductType
+from magellium.hrwsi.system.common.states import TileProcessState
 
 
-@dataclass
+# Columns consumed by SentinelTile.map_from_named_tuple, keep both in sync.
+# Shared by the harvester and launcher repositories.
+SENTINEL_TILE_COLUMNS: tuple[str, ...] = (
+    "id",
+    "product_type_code",
+    "start_date",
+    "publishing_date",
+    "tile",
+    "measurement_day",
+    "input_path",
+    "is_partial",
+    "relative_orbit_number",
+    "harvesting_date",
+    "state",
+)
+
+SENTINEL_TILES_TABLE = "table"
+
+SELECT_SENTINEL_TILES = f"SELECT {', '.join(SENTINEL_TILE_COLUMNS)} FROM {SENTINEL_TILES_TABLE}"
+
+
+@dataclass(slots=True)
 class SentinelTile:
     id: str
     product_type: ProductType
@@ -16,18 +38,20 @@ class SentinelTile:
     is_partial: bool
     relative_orbit_number: int
     harvesting_date: DateTime
+    state: TileProcessState | None = None
 
     @staticmethod
-    def map_from_dict_record(record: dict) -> "SentinelTile":
+    def map_from_named_tuple(record: tuple) -> "SentinelTile":
         return SentinelTile(
-            id=record.get('id'),
-            product_type=record.get('product_type_code'),
-            start_date=record.get('start_date'),
-            publishing_date=record.get('publishing_date'),
-            tile=record.get('tile'),
-            measurement_day=record.get('measurement_day'),
-            input_path=record.get('input_path'),
-            is_partial=record.get('is_partial'),
-            relative_orbit_number=record.get('relative_orbit_number'),
-            harvesting_date=record.get('harvesting_date')
-        )
\ No newline at end of file
+            id=record.id,
+            product_type=record.product_type_code,
+            start_date=record.start_date,
+            publishing_date=record.publishing_date,
+            tile=record.tile,
+            measurement_day=record.measurement_day,
+            input_path=record.input_path,
+            is_partial=record.is_partial,
+            relative_orbit_number=record.relative_orbit_number,
+            harvesting_date=record.harvesting_date,
+            state=TileProcessState(record.state) if (record.state is not None) else None
+        )
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from datetime import datetime as DateTime
 
 from magellium.hrwsi.system.common.modes import RunMode
 from magellium.hrwsi.system.harvesters.application.ports.outputs.repository import HarvesterRepository
-from magellium.hrwsi.system.core.entities import SentinelTile
+from magellium.hrwsi.system.core.sentinel_tiles import SentinelTile
+from magellium.hrwsi.system.common.caches import TTLCache
 from magellium.hrwsi.system.common.logger import LoggerFactory
 from magellium.hrwsi.system.common.states import TileProcessState
 from magellium.serviceproviders.vault import VaultServiceProvider
@@ -30,17 +32,39 @@ class HarvesterService:
     @abstractmethod
     def harvest_between_dates_by_state(self, from_date: DateTime, to_date: DateTime, state: TileProcessState) -> None:
         raise NotImplementedError()
+
+    @abstractmethod
+    def harvest_by_states(self, states: tuple[TileProcessState, ...], from_date: DateTime|None = None, to_date: DateTime|None = None) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def save_sentinel_tiles(self, sentinel_tiles: Iterable[SentinelTile]) -> int:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def listen_for_new_tiles(self) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def wait_for_new_tiles(self, timeout_in_seconds: float) -> bool:
+        raise NotImplementedError()
     
 
 class HarvesterServiceImpl(HarvesterService, ABC):
 
     LOGGER = LoggerFactory.get_logger(__name__)
 
-    def __init__(self, run_mode: RunMode, repository: HarvesterRepository, vault: VaultServiceProvider, s3: S3ServiceProvider):
+    # Longer than the 30 s safety net poll, so that consecutive safety net harvests without any change hit the cache
+    HARVESTED_COUNTS_CACHE_TTL_IN_SECONDS: float = 120
+
+    def __init__(self, run_mode: RunMode, repository: HarvesterRepository, vault: VaultServiceProvider, s3: S3ServiceProvider, cache_ttl_in_seconds: float = HARVESTED_COUNTS_CACHE_TTL_IN_SECONDS):
         self.__run_mode: RunMode = run_mode
         self.__repository: HarvesterRepository = repository
         self.__vault: VaultServiceProvider = vault
         self.__s3: S3ServiceProvider = s3
+        # Only the per state counts are cached: the tiles themselves keep streaming from the repository
+        self.__harvested_counts_cache: TTLCache = TTLCache(maxsize=64, ttl=cache_ttl_in_seconds)
+        self.__harvested_counts_generation: int = 0
 
 
     @property
@@ -53,20 +77,60 @@ class HarvesterServiceImpl(HarvesterService, ABC):
 
     def harvest_by_state(self, state: TileProcessState) -> None:
         self.LOGGER.info(f"Harvesting all tiles with state: {state.name}...")
-        sentinel_tiles: list[SentinelTile] = self.__repository.find_all_sentinel_tiles_by_state(state)
-        self.LOGGER.info(f"Harvested {len(sentinel_tiles)} tiles with state {state.name}")
+        harvested_count: int = sum(1 for _ in self.__repository.find_all_sentinel_tiles_by_state(state))
+        self.LOGGER.info(f"Harvested {harvested_count} tiles with state {state.name}")
 
     def harvest_before_date_by_state(self, to_date: DateTime, state: TileProcessState) -> None:
         self.LOGGER.info(f"Harvesting tiles before {to_date.isoformat()} with state {state.name}...")
-        sentinel_tiles: list[SentinelTile] = self.__repository.find_all_sentinel_tiles_before_date_by_state(to_date, state)
-        self.LOGGER.info(f"Harvested {len(sentinel_tiles)} tiles before {to_date.isoformat()} with state {state.name}")
+        harvested_count: int = sum(1 for _ in self.__repository.find_all_sentinel_tiles_before_date_by_state(to_date, state))
+        self.LOGGER.info(f"Harvested {harvested_count} tiles before {to_date.isoformat()} with state {state.name}")
 
     def harvest_after_date_by_state(self, from_date: DateTime, state: TileProcessState) -> None:
         self.LOGGER.info(f"Harvesting tiles after {from_date.isoformat()} with state {state.name}...")
-        sentinel_tiles: list[SentinelTile] = self.__repository.find_all_sentinel_tiles_after_date_by_state(from_date, state)
-        self.LOGGER.info(f"Harvested {len(sentinel_tiles)} tiles after {from_date.isoformat()} with state {state.name}")
+        harvested_count: int = sum(1 for _ in self.__repository.find_all_sentinel_tiles_after_date_by_state(from_date, state))
+        self.LOGGER.info(f"Harvested {harvested_count} tiles after {from_date.isoformat()} with state {state.name}")
 
     def harvest_between_dates_by_state(self, from_date: DateTime, to_date: DateTime, state: TileProcessState) -> None:
         self.LOGGER.info(f"Harvesting tiles between {from_date.isoformat()} and {to_date.isoformat()} with state {state.name}...")
-        sentinel_tiles: list[SentinelTile] = self.__repository.find_all_sentinel_tiles_between_dates_by_state(from_date, to_date, state)
-        self.LOGGER.info(f"Harvested {len(sentinel_tiles)} tiles between {from_date.isoformat()} and {to_date.isoformat()} with state {state.name}")
\ No newline at end of file
+        harvested_count: int = sum(1 for _ in self.__repository.find_all_sentinel_tiles_between_dates_by_state(from_date, to_date, state))
+        self.LOGGER.info(f"Harvested {harvested_count} tiles between {from_date.isoformat()} and {to_date.isoformat()} with state {state.name}")
+
+    def harvest_by_states(self, states: tuple[TileProcessState, ...], from_date: DateTime|None = None, to_date: DateTime|None = None) -> None:
+        self.LOGGER.info(f"Harvesting tiles with states {[state.name for state in states]} [from={from_date}, to={to_date}]...")
+        cache_key = (
+            states,
+            from_date.timestamp() if (from_date is not None) else None,
+            to_date.timestamp() if (to_date is not None) else None
+        )
+        harvested_counts: dict[TileProcessState, int]|None = self.__harvested_counts_cache.get(cache_key)
+        if (harvested_counts is None):
+            # Counted outside of the cache lock; a result computed across an invalidation is not stored
+            generation: int = self.__harvested_counts_generation
+            harvested_counts = {state: 0 for state in states}
+            for sentinel_tile in self.__repository.find_all_sentinel_tiles_by_states(states, from_date, to_date):
+                if (sentinel_tile.state in harvested_counts):
+                    harvested_counts[sentinel_tile.state] += 1
+            if (generation == self.__harvested_counts_generation):
+                self.__harvested_counts_cache.set(cache_key, harvested_counts)
+        else:
+            self.LOGGER.debug("No change since the last harvest, reusing its counts")
+        for state, harvested_count in harvested_counts.items():
+            self.LOGGER.info(f"Harvested {harvested_count} tiles with state {state.name}")
+
+    def save_sentinel_tiles(self, sentinel_tiles: Iterable[SentinelTile]) -> int:
+        saved_count: int = self.__repository.save_all_sentinel_tiles(sentinel_tiles)
+        self.__invalidate_harvested_counts()
+        return saved_count
+
+    def __invalidate_harvested_counts(self) -> None:
+        self.__harvested_counts_generation += 1
+        self.__harvested_counts_cache.clear()
+
+    def listen_for_new_tiles(self) -> None:
+        self.__repository.listen_for_sentinel_tiles_changes()
+
+    def wait_for_new_tiles(self, timeout_in_seconds: float) -> bool:
+        has_changes: bool = self.__repository.wait_for_sentinel_tiles_changes(timeout_in_seconds)
+        if (has_changes):
+            self.__invalidate_harvested_counts()
+        return has_changes
@@ -7,17 +7,18 @@ from magellium.hrwsi.system.common.logger import LoggerFactory
 
 
 class UseCase(ABC):
-    def __init__(self):
-        raise NotImplementedError()
+    # Slots all the way down: use cases carry no per-instance __dict__
+    __slots__ = ()
 
     @abstractmethod
     def execute(self) -> None:
         raise NotImplementedError()
-    
+
 
 class AbstractUseCase(UseCase, ABC):
 
     LOGGER = LoggerFactory.get_logger(__name__)
+    __slots__ = ("__service",)
 
     def __init__(self, service: HarvesterService):
         self.__service = service
@@ -27,83 +28,57 @@ class AbstractUseCase(UseCase, ABC):
         return self.__service
 
 
-class HarvestAllTilesWithIdleStateUseCase(AbstractUseCase):
-    def __init__(self, service: HarvesterService):
-        super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.IDLE
-
-    def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in idle state...")
-        self.__service.harvest_after_date
+class HarvestAllTilesByStatesUseCase(AbstractUseCase):
+    __slots__ = ("__tile_processing_states",)
 
-class HarvestAllTilesWithErrorStateUseCase(AbstractUseCase):
-    def __init__(self, service: HarvesterService):
+    def __init__(self, service: HarvesterService, states: tuple[TileProcessState, ...]):
         super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.ERROR
+        self.__tile_processing_states: tuple[TileProcessState, ...] = states
 
     def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in error state...")
+        self.LOGGER.info(f"Harvesting tiles in states {[state.name for state in self.__tile_processing_states]}...")
+        self._service.harvest_by_states(self.__tile_processing_states)
 
 
-class HarvestTilesWithIdleStateBeforeDateUseCase(AbstractUseCase):
-    def __init__(self, service: HarvesterService, to_date: DateTime):
-        super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.IDLE
-        self.__to_date = to_date
+class HarvestTilesByStatesBeforeDateUseCase(AbstractUseCase):
+    __slots__ = ("__tile_processing_states", "__to_date")
 
-
-    def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in idle state...")
-
-class HarvestTilesWithErrorStateBeforeDateUseCase(AbstractUseCase):
-    def __init__(self, service: HarvesterService, to_date: DateTime):
+    def __init__(self, service: HarvesterService, states: tuple[TileProcessState, ...], to_date: DateTime):
         super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.ERROR
+        self.__tile_processing_states: tuple[TileProcessState, ...] = states
         self.__to_date = to_date
 
 
     def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in error state...")
+        self.LOGGER.info(f"Harvesting tiles in states {[state.name for state in self.__tile_processing_states]}...")
+        self._service.harvest_by_states(self.__tile_processing_states, to_date=self.__to_date)
 
-class HarvestTilesWithIdleStateAfterDateUseCase(AbstractUseCase):
-    def __init__(self, service: HarvesterService, from_date: DateTime):
-        super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.IDLE
-        self.__from_date = from_date
 
+class HarvestTilesByStatesAfterDateUseCase(AbstractUseCase):
+    __slots__ = ("__tile_processing_states", "__from_date")
 
-    def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in idle state...")
-
-class HarvestTilesWithErrorStateAfterDateUseCase(AbstractUseCase):
-    def __init__(self, service: HarvesterService, from_date: DateTime):
+    def __init__(self, service: HarvesterService, states: tuple[TileProcessState, ...], from_date: DateTime):
         super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.ERROR
+        self.__tile_processing_states: tuple[TileProcessState, ...] = states
         self.__from_date = from_date
 
 
     def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in error state...")
+        self.LOGGER.info(f"Harvesting tiles in states {[state.name for state in self.__tile_processing_states]}...")
+        self._service.harvest_by_states(self.__tile_processing_states, from_date=self.__from_date)
 
-class HarvestTilesWithIdleStateBetweenDatesUseCase(AbstractUseCase):
-    def __init__(self, service: HarvesterService, from_date: DateTime, to_date: DateTime):
-        super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.IDLE
-        self.__from_date = from_date
-        self.__to_date = to_date
 
+class HarvestTilesByStatesBetweenDatesUseCase(AbstractUseCase):
+    __slots__ = ("__tile_processing_states", "__from_date", "__to_date")
 
-    def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in idle state...")
-
-class HarvestTilesWithErrorStateBetweenDatesUseCase(AbstractUseCase):
-    def __init__(self, service: HarvesterService, from_date: DateTime, to_date: DateTime):
+    def __init__(self, service: HarvesterService, states: tuple[TileProcessState, ...], from_date: DateTime, to_date: DateTime):
         super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.ERROR
+        self.__tile_processing_states: tuple[TileProcessState, ...] = states
         self.__from_date = from_date
         self.__to_date = to_date
 
 
     def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in error state...")
+        self.LOGGER.info(f"Harvesting tiles in states {[state.name for state in self.__tile_processing_states]}...")
+        self._service.harvest_by_states(self.__tile_processing_states, from_date=self.__from_date, to_date=self.__to_date)
 
@@ -1,20 +1,33 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from datetime import datetime as DateTime
 
-from magellium.hrwsi.system.core.entities import SentinelTile
+from magellium.hrwsi.system.core.sentinel_tiles import SentinelTile
 from magellium.hrwsi.system.common.states import TileProcessState
 
 
 class HarvesterRepository(ABC):
 
-    def find_all_sentinel_tiles_by_state(self, state: TileProcessState) -> list[SentinelTile]:
+    def find_all_sentinel_tiles_by_state(self, state: TileProcessState) -> Iterator[SentinelTile]:
         raise NotImplementedError()
     
-    def find_all_sentinel_tiles_before_date_by_state(self, to_date: DateTime, state: TileProcessState) -> list[SentinelTile]:
+    def find_all_sentinel_tiles_before_date_by_state(self, to_date: DateTime, state: TileProcessState) -> Iterator[SentinelTile]:
         raise NotImplementedError()
     
-    def find_all_sentinel_tiles_between_dates_by_state(self, from_date: DateTime, to_date: DateTime, state: TileProcessState) -> list[SentinelTile]:
+    def find_all_sentinel_tiles_between_dates_by_state(self, from_date: DateTime, to_date: DateTime, state: TileProcessState) -> Iterator[SentinelTile]:
         raise NotImplementedError()
     
-    def find_all_sentinel_tiles_after_date_by_state(self, from_date: DateTime, state: TileProcessState) -> list[SentinelTile]:
-        raise NotImplementedError()
\ No newline at end of file
+    def find_all_sentinel_tiles_after_date_by_state(self, from_date: DateTime, state: TileProcessState) -> Iterator[SentinelTile]:
+        raise NotImplementedError()
+
+    def find_all_sentinel_tiles_by_states(self, states: tuple[TileProcessState, ...], from_date: DateTime|None = None, to_date: DateTime|None = None) -> Iterator[SentinelTile]:
+        raise NotImplementedError()
+
+    def listen_for_sentinel_tiles_changes(self) -> None:
+        raise NotImplementedError()
+
+    def wait_for_sentinel_tiles_changes(self, timeout_in_seconds: float) -> bool:
+        raise NotImplementedError()
+
+    def save_all_sentinel_tiles(self, sentinel_tiles: Iterable[SentinelTile]) -> int:
+        raise NotImplementedError()
@@ -1,24 +1,30 @@
 from datetime import datetime as DateTime
+from threading import Event, Thread
+from time import monotonic
+from typing import Callable
 
 from magellium.hrwsi.system.harvesters.application.business.services.harvester import HarvesterService
 from magellium.hrwsi.system.harvesters.application.business.use_cases import (
     UseCase, 
-    HarvestAllTilesWithErrorStateUseCase, 
-    HarvestAllTilesWithIdleStateUseCase,
-    HarvestTilesWithErrorStateAfterDateUseCase,
-    HarvestTilesWithErrorStateBeforeDateUseCase,
-    HarvestTilesWithErrorStateBetweenDatesUseCase,
-    HarvestTilesWithIdleStateAfterDateUseCase,
-    HarvestTilesWithIdleStateBeforeDateUseCase,
-    HarvestTilesWithIdleStateBetweenDatesUseCase
+    HarvestAllTilesByStatesUseCase,
+    HarvestTilesByStatesAfterDateUseCase,
+    HarvestTilesByStatesBeforeDateUseCase,
+    HarvestTilesByStatesBetweenDatesUseCase
 )
-from magellium.scheduler import Scheduler
+from magellium.hrwsi.system.common.logger import LoggerFactory
+from magellium.hrwsi.system.common.states import TileProcessState
 from magellium.serviceproviders.vault import VaultServiceProvider
 from magellium.serviceproviders.s3 import S3ServiceProvider
 
 class HarvesterProcessManager:
+
+    LOGGER = LoggerFactory.get_logger(__name__)
+    WAIT_SLICE_IN_SECONDS: float = 1.0
+
     def __init__(self, service: HarvesterService, harvest_from_date: DateTime|None, harvest_to_date: DateTime|None, vault: VaultServiceProvider, s3: S3ServiceProvider):
-        self.__scheduler: Scheduler = Scheduler()
+        self.__service: HarvesterService = service
+        self.__stop_event: Event = Event()
+        self.__harvesting_thread: Thread = Thread(target=self.__listen_and_harvest, daemon=True)
 
         self.vault: VaultServiceProvider = vault
         self.s3: S3ServiceProvider = s3
@@ -26,36 +32,64 @@ class HarvesterProcessManager:
         self.__harvest_from_date: DateTime|None = harvest_from_date
         self.__harvest_to_date: DateTime|None = harvest_to_date
 
-        self.__harvest_all_tiles_with_idle_state_use_case: UseCase = HarvestAllTilesWithIdleStateUseCase(service)
-        self.__harvest_all_tiles_with_error_state_use_case: UseCase = HarvestAllTilesWithErrorStateUseCase(service)
-        self.__harvest_tiles_with_idle_state_after_date_use_case: UseCase = HarvestTilesWithIdleStateAfterDateUseCase(service, harvest_from_date)
-        self.__harvest_tiles_with_error_state_after_date_use_case: UseCase = HarvestTilesWithErrorStateAfterDateUseCase(service, harvest_from_date)
-        self.__harvest_tiles_with_idle_state_before_date_use_case: UseCase = HarvestTilesWithIdleStateBeforeDateUseCase(service, harvest_to_date)
-        self.__harvest_tiles_with_error_state_before_date_use_case: UseCase = HarvestTilesWithErrorStateBeforeDateUseCase(service, harvest_to_date)
-        self.__harvest_tiles_with_idle_state_between_dates_use_case: UseCase = HarvestTilesWithIdleStateBetweenDatesUseCase(service, harvest_from_date, harvest_to_date)
-        self.__harvest_tiles_with_error_state_between_dates_use_case: UseCase = HarvestTilesWithErrorStateBetweenDatesUseCase(service, harvest_from_date, harvest_to_date)
-
-        self.harvesting_execution_interval_in_seconds: int = 5
-
-    def __harvest_data(self) -> None:
-        if ((self.__harvest_from_date is not None) and (self.__harvest_to_date is not None)):
-            self.__harvest_tiles_with_idle_state_between_dates_use_case.execute()
-            self.__harvest_tiles_with_error_state_between_dates_use_case.execute()
-        elif (self.__harvest_from_date is not None):
-            self.__harvest_tiles_with_idle_state_after_date_use_case.execute()
-            self.__harvest_tiles_with_error_state_after_date_use_case.execute()
-        elif (self.__harvest_to_date is not None):
-            self.__harvest_tiles_with_idle_state_before_date_use_case.execute()
-            self.__harvest_tiles_with_error_state_before_date_use_case.execute()
-        else:
-            self.__harvest_all_tiles_with_idle_state_use_case.execute()
-            self.__harvest_all_tiles_with_error_state_use_case.execute()
+        harvested_states: tuple[TileProcessState, ...] = (TileProcessState.IDLE, TileProcessState.ERROR)
+        # Keyed by (has from date, has to date); the dates never change, so the use case is resolved once.
+        use_case_factories: dict[tuple[bool, bool], Callable[[], UseCase]] = {
+            (True, True): lambda: HarvestTilesByStatesBetweenDatesUseCase(service, harvested_states, harvest_from_date, harvest_to_date),
+            (True, False): lambda: HarvestTilesByStatesAfterDateUseCase(service, harvested_states, harvest_from_date),
+            (False, True): lambda: HarvestTilesByStatesBeforeDateUseCase(service, harvested_states, harvest_to_date),
+            (False, False): lambda: HarvestAllTilesByStatesUseCase(service, harvested_states),
+        }
+        self.__harvest_use_case: UseCase = use_case_factories[(harvest_from_date is not None, harvest_to_date is not None)]()
+
+        # Harvests are driven by database notifications; this is only the fallback poll when none arrive.
+        self.harvesting_safety_net_interval_in_seconds: int = 30
+
+    def __harvest_data(self) -> bool:
+        try:
+            self.__harvest_use_case.execute()
+            return True
+        except Exception as exception:
+            self.LOGGER.error(f"Harvesting failed, retrying in {self.harvesting_safety_net_interval_in_seconds}s: {exception}", exc_info=True)
+            return False
+
+    def __wait_for_new_tiles(self) -> bool:
+        # Waits in short slices so that stop_harvesting() is not held back by a whole safety net interval.
+        deadline: float = monotonic() + self.harvesting_safety_net_interval_in_seconds
+        while (not self.__stop_event.is_set()):
+            remaining_in_seconds: float = deadline - monotonic()
+            if (remaining_in_seconds <= 0):
+                return False
+            if (self.__service.wait_for_new_tiles(min(self.WAIT_SLICE_IN_SECONDS, remaining_in_seconds))):
+                return True
+        return False
 
+    def __listen_and_harvest(self) -> None:
+        # LISTEN is registered before the first harvest so that tiles inserted meanwhile still wake the loop up.
+        try:
+            self.__service.listen_for_new_tiles()
+        except Exception as exception:
+            self.LOGGER.error(f"Listening for new tiles failed, it will be retried on the next wait: {exception}")
+        while (not self.__stop_event.is_set()):
+            if (not self.__harvest_data()):
+                if (self.__stop_event.wait(self.harvesting_safety_net_interval_in_seconds)):
+                    break
+                continue
+            try:
+                notified: bool = self.__wait_for_new_tiles()
+            except Exception as exception:
+                self.LOGGER.error(f"Waiting for new tiles failed, falling back to polling: {exception}")
+                if (self.__stop_event.wait(self.harvesting_safety_net_interval_in_seconds)):
+                    break
+                notified = False
+            if (self.__stop_event.is_set()):
+                break
+            if (not notified):
+                self.LOGGER.debug("No notification received, running safety net harvest")
 
     def start_harvesting(self) -> None:
-        harvesting_task: callable = self.__harvest_data
-        self.__scheduler.add_job(harvesting_task, self.harvesting_execution_interval_in_seconds)
-        self.__scheduler.start()
+        self.__harvesting_thread.start()
     
     def stop_harvesting(self) -> None:
-        self.__scheduler.stop()
\ No newline at end of file
+        self.__stop_event.set()
+        self.__harvesting_thread.join()
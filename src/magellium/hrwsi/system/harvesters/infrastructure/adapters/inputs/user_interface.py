@@ -1,6 +1,6 @@
+from dataclasses import dataclass
 from datetime import datetime as DateTime
 from enum import Enum
-from os import environ
 from pathlib import Path
 
 
@@ -8,6 +8,7 @@ from magellium.hrwsi.system.harvesters.application.ports.inputs.user_interface i
 from magellium.hrwsi.system.harvesters.infrastructure.adapters.outputs.repository import HarvesterRepository, PostgreSqlHarvesterRepository
 from magellium.hrwsi.system.harvesters.application.business.services.harvester import HarvesterService, HarvesterServiceImpl
 from magellium.hrwsi.system.common.modes import RunMode
+from magellium.hrwsi.system.common.environment import EnvironmentVariablesSchema, load_environment_variables, parse_port, parse_run_mode
 from magellium.hrwsi.system.harvesters.application.process_manager import HarvesterProcessManager
 from magellium.serviceproviders.vault import HashcorpVaultClient, VaultServiceProvider
 from magellium.serviceproviders.s3 import S3Client, S3ServiceProvider
@@ -35,6 +36,45 @@ class EnvironmentVariablesNames(Enum):
 
 
 
+@dataclass(slots=True)
+class Configuration:
+    run_mode: RunMode
+    database_host: str
+    database_port: int
+    database_username: str
+    database_password: str
+    database_name: str
+    vault_url: str
+    vault_token: str
+    s3_configuration_file_path: Path
+    archive_start_date: DateTime|None = None
+    archive_end_date: DateTime|None = None
+
+
+ENVIRONMENT_VARIABLES_SCHEMA: EnvironmentVariablesSchema = (
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_RUN_MODE, "run_mode", parse_run_mode, None, f"one of {[mode.value for mode in RunMode]}", True),
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_HOST, "database_host", str, None, "a string", True),
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_PORT, "database_port", parse_port, lambda port: 1 <= port <= 65534, "an integer between 1 and 65534", True),
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_USER, "database_username", str, None, "a string", True),
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_PASSWORD, "database_password", str, None, "a string", True),
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_NAME, "database_name", str, None, "a string", True),
+    (EnvironmentVariablesNames.VAULT_URL, "vault_url", str, None, "a string", True),
+    (EnvironmentVariablesNames.VAULT_TOKEN, "vault_token", str, None, "a string", True),
+    (EnvironmentVariablesNames.S3_CONFIGURATION_FILE_PATH, "s3_configuration_file_path", Path, None, "a file path", True),
+)
+
+# Only read in ARCHIVE mode, so that a stale value left in the environment cannot stop another run mode from starting
+ARCHIVE_ENVIRONMENT_VARIABLES_SCHEMA: EnvironmentVariablesSchema = (
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_ARCHIVE_START_DATE, "archive_start_date", DateTime.fromisoformat, None, "a date in the format YYYY-MM-DD", False),
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_ARCHIVE_END_DATE, "archive_end_date", DateTime.fromisoformat, None, "a date in the format YYYY-MM-DD", False),
+)
+
+
+def load_configuration_from_environment() -> Configuration:
+    return Configuration(**load_environment_variables(ENVIRONMENT_VARIABLES_SCHEMA, ARCHIVE_ENVIRONMENT_VARIABLES_SCHEMA))
+
+
+
 
 class CommandLineUserInterface(UserInterface):
 
@@ -47,75 +87,27 @@ class CommandLineUserInterface(UserInterface):
         if (self.__manager is None):
             self.LOGGER.info("Starting Command Line User Interface...")
 
-            run_mode_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_RUN_MODE.value)
-            if (run_mode_value is None):
-                raise ValueError("HRWSI_HARVESTER_RUN_MODE environment variable is not set")
-            run_mode: RunMode = RunMode.from_string(run_mode_value)
-
-            database_host_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_HOST.value)
-            if (database_host_value is None):
-                raise ValueError("HRWSI_HARVESTER_DATABASE_HOST environment variable is not set")
-            
-            database_port_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_PORT.value)
-            if (database_port_value is None):
-                raise ValueError("HRWSI_HARVESTER_DATABASE_PORT environment variable is not set")
-            try:
-                database_port_value = int(database_port_value)
-            except ValueError:
-                raise ValueError("HRWSI_HARVESTER_DATABASE_PORT environment variable must be an integer")
-            if ((database_port_value < 1) or (database_port_value > 65534)):
-                raise ValueError("HRWSI_HARVESTER_DATABASE_PORT environment variable must be between 1 and 65534")
-
-            database_username_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_USER.value)
-            if (database_username_value is None):
-                raise ValueError("HRWSI_HARVESTER_DATABASE_USER environment variable is not set")
-            
-            database_password_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_PASSWORD.value)
-            if (database_password_value is None):
-                raise ValueError("HRWSI_HARVESTER_DATABASE_PASSWORD environment variable is not set")
-            
-            database_name_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_NAME.value)
-            if (database_name_value is None):
-                raise ValueError("HRWSI_HARVESTER_DATABASE_NAME environment variable is not set")
-
-
-
-            vault_url_value: str | None = environ.get(EnvironmentVariablesNames.VAULT_URL.value)
-            if (vault_url_value is None):
-                raise ValueError("VAULT_URL environment variable is not set")
-            
-            vault_token_value: str | None = environ.get(EnvironmentVariablesNames.VAULT_TOKEN.value)
-            if (vault_token_value is None):
-                raise ValueError("VAULT_TOKEN environment variable is not set")
-            
-
-            s3_configuration_file_path_value: str | None = environ.get(EnvironmentVariablesNames.S3_CONFIGURATION_FILE_PATH.value)
-            if (s3_configuration_file_path_value is None):
-                raise ValueError("S3_CONFIGURATION_FILE_PATH environment variable is not set")
-
-            archive_start_date_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_ARCHIVE_START_DATE.value)
-            archive_end_date_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_ARCHIVE_END_DATE.value)
-
+            configuration: Configuration = load_configuration_from_environment()
 
             vault: VaultServiceProvider = HashcorpVaultClient(
-                url=vault_url_value,
-                token=vault_token_value
+                url=configuration.vault_url,
+                token=configuration.vault_token
             )
 
             s3: S3ServiceProvider = S3Client(
-                configuration_file=Path(s3_configuration_file_path_value)
+                configuration_file=configuration.s3_configuration_file_path
             )
 
             repository: HarvesterRepository = PostgreSqlHarvesterRepository(
-                host=database_host_value,
-                port=int(database_port_value),
-                username=database_username_value,
-                password=database_password_value,
-                database_name=database_name_value
+                host=configuration.database_host,
+                port=configuration.database_port,
+                username=configuration.database_username,
+                password=configuration.database_password,
+                database_name=configuration.database_name
             )
 
             service: HarvesterService = HarvesterServiceImpl(
-                run_mode=run_mode,
+                run_mode=configuration.run_mode,
                 repository=repository,
                 vault=vault,
                 s3=s3
@@ -124,19 +116,9 @@ class CommandLineUserInterface(UserInterface):
             archive_start_date: DateTime|None = None
             archive_end_date: DateTime|None = None
 
-            if (run_mode == RunMode.ARCHIVE):
-                if (archive_start_date_value is not None):
-                    try:
-                        archive_start_date = DateTime.fromisoformat(archive_start_date_value)
-                    except ValueError:
-                        raise ValueError("HRWSI_HARVESTER_ARCHIVE_START_DATE environment variable must be a date in the format YYYY-MM-DD")
-
-                if (archive_end_date_value is not None):
-                    try:
-                        archive_end_date = DateTime.fromisoformat(archive_end_date_value)
-                    except ValueError:
-                        raise ValueError("HRWSI_HARVESTER_ARCHIVE_END_DATE environment variable must be a date in the format YYYY-MM-DD")
-
+            if (configuration.run_mode == RunMode.ARCHIVE):
+                archive_start_date = configuration.archive_start_date
+                archive_end_date = configuration.archive_end_date
                 if (archive_start_date and archive_end_date and (archive_start_date > archive_end_date)):
                     raise ValueError("ARCHIVE start date must be earlier than end date")
 
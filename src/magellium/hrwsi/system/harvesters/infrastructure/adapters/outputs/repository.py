@@ -1,76 +1,179 @@
+import select
+
 import psycopg2
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from psycopg2.extras import NamedTupleCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
+from collections.abc import Iterable, Iterator
 from datetime import datetime as DateTime
+from functools import cache
 
 from magellium.hrwsi.system.harvesters.application.ports.outputs.repository import HarvesterRepository
-from magellium.hrwsi.system.core.sentinel_tiles import SentinelTile
+from magellium.hrwsi.system.core.products_types import ProductType
+from magellium.hrwsi.system.core.sentinel_tiles import SELECT_SENTINEL_TILES, SentinelTile
 from magellium.hrwsi.system.common.logger import LoggerFactory
 from magellium.hrwsi.system.common.states import TileProcessState
 
 
+_LOG = LoggerFactory.get_logger(__name__)
+
+
+# Parameterized read queries, run through a named cursor so that the rows stay server-side until fetched.
+# A cursor cannot be DECLAREd over EXECUTE, hence the plain SQL text rather than prepared statements.
+FIND_QUERIES: dict[str, str] = {
+    "find_by_state": f"{SELECT_SENTINEL_TILES} WHERE state = %s",
+    "find_before_date_by_state": f"{SELECT_SENTINEL_TILES} WHERE acquisition_date <= %s AND state = %s",
+    "find_after_date_by_state": f"{SELECT_SENTINEL_TILES} WHERE acquisition_date >= %s AND state = %s",
+    "find_between_dates_by_state": f"{SELECT_SENTINEL_TILES} WHERE acquisition_date >= %s AND acquisition_date <= %s AND state = %s",
+    "find_by_states": f"{SELECT_SENTINEL_TILES} WHERE state = ANY(%s)",
+    "find_before_date_by_states": f"{SELECT_SENTINEL_TILES} WHERE state = ANY(%s) AND acquisition_date <= %s",
+    "find_after_date_by_states": f"{SELECT_SENTINEL_TILES} WHERE state = ANY(%s) AND acquisition_date >= %s",
+    "find_between_dates_by_states": f"{SELECT_SENTINEL_TILES} WHERE state = ANY(%s) AND acquisition_date >= %s AND acquisition_date <= %s",
+}
+
+
+INSERT_SENTINEL_TILES = (
+    "INSERT INTO hrwsi.raw_inputs (id, product_type_code, start_date, publishing_date, tile, measurement_day, relative_orbit_number, input_path, is_partial, harvesting_date) "
+    "VALUES %s ON CONFLICT (id) DO NOTHING"
+)
+
+# Channel notified by the database whenever a new raw input is inserted.
+NOTIFICATION_CHANNEL = "product_insertion"
+
+
+@cache
+def _state_values(states: tuple[TileProcessState, ...]) -> list[str]:
+    # The harvested states are fixed per process, so the enum values are resolved once per tuple.
+    return [state.value for state in states]
+
+
 class PostgreSqlHarvesterRepository(HarvesterRepository):
 
-    LOGGER = LoggerFactory.get_logger(__name__)
-    __pool: SimpleConnectionPool | None = None
+    LOGGER = _LOG
+    FETCH_SIZE: int = 2000
 
     def __init__(self, host: str, port: int, username: str, password: str, database_name: str, minconn: int = 5, maxconn: int = 25):
-        if PostgreSqlHarvesterRepository.__pool is None:
-            dsn = f"host={host} port={port} user={username} password={password} dbname={database_name}"
-            PostgreSqlHarvesterRepository.__pool = SimpleConnectionPool(minconn, maxconn, dsn)
-            self.LOGGER.info(f"SQL connection pool initialized [min={minconn}, max={maxconn}]")
+        dsn = f"host={host} port={port} user={username} password={password} dbname={database_name}"
+        self.__pool: ThreadedConnectionPool | None = ThreadedConnectionPool(minconn, maxconn, dsn)
+        self.__dsn: str = dsn
+        self.__listen_connection: psycopg2.extensions.connection | None = None
+        _LOG.info("SQL connection pool initialized [min=%s, max=%s]", minconn, maxconn)
+
+    def __get_listen_connection(self) -> psycopg2.extensions.connection:
+        # Dedicated autocommit connection, kept out of the pool so that LISTEN stays registered.
+        if ((self.__listen_connection is None) or self.__listen_connection.closed):
+            self.__listen_connection = psycopg2.connect(self.__dsn)
+            self.__listen_connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with self.__listen_connection.cursor() as sql_cursor:
+                sql_cursor.execute(f"LISTEN {NOTIFICATION_CHANNEL}")
+            _LOG.info("Listening for notifications on channel %s", NOTIFICATION_CHANNEL)
+        return self.__listen_connection
+
+    def listen_for_sentinel_tiles_changes(self) -> None:
+        self.__get_listen_connection()
+
+    def wait_for_sentinel_tiles_changes(self, timeout_in_seconds: float) -> bool:
+        listen_connection: psycopg2.extensions.connection = self.__get_listen_connection()
+        try:
+            if (select.select([listen_connection], [], [], timeout_in_seconds) == ([], [], [])):
+                return False
+            listen_connection.poll()
+        except psycopg2.Error as exception:
+            _LOG.error("Lost notification connection on channel %s: %s", NOTIFICATION_CHANNEL, exception, exc_info=True)
+            listen_connection.close()
+            raise
+        notifications_count: int = len(listen_connection.notifies)
+        listen_connection.notifies.clear()
+        _LOG.debug("Received %s notifications on channel %s", notifications_count, NOTIFICATION_CHANNEL)
+        return notifications_count > 0
 
     def __get_connection(self):
-        if PostgreSqlHarvesterRepository.__pool is None:
+        if self.__pool is None:
             raise RuntimeError("SQL connection pool is not initialized")
-        sql_connection: psycopg2.extensions.connection = PostgreSqlHarvesterRepository.__pool.getconn()
-        self.LOGGER.debug("SQL connection acquired from pool")
+        sql_connection: psycopg2.extensions.connection = self.__pool.getconn()
+        _LOG.debug("SQL connection acquired from pool")
         return sql_connection
 
-    def __release_connection(self, sql_connection: psycopg2.extensions.connection):
-        PostgreSqlHarvesterRepository.__pool.putconn(sql_connection)
-        self.LOGGER.debug("SQL connection released back to pool")
+    def __release_connection(self, sql_connection: psycopg2.extensions.connection, broken: bool = False):
+        self.__pool.putconn(sql_connection, close=broken)
+        if (broken):
+            _LOG.warning("SQL connection discarded from pool after an error")
+        else:
+            _LOG.debug("SQL connection released back to pool")
 
-    def __execute_read_query(self, query: str, parameters: tuple) -> list[tuple]:
+    def __execute_read_query(self, query: str, parameters: tuple) -> Iterator[tuple]:
         sql_connection: psycopg2.extensions.connection = self.__get_connection()
+        broken: bool = False
         try:
-            with sql_connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as sql_cursor:
-                self.LOGGER.debug(f"Executing SQL query: {query} with parameters {parameters}")
+            # Named cursor: rows stay server-side and are pulled FETCH_SIZE at a time
+            with sql_connection.cursor(name="harvester_tiles_cursor", cursor_factory=NamedTupleCursor) as sql_cursor:
+                sql_cursor.itersize = self.FETCH_SIZE
+                _LOG.debug("Executing SQL query: %s with parameters %s", query, parameters)
                 sql_cursor.execute(query, parameters)
-                records = sql_cursor.fetchall()
-                self.LOGGER.debug(f"Query returned {len(records)} rows")
-                return records
+                rows_count: int = 0
+                for record in sql_cursor:
+                    rows_count += 1
+                    yield record
+                _LOG.info("Query returned %s rows", rows_count)
+            sql_connection.commit()
         except psycopg2.Error as exception:
-            self.LOGGER.error(f"SQL error in query [{query}] with params {parameters}: {exception}", exc_info=True)
+            broken = True
+            _LOG.error("SQL error in query [%s] with params %s: %s", query, parameters, exception, exc_info=True)
+            raise
         finally:
-            self.__release_connection(sql_connection)
+            self.__release_connection(sql_connection, broken=broken)
 
-    def __find(self, query: str, parameters: tuple) -> list[SentinelTile]:
-        records = self.__execute_read_query(query, parameters)
-        tiles = self.__map_records_to_sentinel_tiles(records)
-        self.LOGGER.info(f"Mapped {len(tiles)} records to SentinelTile objects")
-        return tiles
+    def __find(self, query_name: str, parameters: tuple) -> Iterator[SentinelTile]:
+        return map(SentinelTile.map_from_named_tuple, self.__execute_read_query(FIND_QUERIES[query_name], parameters))
 
     
-    def find_all_sentinel_tiles_by_state(self, state: TileProcessState) -> list[SentinelTile]:
-        query = "SELECT * FROM table WHERE state = %s"
-        self.LOGGER.info(f"Finding all SentinelTiles with state: {state.name}")
-        return self.__find(query, (state.value,))
-
-    def find_all_sentinel_tiles_before_date_by_state(self, to_date: DateTime, state: TileProcessState) -> list[SentinelTile]:
-        query = "SELECT * FROM table WHERE acquisition_date <= %s AND state = %s"
-        self.LOGGER.info(f"Finding SentinelTiles before {to_date.isoformat()} with state: {state.name}")
-        return self.__find(query, (to_date, state.value))
+    def find_all_sentinel_tiles_by_state(self, state: TileProcessState) -> Iterator[SentinelTile]:
+        _LOG.info("Finding all SentinelTiles with state: %s", state.name)
+        return self.__find("find_by_state", (state.value,))
+
+    def find_all_sentinel_tiles_before_date_by_state(self, to_date: DateTime, state: TileProcessState) -> Iterator[SentinelTile]:
+        _LOG.info("Finding SentinelTiles before %s with state: %s", to_date, state.name)
+        return self.__find("find_before_date_by_state", (to_date, state.value))
     
 
-    def find_all_sentinel_tiles_after_date_by_state(self, from_date: DateTime, state: TileProcessState) -> list[SentinelTile]:
-        query = "SELECT * FROM table WHERE acquisition_date >= %s AND state = %s"
-        self.LOGGER.info(f"Finding SentinelTiles after {from_date.isoformat()} with state: {state.name}")
-        return self.__find(query, (from_date, state.value))
+    def find_all_sentinel_tiles_after_date_by_state(self, from_date: DateTime, state: TileProcessState) -> Iterator[SentinelTile]:
+        _LOG.info("Finding SentinelTiles after %s with state: %s", from_date, state.name)
+        return self.__find("find_after_date_by_state", (from_date, state.value))
     
-    def find_all_sentinel_tiles_between_dates_by_state(self, from_date: DateTime, to_date: DateTime, state: TileProcessState) -> list[SentinelTile]:
-        query = "SELECT * FROM table WHERE acquisition_date >= %s AND acquisition_date <= %s AND state = %s"
-        self.LOGGER.info(f"Finding SentinelTiles between {from_date.isoformat()} - {to_date.isoformat()} with state: {state.name}")
-        return self.__find(query, (from_date, to_date, state.value))
+    def find_all_sentinel_tiles_between_dates_by_state(self, from_date: DateTime, to_date: DateTime, state: TileProcessState) -> Iterator[SentinelTile]:
+        _LOG.info("Finding SentinelTiles between %s - %s with state: %s", from_date, to_date, state.name)
+        return self.__find("find_between_dates_by_state", (from_date, to_date, state.value))
+
+    def find_all_sentinel_tiles_by_states(self, states: tuple[TileProcessState, ...], from_date: DateTime|None = None, to_date: DateTime|None = None) -> Iterator[SentinelTile]:
+        state_values: list[str] = _state_values(states)
+        _LOG.info("Finding SentinelTiles with states: %s [from=%s, to=%s]", [state.name for state in states], from_date, to_date)
+        if (from_date is not None and to_date is not None):
+            return self.__find("find_between_dates_by_states", (state_values, from_date, to_date))
+        elif (from_date is not None):
+            return self.__find("find_after_date_by_states", (state_values, from_date))
+        elif (to_date is not None):
+            return self.__find("find_before_date_by_states", (state_values, to_date))
+        else:
+            return self.__find("find_by_states", (state_values,))
+
+    def save_all_sentinel_tiles(self, sentinel_tiles: Iterable[SentinelTile]) -> int:
+        rows: list[tuple] = [self.__map_sentinel_tile_to_row(sentinel_tile) for sentinel_tile in sentinel_tiles]
+        if (not rows):
+            return 0
+        sql_connection: psycopg2.extensions.connection = self.__get_connection()
+        broken: bool = False
+        try:
+            with sql_connection.cursor() as sql_cursor:
+                execute_values(sql_cursor, INSERT_SENTINEL_TILES, rows, template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())", page_size=500)
+            sql_connection.commit()
+            _LOG.info("Inserted %s SentinelTiles in a single batch", len(rows))
+            return len(rows)
+        except psycopg2.Error as exception:
+            broken = True
+            _LOG.error("SQL error while inserting %s SentinelTiles: %s", len(rows), exception, exc_info=True)
+            raise
+        finally:
+            self.__release_connection(sql_connection, broken=broken)
 
     # CANDIDATE_ALREADY_IN_DATABASE_REQUEST
     # SELECT input_path FROM hrwsi.raw_inputs ri WHERE ri.measurement_day>=%s AND ri.product_type_code='%s';
@@ -87,19 +190,20 @@ class PostgreSqlHarvesterRepository(HarvesterRepository):
     # GRD_CANDIDATE_ALREADY_IN_DATABASE_REQUEST
     # SELECT ri.tile, ri.start_date FROM hrwsi.raw_inputs ri WHERE ri.measurement_day>=%s AND ri.product_type_code='%s';
 
-    # INSERT_CANDIDATE_REQUEST
-    # INSERT INTO hrwsi.raw_inputs (id, product_type_code, start_date, publishing_date, tile, measurement_day, relative_orbit_number, input_path, is_partial, harvesting_date) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW()) ON CONFLICT (id) DO NOTHING
-
-    # LISTEN_PRODUCTS_REQUEST
-    # LISTEN product_insertion
-
     # UNSET_HARVEST_START_DATES
     # UPDATE systemparams.wekeo_api_manager SET %s WHERE CONCAT(triggering_condition_name, timeliness) = '%s';
 
     @staticmethod
-    def __map_record_to_sentinel_tile(record: dict) -> SentinelTile:
-        return SentinelTile.map_from_dict_record(record)
-
-    @staticmethod
-    def __map_records_to_sentinel_tiles(records: list[dict]) -> list[SentinelTile]:
-        return [PostgreSqlHarvesterRepository.__map_record_to_sentinel_tile(r) for r in records]
+    def __map_sentinel_tile_to_row(sentinel_tile: SentinelTile) -> tuple:
+        product_type_code = sentinel_tile.product_type.value if isinstance(sentinel_tile.product_type, ProductType) else sentinel_tile.product_type
+        return (
+            sentinel_tile.id,
+            product_type_code,
+            sentinel_tile.start_date,
+            sentinel_tile.publishing_date,
+            sentinel_tile.tile,
+            sentinel_tile.measurement_day,
+            sentinel_tile.relative_orbit_number,
+            sentinel_tile.input_path,
+            sentinel_tile.is_partial
+        )
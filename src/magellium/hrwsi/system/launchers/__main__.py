@@ -1,5 +1,5 @@
-from magellium.hrwsi.system.harvesters.application.ports.inputs.user_interface import UserInterface
-from magellium.hrwsi.system.harvesters.infrastructure.adapters.inputs.user_interface import CommandLineUserInterface
+from magellium.hrwsi.system.launchers.application.ports.inputs.user_interface import UserInterface
+from magellium.hrwsi.system.launchers.infrastructure.adapters.inputs.user_interface import CommandLineUserInterface
 
 def main():
     user_interface: UserInterface = CommandLineUserInterface()
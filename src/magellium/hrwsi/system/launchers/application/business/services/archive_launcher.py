@@ -1,11 +1,11 @@
-from magellium.hrwsi.system.launchers.application.business.services.launcher import AbstractHarvesterService
+from magellium.hrwsi.system.launchers.application.business.services.launcher import LauncherServiceImpl
 from magellium.hrwsi.system.common.modes import RunMode
-from magellium.hrwsi.system.launchers.application.ports.outputs.repository import Repository
+from magellium.hrwsi.system.launchers.application.ports.outputs.repository import LauncherRepository
 
 
-class ArchiveHarvesterService(AbstractHarvesterService):
-    def __init__(self, repository: Repository):
+class ArchiveLauncherService(LauncherServiceImpl):
+    def __init__(self, repository: LauncherRepository):
         super().__init__(RunMode.ARCHIVE, repository)
 
-    def harvest(self) -> None:
-        self.LOGGER.info("Harvesting in Archive mode...")
\ No newline at end of file
+    def launch(self) -> None:
+        self.LOGGER.info("Launching in Archive mode...")
\ No newline at end of file
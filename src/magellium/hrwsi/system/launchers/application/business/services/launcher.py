@@ -1,20 +1,34 @@
 from abc import ABC, abstractmethod
 from datetime import datetime as DateTime
 
+from magellium.hrwsi.system.common.logger import LoggerFactory
 from magellium.hrwsi.system.common.modes import RunMode
+from magellium.hrwsi.system.common.states import TileProcessState
 from magellium.hrwsi.system.launchers.application.ports.outputs.repository import LauncherRepository
 
 
-class LauncherService:
+class LauncherService(ABC):
 
-    def __init__(self):
+    @abstractmethod
+    def launch(self) -> None:
         raise NotImplementedError()
 
     @abstractmethod
-    def launch(self) -> None:
+    def harvest_tiles_by_state(self, state: TileProcessState, from_date: DateTime|None = None, to_date: DateTime|None = None) -> int:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def harvest_tiles_by_states(self, states: tuple[TileProcessState, ...], from_date: DateTime|None = None, to_date: DateTime|None = None) -> dict[TileProcessState, int]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def has_tiles_in_states(self, states: tuple[TileProcessState, ...], from_date: DateTime|None = None, to_date: DateTime|None = None) -> bool:
         raise NotImplementedError()
 
 class LauncherServiceImpl(LauncherService, ABC):
+
+    LOGGER = LoggerFactory.get_logger(__name__)
+
     def __init__(self, run_mode: RunMode, repository: LauncherRepository):
         self.__run_mode: RunMode = run_mode
         self.__repository: LauncherRepository = repository
@@ -25,4 +39,21 @@ class LauncherServiceImpl(LauncherService, ABC):
     
     @property
     def _repository(self) -> LauncherRepository:
-        return self.__repository
\ No newline at end of file
+        return self.__repository
+
+    def harvest_tiles_by_state(self, state: TileProcessState, from_date: DateTime|None = None, to_date: DateTime|None = None) -> int:
+        harvested_count: int = sum(1 for _ in self.__repository.find_tiles_by_state_and_range(state, from_date, to_date))
+        self.LOGGER.info(f"Harvested {harvested_count} tiles with state {state.name} [from={from_date}, to={to_date}]")
+        return harvested_count
+
+    def harvest_tiles_by_states(self, states: tuple[TileProcessState, ...], from_date: DateTime|None = None, to_date: DateTime|None = None) -> dict[TileProcessState, int]:
+        harvested_counts: dict[TileProcessState, int] = {state: 0 for state in states}
+        for sentinel_tile in self.__repository.find_tiles_by_states(states, from_date, to_date):
+            if (sentinel_tile.state in harvested_counts):
+                harvested_counts[sentinel_tile.state] += 1
+        for state, harvested_count in harvested_counts.items():
+            self.LOGGER.info(f"Harvested {harvested_count} tiles with state {state.name} [from={from_date}, to={to_date}]")
+        return harvested_counts
+
+    def has_tiles_in_states(self, states: tuple[TileProcessState, ...], from_date: DateTime|None = None, to_date: DateTime|None = None) -> bool:
+        return self.__repository.exists_tiles_by_states(states, from_date, to_date)
@@ -1,14 +1,14 @@
-from magellium.hrwsi.system.harvesters.application.business.services.harvester import H
+from magellium.hrwsi.system.launchers.application.business.services.launcher import LauncherServiceImpl
 from magellium.hrwsi.system.common.modes import RunMode
-from magellium.hrwsi.system.harvesters.application.ports.outputs.repository import HarvesterRepository
+from magellium.hrwsi.system.launchers.application.ports.outputs.repository import LauncherRepository
 from magellium.hrwsi.system.common.logger import LoggerFactory
 
-class NearRealTimeHarvesterService(AbstractHarvesterService):
+class NearRealTimeLauncherService(LauncherServiceImpl):
 
     LOGGER = LoggerFactory.get_logger(__name__)
 
-    def __init__(self, repository: HarvesterRepository):
+    def __init__(self, repository: LauncherRepository):
         super().__init__(RunMode.NEAR_REAL_TIME, repository)
 
-    def harvest(self) -> None:
-        self.LOGGER.info("Harvesting in NRT mode...")
\ No newline at end of file
+    def launch(self) -> None:
+        self.LOGGER.info("Launching in NRT mode...")
\ No newline at end of file
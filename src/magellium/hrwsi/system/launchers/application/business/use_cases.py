@@ -3,18 +3,26 @@ from datetime import datetime as DateTime
 
 from magellium.hrwsi.system.launchers.application.business.services.launcher import LauncherService
 from magellium.hrwsi.system.common.states import TileProcessState
+from magellium.hrwsi.system.common.logger import LoggerFactory
 
 
 class UseCase(ABC):
-    def __init__(self):
-        raise NotImplementedError()
+    # Slots all the way down: use cases carry no per-instance __dict__
+    __slots__ = ()
 
     @abstractmethod
-    def execute(self) -> None:
+    def execute(self) -> int:
+        """
+        Returns the number of harvested tiles
+        """
         raise NotImplementedError()
     
 
 class AbstractUseCase(UseCase, ABC):
+
+    LOGGER = LoggerFactory.get_logger(__name__)
+    __slots__ = ("__service",)
+
     def __init__(self, service: LauncherService):
         self.__service = service
 
@@ -23,82 +31,61 @@ class AbstractUseCase(UseCase, ABC):
         return self.__service
 
 
-class HarvestAllTilesWithIdleStateUseCase(AbstractUseCase):
-    def __init__(self, service: LauncherService):
-        super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.IDLE
-
-    def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in idle state...")
+class HarvestAllTilesByStatesUseCase(AbstractUseCase):
+    __slots__ = ("__tile_processing_states",)
 
-class HarvestAllTilesWithErrorStateUseCase(AbstractUseCase):
-    def __init__(self, service: LauncherService):
+    def __init__(self, service: LauncherService, states: tuple[TileProcessState, ...]):
         super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.ERROR
-
-    def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in error state...")
+        self.__tile_processing_states: tuple[TileProcessState, ...] = states
 
+    def execute(self) -> int:
+        self.LOGGER.info(f"Harvesting tiles in states {[state.name for state in self.__tile_processing_states]}...")
+        return sum(self._service.harvest_tiles_by_states(self.__tile_processing_states).values())
 
-class HarvestTilesWithIdleStateBeforeDateUseCase(AbstractUseCase):
-    def __init__(self, service: LauncherService, to_date: DateTime):
-        super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.IDLE
-        self.__to_date = to_date
 
+class HarvestTilesByStatesBeforeDateUseCase(AbstractUseCase):
+    __slots__ = ("__tile_processing_states", "__to_date")
 
-    def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in idle state...")
-
-class HarvestTilesWithErrorStateBeforeDateUseCase(AbstractUseCase):
-    def __init__(self, service: LauncherService, to_date: DateTime):
+    def __init__(self, service: LauncherService, states: tuple[TileProcessState, ...], to_date: DateTime):
         super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.ERROR
+        self.__tile_processing_states: tuple[TileProcessState, ...] = states
         self.__to_date = to_date
 
 
-    def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in error state...")
+    def execute(self) -> int:
+        self.LOGGER.info(f"Harvesting tiles in states {[state.name for state in self.__tile_processing_states]}...")
+        return sum(self._service.harvest_tiles_by_states(self.__tile_processing_states, to_date=self.__to_date).values())
 
-class HarvestTilesWithIdleStateAfterDateUseCase(AbstractUseCase):
-    def __init__(self, service: LauncherService, from_date: DateTime):
-        super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.IDLE
-        self.__from_date = from_date
 
+class HarvestTilesByStatesAfterDateUseCase(AbstractUseCase):
+    __slots__ = ("__tile_processing_states", "__from_date")
 
-    def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in idle state...")
-
-class HarvestTilesWithErrorStateAfterDateUseCase(AbstractUseCase):
-    def __init__(self, service: LauncherService, from_date: DateTime):
+    def __init__(self, service: LauncherService, states: tuple[TileProcessState, ...], from_date: DateTime):
         super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.ERROR
+        self.__tile_processing_states: tuple[TileProcessState, ...] = states
         self.__from_date = from_date
 
 
-    def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in error state...")
+    def execute(self) -> int:
+        self.LOGGER.info(f"Harvesting tiles in states {[state.name for state in self.__tile_processing_states]}...")
+        return sum(self._service.harvest_tiles_by_states(self.__tile_processing_states, from_date=self.__from_date).values())
 
-class HarvestTilesWithIdleStateBetweenDatesUseCase(AbstractUseCase):
-    def __init__(self, service: LauncherService, from_date: DateTime, to_date: DateTime):
-        super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.IDLE
-        self.__from_date = from_date
-        self.__to_date = to_date
 
+class HarvestTilesByStatesBetweenDatesUseCase(AbstractUseCase):
+    __slots__ = ("__tile_processing_states", "__from_date", "__to_date")
 
-    def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in idle state...")
-
-class HarvestTilesWithErrorStateBetweenDatesUseCase(AbstractUseCase):
-    def __init__(self, service: LauncherService, from_date: DateTime, to_date: DateTime):
+    def __init__(self, service: LauncherService, states: tuple[TileProcessState, ...], from_date: DateTime, to_date: DateTime):
+        """
+        Dates form the half-open range [from_date, to_date): from_date is included, to_date is excluded
+        """
         super().__init__(service)
-        self.__tile_processing_state: TileProcessState = TileProcessState.ERROR
+        if (from_date >= to_date):
+            raise ValueError(f"from_date ({from_date.isoformat()}) must be earlier than to_date ({to_date.isoformat()})")
+        self.__tile_processing_states: tuple[TileProcessState, ...] = states
         self.__from_date = from_date
         self.__to_date = to_date
 
 
-    def execute(self) -> None:
-        self.LOGGER.info("Harvesting tiles in error state...")
-
+    def execute(self) -> int:
+        self.LOGGER.info(f"Harvesting tiles in states {[state.name for state in self.__tile_processing_states]}...")
+        return sum(self._service.harvest_tiles_by_states(self.__tile_processing_states, from_date=self.__from_date, to_date=self.__to_date).values())
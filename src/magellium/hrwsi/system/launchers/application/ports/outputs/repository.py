@@ -1,7 +1,20 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from datetime import datetime as DateTime
+
+from magellium.hrwsi.system.core.sentinel_tiles import SentinelTile
+from magellium.hrwsi.system.common.states import TileProcessState
 
 class LauncherRepository(ABC):
 
     @abstractmethod
-    def save(self, data: str) -> None:
-        raise NotImplementedError()
\ No newline at end of file
+    def find_tiles_by_state_and_range(self, state: TileProcessState, from_date: DateTime|None = None, to_date: DateTime|None = None) -> Iterable[SentinelTile]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def find_tiles_by_states(self, states: tuple[TileProcessState, ...], from_date: DateTime|None = None, to_date: DateTime|None = None) -> Iterable[SentinelTile]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def exists_tiles_by_states(self, states: tuple[TileProcessState, ...], from_date: DateTime|None = None, to_date: DateTime|None = None) -> bool:
+        raise NotImplementedError()
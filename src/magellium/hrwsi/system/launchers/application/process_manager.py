@@ -1,50 +1,64 @@
 from datetime import datetime as DateTime
+from typing import Callable
 
 from magellium.hrwsi.system.launchers.application.business.services.launcher import LauncherService
 from magellium.hrwsi.system.launchers.application.business.use_cases import (
     UseCase, 
-    HarvestAllTilesWithErrorStateUseCase, 
-    HarvestAllTilesWithIdleStateUseCase,
-    HarvestTilesWithErrorStateAfterDateUseCase,
-    HarvestTilesWithErrorStateBeforeDateUseCase,
-    HarvestTilesWithErrorStateBetweenDatesUseCase,
-    HarvestTilesWithIdleStateAfterDateUseCase,
-    HarvestTilesWithIdleStateBeforeDateUseCase,
-    HarvestTilesWithIdleStateBetweenDatesUseCase
+    HarvestAllTilesByStatesUseCase,
+    HarvestTilesByStatesAfterDateUseCase,
+    HarvestTilesByStatesBeforeDateUseCase,
+    HarvestTilesByStatesBetweenDatesUseCase
 )
+from magellium.hrwsi.system.common.logger import LoggerFactory
+from magellium.hrwsi.system.common.states import TileProcessState
 from magellium.scheduler import Scheduler
 
 class LauncherProcessManager:
+
+    LOGGER = LoggerFactory.get_logger(__name__)
+    MIN_HARVESTING_INTERVAL_IN_SECONDS: float = 1
+    MAX_HARVESTING_INTERVAL_IN_SECONDS: float = 60
+    # A tick harvesting at least this many tiles is considered full: the next one comes sooner
+    HARVEST_BATCH_HIGH_WATERMARK: int = 1000
+
     def __init__(self, service: LauncherService, harvest_from_date: DateTime|None, harvest_to_date: DateTime|None):
         self.__scheduler: Scheduler = Scheduler()
+        self.__service: LauncherService = service
 
         self.__harvest_from_date: DateTime|None = harvest_from_date
         self.__harvest_to_date: DateTime|None = harvest_to_date
 
-        self.__harvest_all_tiles_with_idle_state_use_case: UseCase = HarvestAllTilesWithIdleStateUseCase(service)
-        self.__harvest_all_tiles_with_error_state_use_case: UseCase = HarvestAllTilesWithErrorStateUseCase(service)
-        self.__harvest_tiles_with_idle_state_after_date_use_case: UseCase = HarvestTilesWithIdleStateAfterDateUseCase(service, harvest_from_date)
-        self.__harvest_tiles_with_error_state_after_date_use_case: UseCase = HarvestTilesWithErrorStateAfterDateUseCase(service, harvest_from_date)
-        self.__harvest_tiles_with_idle_state_before_date_use_case: UseCase = HarvestTilesWithIdleStateBeforeDateUseCase(service, harvest_to_date)
-        self.__harvest_tiles_with_error_state_before_date_use_case: UseCase = HarvestTilesWithErrorStateBeforeDateUseCase(service, harvest_to_date)
-        self.__harvest_tiles_with_idle_state_between_dates_use_case: UseCase = HarvestTilesWithIdleStateBetweenDatesUseCase(service, harvest_from_date, harvest_to_date)
-        self.__harvest_tiles_with_error_state_between_dates_use_case: UseCase = HarvestTilesWithErrorStateBetweenDatesUseCase(service, harvest_from_date, harvest_to_date)
+        harvested_states: tuple[TileProcessState, ...] = (TileProcessState.IDLE, TileProcessState.ERROR)
+        self.__harvested_states: tuple[TileProcessState, ...] = harvested_states
+        # Keyed by (has from date, has to date); only the use case matching the fixed dates is ever built
+        use_case_factories: dict[tuple[bool, bool], Callable[[], UseCase]] = {
+            (True, True): lambda: HarvestTilesByStatesBetweenDatesUseCase(service, harvested_states, harvest_from_date, harvest_to_date),
+            (True, False): lambda: HarvestTilesByStatesAfterDateUseCase(service, harvested_states, harvest_from_date),
+            (False, True): lambda: HarvestTilesByStatesBeforeDateUseCase(service, harvested_states, harvest_to_date),
+            (False, False): lambda: HarvestAllTilesByStatesUseCase(service, harvested_states),
+        }
+        self.__active_use_case: UseCase = use_case_factories[(harvest_from_date is not None, harvest_to_date is not None)]()
 
-        self.harvesting_execution_interval_in_seconds: int = 5
+        self.harvesting_execution_interval_in_seconds: float = 5
 
     def __harvest_data(self) -> None:
-        if ((self.__harvest_from_date is not None) and (self.__harvest_to_date is not None)):
-            self.__harvest_tiles_with_idle_state_between_dates_use_case.execute()
-            self.__harvest_tiles_with_error_state_between_dates_use_case.execute()
-        elif (self.__harvest_from_date is not None):
-            self.__harvest_tiles_with_idle_state_after_date_use_case.execute()
-            self.__harvest_tiles_with_error_state_after_date_use_case.execute()
-        elif (self.__harvest_to_date is not None):
-            self.__harvest_tiles_with_idle_state_before_date_use_case.execute()
-            self.__harvest_tiles_with_error_state_before_date_use_case.execute()
+        # A LIMIT 1 probe is far cheaper than a full harvest, and most ticks find nothing to do
+        if (not self.__service.has_tiles_in_states(self.__harvested_states, self.__harvest_from_date, self.__harvest_to_date)):
+            self.LOGGER.debug("No tiles to harvest, skipping this tick")
+            harvested_count: int = 0
+        else:
+            harvested_count = self.__active_use_case.execute()
+        self.__adapt_harvesting_interval(harvested_count)
+
+    def __adapt_harvesting_interval(self, harvested_count: int) -> None:
+        if (harvested_count >= self.HARVEST_BATCH_HIGH_WATERMARK):
+            interval: float = max(self.MIN_HARVESTING_INTERVAL_IN_SECONDS, self.harvesting_execution_interval_in_seconds / 2)
         else:
-            self.__harvest_all_tiles_with_idle_state_use_case.execute()
-            self.__harvest_all_tiles_with_error_state_use_case.execute()
+            interval = min(self.MAX_HARVESTING_INTERVAL_IN_SECONDS, self.harvesting_execution_interval_in_seconds * 1.5)
+        if (interval != self.harvesting_execution_interval_in_seconds):
+            self.LOGGER.debug("Harvesting interval set to %.1fs after %s harvested tiles", interval, harvested_count)
+            self.harvesting_execution_interval_in_seconds = interval
+            self.__scheduler.reschedule(self.__harvest_data, interval)
 
 
     def start_harvesting(self) -> None:
@@ -1,17 +1,25 @@
 #!/usr/bin/env python3
 """This script is to  be used at integration stage to generate configuration YAML files at will."""
-import logging
+import re
 from datetime import datetime
 
-import yaml
+from magellium.hrwsi.system.common.caches import TTLCache
+from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import (
+    AbstractConfigurationFileGenerator,
+    MIN_MEASUREMENT_DATE,
+    get_s3_client,
+    parse_ymd,
+    reset_s3_client
+)
 
-from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator
 
-from magellium.serviceproviders.s3 import S3ServiceProvider, S3Client
-from magellium.serviceproviders.vault import VaultServiceProvider, HashcorpVaultClient
+# e.g. S2B_MSI1C_20200905T124309_N0500_R095_T28WET_20230328T093834.SAFE
+L1C_NAME_PATTERN = re.compile(r"^(?P<mission>[^_]*)_[^_]*_(?P<date>[^_T]*)[^_]*_[^_]*_[^_]*_[^_](?P<tile>[^_]*)")
+# e.g. SENTINEL2B_20201215-103755-817_L2A_T32TMS_C_V1-0
+L2A_NAME_PATTERN = re.compile(r"^(?P<mission>[^_]*)_(?P<year>\d{4})(?P<month>\d{2})(?P<day>\d{2})[^_]*_[^_]*_(?P<tile>[^_]*)")
 
-from magellium.hrwsi.utils.logger import LogUtil
-from magellium.hrwsi.utils.s3_client import S3Client
+# Keyed by (bucket, CAMS folder path). Only folders found present are cached, so a missing one is probed again on every call
+_cams_folder_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
 
 
 class CCConfigFileGenerator(AbstractConfigurationFileGenerator):
@@ -23,10 +31,21 @@ class CCConfigFileGenerator(AbstractConfigurationFileGenerator):
     S3_L1C_ROOT = "s3://EODATA/Sentinel-2/MSI/L1C"
     S3_QAS_ROOT="s3://HRWSI-KPI-FILES/CC"
     S3_L1C_ROOT_COLLECTION_1 = "s3://EODATA/Sentinel-2/MSI/L1C_N0500"
-    S2_MISSION_ID = ["S2A", "S2B"]
-    WORK_DIR = "/".join(["","opt","wsi"])
+    S2_MISSION_ID: frozenset = frozenset({"S2A", "S2B"})
+    _S2_MISSION_ID_STR = ", ".join(sorted(S2_MISSION_ID))
+    S2_L2A_MISSION_ID: frozenset = frozenset({"SENTINEL2A", "SENTINEL2B", "SENTINEL2C"})
+    _S2_L2A_MISSION_ID_STR = ", ".join(sorted(S2_L2A_MISSION_ID))
+    WORK_DIR = "/opt/wsi"
     PRODUCT_VERSION="V100"
 
+    # Constant path prefixes, joined once at class-load time
+    S3_AUX_DTM_PREFIX = f"{AbstractConfigurationFileGenerator.S3_AUX_ROOT}/DTM/"
+    S3_AUX_GIPP = f"{AbstractConfigurationFileGenerator.S3_AUX_ROOT}/GIPP/GIPP_DATA.zip"
+    S3_AUX_USERCONF = f"{AbstractConfigurationFileGenerator.S3_AUX_ROOT}/USERCONF/"
+    WORK_DIR_OUTPUT_CC_PREFIX = f"{WORK_DIR}/output/CC/"
+    WORK_DIR_TEMP_PREFIX = f"{WORK_DIR}/temp/"
+    WORK_DIR_OUTPUT_L2A = f"{WORK_DIR}/output/L2A/"
+
     def __init__(self,
                  maja_run_mode:str,
                  sentinel2_tile_id:str,
@@ -48,7 +67,6 @@ class CCConfigFileGenerator(AbstractConfigurationFileGenerator):
         Raises:
             AssertionError: Raised if run_mode is not in ["L2INIT", "L2NOMINAL"]
         """
-        self.logger = LogUtil.get_logger("ConfigFileGenerator", logging.INFO)
         super().__init__(sentinel2_tile_id)
         try:
             assert maja_run_mode in ["L2INIT", "L2NOMINAL"]
@@ -75,148 +93,133 @@ class CCConfigFileGenerator(AbstractConfigurationFileGenerator):
             error: AssertionError if the measurement date is out of scope
             error: _description_
         """
+        # A single timestamp for the whole build, so that the STDOUT and STDERR log paths match
+        now = datetime.now()
+        now_str = now.strftime('%Y%m%dT%H%M%S')
+
         #### Open the configuration file template
         #TODO When merging in the nrt system, remove the dependency on the run mode for the template
         # as only 1 template is to be used and that the processing routine only reads the fileds it is interested in.
-        config_file_template_path = "/".join(["HRWSI_System","launcher","config_file_generation","configuration_file_template.yml"])
-
         try:
-            with open(config_file_template_path,
-                  "r", encoding="UTF-8") as config_template_stream:
-                config_template = yaml.safe_load(config_template_stream)
+            config_template = self._get_template()
         except FileExistsError as error: # pragma no cover
-            self.logger.critical("Configuration file creation failed as template was not found at location %s", config_file_template_path)
+            self.logger.critical("Configuration file creation failed as template was not found at location %s", self.CONFIG_FILE_TEMPLATE_PATH)
             raise FileExistsError from error
 
         try:
-            l1c_measurement_date = datetime.strptime(self.l1c_measurement_date, "%Y-%m-%d")
-            year, month, day = self.l1c_measurement_date.split("-")
+            # Fixed YYYY-MM-DD format: the zero-padded parts are reused as-is in the paths below
+            year, month, day, l1c_measurement_date = parse_ymd(self.l1c_measurement_date)
 
             #### Setting up auxiliaries section
-            cams_folder_path = "/".join(["CAMS", year, month, day, ""])
-            config_template["auxiliaries"]["DTM"] = "/".join([self.S3_AUX_ROOT, "DTM", self.tile_id, ""])
-            config_template["auxiliaries"]["GIPP"] = "/".join([self.S3_AUX_ROOT, "GIPP", "GIPP_DATA.zip"])
-            config_template["auxiliaries"]["CAMS"] = "/".join([self.S3_AUX_ROOT, cams_folder_path])
+            cams_folder_path = f"CAMS/{year}/{month}/{day}/"
+            config_template["auxiliaries"]["DTM"] = f"{self.S3_AUX_DTM_PREFIX}{self.tile_id}/"
+            config_template["auxiliaries"]["GIPP"] = self.S3_AUX_GIPP
+            config_template["auxiliaries"]["CAMS"] = f"{self.S3_AUX_ROOT}/{cams_folder_path}"
 
             # Check that the required CAMS content folder is not empty
             try:
-                # Get the security credentials needed to connect to the S3
-                vault_client: VaultServiceProvider = HashcorpVaultClient()
-                s3_credentials_prod = vault_client.read_secret('s3cfg_HRWSI')
-                s3_access_key_id = s3_credentials_prod['access_key']
-                s3_secret_access_key = s3_credentials_prod['secret_key']
-                endpoint_url = s3_credentials_prod['endpoint_url']
-                region_name = s3_credentials_prod['region_name']
+                cams_cache_key = (self.S3_AUX_BUCKET, cams_folder_path)
+                if not _cams_folder_cache.get(cams_cache_key, False):
+                    s3_client = get_s3_client()
 
-                # Connect to the S3
-                s3_client = S3Client(s3_access_key_id, s3_secret_access_key, endpoint_url, region_name)
-
-                if not s3_client.check_folder_exists_and_not_empty(self.S3_AUX_BUCKET, cams_folder_path):
-                    self.logger.info("CAMS auxiliaries not found at location %s", cams_folder_path)
-                    return True
+                    if not s3_client.check_folder_exists_and_not_empty(self.S3_AUX_BUCKET, cams_folder_path):
+                        self.logger.info("CAMS auxiliaries not found at location %s", cams_folder_path)
+                        return True
+                    _cams_folder_cache.set(cams_cache_key, True)
 
             except RuntimeError as error:
+                # Credentials may have been rotated: rebuild the client on the next call
+                reset_s3_client()
                 self.logger.critical("S3 operating issue : %s.", error)
                 raise RuntimeError from error
 
             #### Setting up conf section -- specific to CC
-            config_template["conf"]["maja_userconf"] = "/".join([self.S3_AUX_ROOT, "USERCONF", ""])
+            config_template["conf"]["maja_userconf"] = self.S3_AUX_USERCONF
 
             #### Setting up measurement date section
             ## Checking input data measurement date
-            assert datetime.now() > l1c_measurement_date > datetime(2016,8,1)
+            assert now > l1c_measurement_date > MIN_MEASUREMENT_DATE
 
         except ValueError as error:
             self.logger.critical("Wrong format for measurement date, should be YYYY-mm-dd, got %s.",self.l1c_measurement_date)
             raise error
         except AssertionError as error:
-            self.logger.critical(f"Measurement date must be contained between {datetime(2016,8,1)} and {datetime.now()}, got {l1c_measurement_date}")
+            self.logger.critical("Measurement date must be contained between %s and %s, got %s", MIN_MEASUREMENT_DATE, now, l1c_measurement_date)
             raise error
 
         ## Storing data into template
 
         ##### Setting up Input
         ## L1C
-        l1c_mission_id = self.l1c_name.split("_", maxsplit=1)[0]
-        l1c_measurement_day = self.l1c_name.split("_", maxsplit=3)[2].split("T")[0]
-        l1c_tile_id = self.l1c_name.split("_")[5][1:]
-        try:
-            assert "".join([year, month, day]) == l1c_measurement_day
-            assert l1c_mission_id in self.S2_MISSION_ID
-            assert l1c_tile_id == self.tile_id
-        except AssertionError as error:
+        l1c_match = L1C_NAME_PATTERN.match(self.l1c_name)
+        if l1c_match is None:
+            self.logger.critical("Wrong L1C name provided: %s", self.l1c_name)
+            raise ValueError(f"Malformed L1C name: {self.l1c_name}")
+        l1c_mission_id, l1c_measurement_day, l1c_tile_id = l1c_match.group("mission", "date", "tile")
+        expected_day = f"{year}{month}{day}"
+        if (l1c_mission_id not in self.S2_MISSION_ID or l1c_tile_id != self.tile_id or l1c_measurement_day != expected_day):
             self.logger.critical("Wrong L1C name provided: %s",self.l1c_name)
             self.logger.critical("Expected tile %s, got %s",self.tile_id, l1c_tile_id)
-            self.logger.critical("Expected mission ID %s, got %s", str(self.S2_MISSION_ID), l1c_mission_id)
-            self.logger.critical("Expected measurement date %s, got %s",l1c_measurement_day, "".join([year, month, day]))
-            raise error
+            self.logger.critical("Expected mission ID %s, got %s", self._S2_MISSION_ID_STR, l1c_mission_id)
+            self.logger.critical("Expected measurement date %s, got %s", expected_day, l1c_measurement_day)
+            raise AssertionError(f"L1C {self.l1c_name} does not match tile {self.tile_id} and date {expected_day}")
         ## Storing data into template
         # Reprocessing of collection one case
         if l1c_measurement_date < datetime(year=2022,month=1,day=1):
-            config_template["input"]["L1C"] = "/".join([self.S3_L1C_ROOT_COLLECTION_1, year, month, day, self.l1c_name])
+            config_template["input"]["L1C"] = f"{self.S3_L1C_ROOT_COLLECTION_1}/{year}/{month}/{day}/{self.l1c_name}"
         else:
-            config_template["input"]["L1C"] = "/".join([self.S3_L1C_ROOT, year, month, day, self.l1c_name])
+            config_template["input"]["L1C"] = f"{self.S3_L1C_ROOT}/{year}/{month}/{day}/{self.l1c_name}"
             
         config_template["input"]["measurement_date"] = l1c_measurement_day
 
         ## L2A if run_mode is L2NOMINAL
         if self.run_mode == "L2NOMINAL":
-            l2a_mission_id = self.l2a_name.split("_", maxsplit=1)[0]
-            l2a_measurement_date = self.l2a_name.split("-", maxsplit=1)[0].split("_")[1]
-            l2a_year = l2a_measurement_date[:4]
-            l2a_month = l2a_measurement_date[4:6]
-            l2a_day = l2a_measurement_date[6:8]
-            l2a_tile_id = self.l2a_name.split("_")[3]
-            try:
-                assert l2a_mission_id in ["SENTINEL2A", "SENTINEL2B", "SENTINEL2C"]
-                assert l2a_tile_id[1:] == self.tile_id
-            except AssertionError as error:
+            l2a_match = L2A_NAME_PATTERN.match(self.l2a_name)
+            if l2a_match is None:
+                self.logger.critical("Wrong L2A name provided: %s", self.l2a_name)
+                raise ValueError(f"Malformed L2A name: {self.l2a_name}")
+            l2a_mission_id, l2a_year, l2a_month, l2a_day, l2a_tile_id = l2a_match.group("mission", "year", "month", "day", "tile")
+            if (l2a_mission_id not in self.S2_L2A_MISSION_ID or l2a_tile_id[1:] != self.tile_id):
                 self.logger.critical("Wrong L2A name provided: %s", self.l2a_name)
                 self.logger.critical("Expected tile %s, got %s",self.tile_id, l2a_tile_id)
-                self.logger.critical("Expected mission ID %s, got %s",str(self.S2_MISSION_ID),
-                                     l2a_mission_id)
-                self.logger.critical("Expected measurement date %s, got %s",l1c_measurement_day,
-                                     "".join([l2a_year, l2a_month, l2a_day]))
-                raise error
+                self.logger.critical("Expected mission ID %s, got %s", self._S2_L2A_MISSION_ID_STR, l2a_mission_id)
+                self.logger.critical("Expected measurement date %s, got %s", l1c_measurement_day, f"{l2a_year}{l2a_month}{l2a_day}")
+                raise AssertionError(f"L2A {self.l2a_name} does not match tile {self.tile_id}")
             ## Storing data into template
-            config_template["input"]["L2A"] = "/".join([self.S3_L2A_ROOT, l1c_tile_id, l2a_year,
-                                                        l2a_month, l2a_day, self.l2a_name])
+            config_template["input"]["L2A"] = f"{self.S3_L2A_ROOT}/{l1c_tile_id}/{l2a_year}/{l2a_month}/{l2a_day}/{self.l2a_name}"
 
         #### Setting up output path section
-        product_title="_".join(["CLMS","WSI","CC","020m",f"T{self.tile_id}",
-                               f"{self.product_measurement_date}",
-                               f"{l1c_mission_id}", f"{self.PRODUCT_VERSION}"])
-        output_dst_path = "/".join([self.S3_CC_ROOT,self.tile_id, year, month, day, product_title, ''])
-        config_template["output"]["src"] = "/".join([self.WORK_DIR,"output", "CC", product_title, ""])
+        product_title = f"CLMS_WSI_CC_020m_T{self.tile_id}_{self.product_measurement_date}_{l1c_mission_id}_{self.PRODUCT_VERSION}"
+        tile_date_path = f"{self.tile_id}/{year}/{month}/{day}"
+        output_dst_path = f"{self.S3_CC_ROOT}/{tile_date_path}/{product_title}/"
+        config_template["output"]["src"] = f"{self.WORK_DIR_OUTPUT_CC_PREFIX}{product_title}/"
         config_template["output"]["dst"] = output_dst_path
 
         #### Setting up KPI path section
-        config_template["qas"]["src"] = "/".join([self.WORK_DIR, "temp", product_title + "_temp", product_title+"_QAS.yaml"])
-        config_template["qas"]["dst"] = "/".join([self.S3_QAS_ROOT,self.tile_id, year, month, day,product_title+"_QAS.yaml"])
+        config_template["qas"]["src"] = f"{self.WORK_DIR_TEMP_PREFIX}{product_title}_temp/{product_title}_QAS.yaml"
+        config_template["qas"]["dst"] = f"{self.S3_QAS_ROOT}/{tile_date_path}/{product_title}_QAS.yaml"
 
         #### Setting up intermediate path section
-        intermediate_dst_path = "/".join([self.S3_L2A_ROOT,self.tile_id, year, month, day, ''])
+        intermediate_dst_path = f"{self.S3_L2A_ROOT}/{tile_date_path}/"
 
-        config_template["intermediates"]["L2A"]["src"] = "/".join([self.WORK_DIR,"output", "L2A", ""])
+        config_template["intermediates"]["L2A"]["src"] = self.WORK_DIR_OUTPUT_L2A
         config_template["intermediates"]["L2A"]["dst"] = intermediate_dst_path
 
         #### Setting up log path section
-        logs_out_path="/".join([self.S3_LOGS_ROOT,"CC",self.tile_id,year,month,day,f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_title}.stdout.log"])
-        logs_err_path="/".join([self.S3_LOGS_ROOT,"CC",self.tile_id,year,month,day,f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_title}.stderr.log"])
+        logs_out_path, logs_err_path = self._build_log_paths("CC", product_title, year, month, day, now_str)
 
-        config_template["log"]["STDOUT"]["src"] = "/".join([self.WORK_DIR,"logs","processing_routine.stdout.log"])
+        config_template["log"]["STDOUT"]["src"] = self.STDOUT_LOG_SRC
         config_template["log"]["STDOUT"]["dst"] = logs_out_path
 
-        config_template["log"]["STDERR"]["src"] = "/".join([self.WORK_DIR,"logs","processing_routine.stderr.log"])
+        config_template["log"]["STDERR"]["src"] = self.STDERR_LOG_SRC
         config_template["log"]["STDERR"]["dst"] = logs_err_path
 
         #### Setting up run mode
         config_template["run_mode"] = self.run_mode
 
         #### Writting the configuration file to /opt/wsi/config/configuration_file.yml
-        with open("/".join(["","tmp","configuration_file.yml"]),
-                  "w+", encoding="UTF-8") as config_stream:
-            yaml.safe_dump(config_template, config_stream, encoding="UTF-8")
+        # Keys keep the template order: no sort pass over each nested mapping
+        self._write_configuration_file(config_template, default_flow_style=False, allow_unicode=True)
         return False
 
 if __name__ == "__main__": # pragma no cover
@@ -1,18 +1,122 @@
 #!/usr/bin/env python3
 """This script is to be used at integration stage to generate configuration YAML files at will."""
 
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
 from os import environ
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Mapping
+from pathlib import Path
+from threading import Lock
+
+import yaml
+try:
+    from yaml import CSafeLoader, CSafeDumper
+except ImportError: # pragma no cover
+    # PyYAML built without LibYAML bindings
+    from yaml import SafeLoader as CSafeLoader, SafeDumper as CSafeDumper
 
 from magellium.hrwsi.system.common.logger import LoggerFactory
 
+
+# Backscatter at 10m (sigma0) products, as named by the Sig0 processing routine
+# e.g. SIG0_20211227T052658_20211227T052723_04E503_022_T32TMS_10m_S1AIWGRDH_ENVEO.tif
+SIGMA0_NAME_PATTERN = re.compile(
+    r"^[^_]*_(?P<date>[^_T]*)T(?P<time>[^_]*)_[^_]*_[^_]*_(?P<orbit>[^_]*)_[^_](?P<tile>[^_]*)_(?:[^_]*_)*(?P<mission>[^_]{3})[^_]*_[^_]*$")
+S1_MISSION_ID: frozenset = frozenset({"S1A", "S1B", "S1C"})
+# No Sentinel measurement to process before this date
+MIN_MEASUREMENT_DATE = datetime(2016, 8, 1)
+# YYYY-MM-DD with a plausible month and day: only the calendar check is left to datetime
+YMD_DATE_PATTERN = re.compile(r"([0-9]{4})-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])")
+
+S3_CREDENTIALS_SECRET_NAME = "s3cfg_HRWSI"
+
+# S3 clients shared by all the generators, keyed by Vault secret name
+_s3_clients: dict = {}
+_s3_clients_lock = Lock()
+
+
+@dataclass(slots=True)
+class Sigma0Info:
+    mission: str
+    date: str
+    time: str
+    tile: str
+    orbit: str
+
+
+@lru_cache(maxsize=None)
+def _parse_configuration_file_template(config_file_template_path: str) -> dict:
+    with open(config_file_template_path, "r", encoding="UTF-8") as config_template_stream:
+        return yaml.load(config_template_stream, Loader=CSafeLoader)
+
+
+def _copy_template_node(node):
+    # A parsed template only holds mappings, lists and immutable scalars: rebuilding the containers
+    # and sharing the scalars skips the memo and type dispatch of copy.deepcopy
+    if isinstance(node, dict):
+        return {key: _copy_template_node(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_copy_template_node(item) for item in node]
+    return node
+
+
+def load_configuration_file_template(config_file_template_path: str) -> dict:
+    """Returns a private copy of the template, which is only read and parsed once per path."""
+    return _copy_template_node(_parse_configuration_file_template(config_file_template_path))
+
+
+def parse_ymd(value: str) -> tuple[str, str, str, datetime]:
+    """Splits a YYYY-MM-DD date into its zero-padded parts and the matching datetime.
+
+    Raises:
+        ValueError: if the date is not in the YYYY-MM-DD format or does not exist.
+    """
+    date_match = YMD_DATE_PATTERN.fullmatch(value)
+    if date_match is None:
+        raise ValueError(f"Date {value!r} does not match format YYYY-MM-DD")
+    year, month, day = date_match.groups()
+    return year, month, day, datetime(int(year), int(month), int(day))
+
+
+def get_s3_client(secret_name: str = S3_CREDENTIALS_SECRET_NAME):
+    """Reads the S3 credentials from Vault and builds the S3 client once per secret.
+
+    The lookup and the build both happen under the lock, so concurrent first calls share one client.
+    """
+    with _s3_clients_lock:
+        s3_client = _s3_clients.get(secret_name)
+        if s3_client is None:
+            # Imported here so that the generators which never reach S3 do not depend on these clients
+            from magellium.hrwsi.utils.s3_client import S3Client
+            from magellium.serviceproviders.vault import HashcorpVaultClient
+
+            # Get the security credentials needed to connect to the S3
+            s3_credentials = HashcorpVaultClient().read_secret(secret_name)
+            s3_client = S3Client(s3_credentials['access_key'], s3_credentials['secret_key'],
+                                 s3_credentials['endpoint_url'], s3_credentials['region_name'])
+            _s3_clients[secret_name] = s3_client
+        return s3_client
+
+
+def reset_s3_client(secret_name: str = S3_CREDENTIALS_SECRET_NAME) -> None:
+    """Drops the cached S3 client, e.g. after its credentials were rotated, so the next call rebuilds it."""
+    with _s3_clients_lock:
+        _s3_clients.pop(secret_name, None)
+
+
 class Generator(ABC):
+    __slots__ = ()
 
     @abstractmethod
     def generate(self):
         raise NotImplementedError()
 
 class ConfigurationFileGenerator(Generator):
+    __slots__ = ()
 
     @abstractmethod
     def _build_yaml_conf(self):
@@ -24,13 +128,107 @@ class AbstractConfigurationFileGenerator(ConfigurationFileGenerator):
 
     S3_AUX_ROOT="s3://HRWSI-AUX"
     S3_LOGS_ROOT="s3://HRWSI-LOGS"
-
+    CONFIG_FILE_TEMPLATE_PATH = "HRWSI_System/launcher/config_file_generation/configuration_file_template.yml"
+    CONFIG_FILE_PATH = "/tmp/configuration_file.yml"
+    STDOUT_LOG_SRC = "/opt/wsi/logs/processing_routine.stdout.log"
+    STDERR_LOG_SRC = "/opt/wsi/logs/processing_routine.stderr.log"
+    WORK_DIR_OUTPUT = "/opt/wsi/output"
+    # Subclasses declare their own attributes in __slots__ as well, so instances carry no __dict__
+    __slots__ = ("_logger", "tile_id", "_config_file_path")
 
     def __init__(self, tile_id: str) -> None:
         """Initialization function."""
-        self.logger = LoggerFactory.get_logger(__name__)
+        self._logger: logging.Logger|None = None
         self.tile_id = tile_id
+        # Only set by generate_many(), which writes each configuration to its own file
+        self._config_file_path: str|None = None
+
+    @property
+    def logger(self) -> logging.Logger:
+        """Resolved on first use only: a valid configuration never logs."""
+        if (self._logger is None):
+            self._logger = LoggerFactory.get_logger(__name__)
+        return self._logger
+
+
+    def _get_template(self) -> dict:
+        """Returns a private copy of the configuration file template, shared by every generator class."""
+        return load_configuration_file_template(self.CONFIG_FILE_TEMPLATE_PATH)
+
+    def _parse_sigma0(self, sigma0_name: str, year: str, month: str, day: str) -> Sigma0Info:
+        """Parses a Backscatter at 10m product name and checks it against the tile and measurement date.
 
+        Raises:
+            ValueError: if the name does not follow the sigma0 naming convention.
+            AssertionError: if the mission, date or tile of the product are not the expected ones.
+        """
+        sigma0_match = SIGMA0_NAME_PATTERN.match(sigma0_name)
+        if sigma0_match is None:
+            self.logger.critical("Wrong Backscatter at 10m name provided: %s", sigma0_name)
+            raise ValueError(f"Malformed Backscatter at 10m name: {sigma0_name}")
+        sigma0 = Sigma0Info(*sigma0_match.group("mission", "date", "time", "tile", "orbit"))
+        if (sigma0.date != f"{year}{month}{day}"
+                or sigma0.mission not in S1_MISSION_ID
+                or sigma0.tile != self.tile_id):
+            self.logger.critical("Wrong Backscatter at 10m name provided: %s", sigma0_name)
+            raise AssertionError(f"Backscatter at 10m {sigma0_name} does not match mission {sorted(S1_MISSION_ID)}, date {year}{month}{day} and tile {self.tile_id}")
+        return sigma0
+
+    def _populate_common(self, config_template: dict, product_title: str, subsystem: str, output_root: str,
+                         year: str, month: str, day: str, now_stamp: str, log_title: str|None = None) -> None:
+        """Fills the date, output, log and KPI sections, laid out the same way by every processing routine.
+
+        The KPI file is uploaded under the S3_QAS_ROOT of the subclass. log_title defaults to product_title.
+        """
+        tile_date_path = f"{self.tile_id}/{year}/{month}/{day}"
+        config_template["date"] = f"{year}{month}{day}"
+
+        #### Setting up output path section
+        output = config_template["output"]
+        output["src"] = f"{self.WORK_DIR_OUTPUT}/{product_title}/"
+        output["dst"] = f"{output_root}/{tile_date_path}/{product_title}/"
+
+        #### Setting up log path section
+        logs_out_path, logs_err_path = self._build_log_paths(subsystem, log_title or product_title, year, month, day, now_stamp)
+        config_template["log"]["STDOUT"]["src"] = self.STDOUT_LOG_SRC
+        config_template["log"]["STDOUT"]["dst"] = logs_out_path
+        config_template["log"]["STDERR"]["src"] = self.STDERR_LOG_SRC
+        config_template["log"]["STDERR"]["dst"] = logs_err_path
+
+        #### Setting up KPI path section
+        qas_name = f"{product_title}_QAS.yaml"
+        qas = config_template["qas"]
+        qas["src"] = f"{self.WORK_DIR_OUTPUT}/{qas_name}"
+        qas["dst"] = f"{self.S3_QAS_ROOT}/{tile_date_path}/{qas_name}"
+
+    def _build_log_paths(self, subsystem: str, product_title: str, year: str, month: str, day: str, now_stamp: str) -> tuple[str, str]:
+        """Returns the S3 destinations of the STDOUT and STDERR logs, which only differ by their extension."""
+        prefix = f"{self.S3_LOGS_ROOT}/{subsystem}/{self.tile_id}/{year}/{month}/{day}/{now_stamp}_{product_title}"
+        return f"{prefix}.stdout.log", f"{prefix}.stderr.log"
+
+    def _write_configuration_file(self, config_template: dict, sort_keys: bool = False, **dump_options) -> None:
+        """Writes the configuration next to CONFIG_FILE_PATH, then renames it into place.
+
+        The rename is atomic, so a concurrent reader sees either the previous file or the complete new one.
+        """
+        config_file_path = self._config_file_path or self.CONFIG_FILE_PATH
+        # Serialized in memory, then written to disk in a single call
+        payload: bytes = yaml.dump(config_template, Dumper=CSafeDumper, encoding="UTF-8", sort_keys=sort_keys, **dump_options)
+        temporary_path = Path(f"{config_file_path}.new")
+        temporary_path.write_bytes(payload)
+        temporary_path.replace(config_file_path)
 
     def generate(self):
         self._build_yaml_conf()
+
+    @classmethod
+    def generate_many(cls, specs: Mapping[str, Mapping[str, Any]]) -> None:
+        """Generates several configuration files from a single process.
+
+        specs maps the path of each configuration file to the keyword arguments of the generator
+        that fills it. The template is parsed once and every file reuses it.
+        """
+        for config_file_path, arguments in specs.items():
+            generator = cls(**arguments)
+            generator._config_file_path = config_file_path
+            generator.generate()
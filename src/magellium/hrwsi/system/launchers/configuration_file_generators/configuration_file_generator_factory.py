@@ -156,8 +156,21 @@ class ConfigurationFileGeneratorFactory:
     """Factory class to create the correct configuration file generator depending on the product to be generated.
     """
 
+    # The factories only expose static methods: the classes themselves are returned, never instantiated
+    _FACTORY_MAP: dict[ProductType|str, type[Factory]] = {
+        ProductType.S2_CC_L2B: CCConfigurationFileGeneratorFactory,
+        ProductType.S2_FSC_L2B: FSCConfigFileGeneratorFactory,
+        ProductType.GFSC_L2C: GFSCConfigFileGeneratorFactory,
+        "SIG0": Sig0ConfigFileGeneratorFactory,
+        ProductType.S1_SWS_L2B: SWSConfigFileGeneratorFactory,
+        ProductType.S1_WDS_L2B: WDSConfigFileGeneratorFactory,
+        ProductType.S1_WICS1_L2B: WICS1ConfigFileGeneratorFactory,
+        ProductType.S2_WICS2_L2B: WICS2ConfigFileGeneratorFactory,
+        ProductType.COMB_WICS1S2: WICS1S2ConfigFileGeneratorFactory,
+    }
+
     @staticmethod
-    def create_factory_for_product_type(product_type: ProductType|str):
+    def create_factory_for_product_type(product_type: ProductType|str) -> type[Factory]:
         """Returns the correct configuration file generator depending on the product to be generated.
 
         Args:
@@ -165,28 +178,12 @@ class ConfigurationFileGeneratorFactory:
             **kwargs: Keyword arguments to be passed to the configuration file generator.
 
         Returns:
-            AbstractConfigurationFileGenerator: Configuration file generator.
+            type[Factory]: Configuration file generator factory, whose static `create` builds the generator.
 
         Raises:
             ValueError: If the product type is not supported.
         """
-        if product_type == ProductType.S2_CC_L2B:
-            return CCConfigurationFileGeneratorFactory()
-        elif product_type == ProductType.S2_FSC_L2B:
-            return FSCConfigFileGeneratorFactory()
-        elif product_type == ProductType.GFSC_L2C:
-            return GFSCConfigFileGeneratorFactory()
-        elif product_type == "SIG0":
-            return Sig0ConfigFileGeneratorFactory()
-        elif product_type == ProductType.S1_SWS_L2B:
-            return SWSConfigFileGeneratorFactory()
-        elif product_type == ProductType.S1_WDS_L2B:
-            return WDSConfigFileGeneratorFactory()
-        elif product_type == ProductType.S1_WICS1_L2B:
-            return WICS1ConfigFileGeneratorFactory()
-        elif product_type == ProductType.S2_WICS2_L2B:
-            return WICS2ConfigFileGeneratorFactory()
-        elif product_type == ProductType.COMB_WICS1S2:
-            return WICS1S2ConfigFileGeneratorFactory()
-        else:
+        try:
+            return ConfigurationFileGeneratorFactory._FACTORY_MAP[product_type]
+        except KeyError:
             raise ValueError(f"Product type {product_type} is not supported.")
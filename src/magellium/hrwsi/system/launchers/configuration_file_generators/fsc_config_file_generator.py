@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 """This script is to be used at integration stage to generate configuration YAML files at will."""
 
-import logging
+import re
 from datetime import datetime
 
-import yaml
+from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator, parse_ymd
 
-from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator
-from magellium.hrwsi.utils.logger import LogUtil
+
+MIN_MEASUREMENT_DATE = datetime(2016, 9, 1)
+
+# e.g. SENTINEL2B_20201215-103755-817_L2A_T32TMS_C_V1-0
+L2A_NAME_PATTERN = re.compile(r"^(?P<mission>[^_]*)_(?P<date>[^_-]*)-(?P<time>[^_-]*)[^_]*_[^_]*_(?P<tile>[^_]*)")
 
 
 class FSCConfigFileGenerator(AbstractConfigurationFileGenerator):
@@ -18,13 +21,14 @@ class FSCConfigFileGenerator(AbstractConfigurationFileGenerator):
     S3_L2A_ROOT="s3://HRWSI-INTERMEDIATE-RESULTS/L2A"
     S3_GVM_ROOT="s3://HRWSI-INTERMEDIATE-RESULTS/FSC"
     S3_QAS_ROOT="s3://HRWSI-KPI-FILES/FSC"
+    L2A_MISSION_ID: frozenset = frozenset({"SENTINEL2A", "SENTINEL2B", "SENTINEL2C"})
+    __slots__ = ("l2a_name", "measurement_date")
 
     def __init__(self, tile_id: str,
                  measurement_date: str,
                  l2a_name: str) -> None:
         """Initialization function."""
 
-        self.logger = LogUtil.get_logger("ConfigFileGenerator", logging.INFO)
         super().__init__(tile_id)
         self.l2a_name = l2a_name
         self.measurement_date = measurement_date
@@ -35,89 +39,83 @@ class FSCConfigFileGenerator(AbstractConfigurationFileGenerator):
         with values depending on the calss attributes for the FSC processing routine execution.
         """
 
-        with open("/".join(["HRWSI_System", "launcher", "config_file_generation", "configuration_file_template.yml"]),
-                  "r",
-                  encoding="UTF-8") as config_template_stream:
-            config_template = yaml.safe_load(config_template_stream)
+        config_template = self._get_template()
+        # Fixed template layout: the sections written below are looked up once
+        auxiliaries = config_template["auxiliaries"]
+        inputs = config_template["input"]
+        output = config_template["output"]
+        gv_mask = config_template["intermediates"]["GVmask"]
+        stdout_log = config_template["log"]["STDOUT"]
+        stderr_log = config_template["log"]["STDERR"]
+        qas = config_template["qas"]
 
-        #### Setting up auxiliaries section
-        dem_name = "".join(["Copernicus_DSM_04_N02_00_00_DEM_20m_", self.tile_id, ".tif"])
-        config_template["auxiliaries"]["DEM"] = "/".join([self.S3_AUX_ROOT, "DEM", "20m", dem_name])
+        # A single timestamp for the whole build, so that the STDOUT and STDERR log paths match
+        now = datetime.now()
+        now_str = now.strftime('%Y%m%dT%H%M%S')
 
-        water_mask_name = "".join(["WL_2018_20m_", self.tile_id, ".tif"])
-        config_template["auxiliaries"]["WATER_MASK"] = "/".join([self.S3_AUX_ROOT, "WL", "20m", water_mask_name])
-
-        tcd_name = "".join(["TCD_2018_010m_eu_03035_V2_0_20m_", self.tile_id, ".tif"])
-        config_template["auxiliaries"]["TCD"] = "/".join([self.S3_AUX_ROOT, "TCD", "20m", tcd_name])
+        #### Setting up auxiliaries section
+        auxiliaries["DEM"] = f"{self.S3_AUX_ROOT}/DEM/20m/Copernicus_DSM_04_N02_00_00_DEM_20m_{self.tile_id}.tif"
+        auxiliaries["WATER_MASK"] = f"{self.S3_AUX_ROOT}/WL/20m/WL_2018_20m_{self.tile_id}.tif"
+        auxiliaries["TCD"] = f"{self.S3_AUX_ROOT}/TCD/20m/TCD_2018_010m_eu_03035_V2_0_20m_{self.tile_id}.tif"
 
         #### Setting up measurement date section
         ## Checking input data
         try:
-            date = datetime.strptime(self.measurement_date, "%Y-%m-%d")
-            assert datetime.now() > date > datetime(2016, 9, 1)
+            year, month, day, date = parse_ymd(self.measurement_date)
+            assert now > date > MIN_MEASUREMENT_DATE
 
         ## Storing data into template
         except ValueError as error:
-            self.logger.critical(f"Wrong format for measurement date, should be YYYY-mm-dd, got {self.measurement_date}.")
+            self.logger.critical("Wrong format for measurement date, should be YYYY-mm-dd, got %s.", self.measurement_date)
             raise error
         except AssertionError as error:
-            self.logger.critical(
-                f"Measurement date must be contained between {datetime(2016, 9, 1)} and {datetime.now()}, got {date}")
+            self.logger.critical("Measurement date must be contained between %s and %s, got %s", MIN_MEASUREMENT_DATE, now, date)
             raise error
-        config_template["date"] = datetime.strftime(date, "%Y%m%d")
+        config_template["date"] = f"{year}{month}{day}"
 
         ##### Setting up L2A path section
         ## Checking input data
-        year, month, day = self.measurement_date.split("-")
-        l2a_mission_id = self.l2a_name.split("_", maxsplit=1)[0]
-        l2a_measurement_date = self.l2a_name.split("-", maxsplit=1)[0].split("_")[1]
-        l2a_measurement_time = self.l2a_name.split("-", maxsplit=2)[1]
-        l2a_tile_id = self.l2a_name.split("_")[3]
-        try:
-            assert "".join([year, month, day]) == l2a_measurement_date
-            assert l2a_mission_id in ["SENTINEL2A", "SENTINEL2B", "SENTINEL2C"]
-            assert l2a_tile_id[1:] == self.tile_id
-        except AssertionError as error:
-            self.logger.critical(f"Wrong L2A name provided: {self.l2a_name}")
-            raise error
+        l2a_match = L2A_NAME_PATTERN.match(self.l2a_name)
+        if l2a_match is None:
+            self.logger.critical("Wrong L2A name provided: %s", self.l2a_name)
+            raise ValueError(f"Malformed L2A name: {self.l2a_name}")
+        l2a_mission_id, l2a_measurement_date, l2a_measurement_time, l2a_tile_id = l2a_match.group("mission", "date", "time", "tile")
+        if (l2a_measurement_date != f"{year}{month}{day}"
+                or l2a_mission_id not in self.L2A_MISSION_ID
+                or l2a_tile_id[1:] != self.tile_id):
+            self.logger.critical("Wrong L2A name provided: %s", self.l2a_name)
+            raise AssertionError(f"L2A {self.l2a_name} does not match mission {sorted(self.L2A_MISSION_ID)}, date {year}{month}{day} and tile {self.tile_id}")
         ## Storing data into template
-        config_template["input"]["L2A"] = "/".join([self.S3_L2A_ROOT, l2a_tile_id[1:], year, month, day, self.l2a_name])
+        inputs["L2A"] = f"{self.S3_L2A_ROOT}/{l2a_tile_id[1:]}/{year}/{month}/{day}/{self.l2a_name}"
 
         #### Setting up output path section
-        l2a_mission_id = f"S2{l2a_mission_id[-1]}"
-        product_title = "_".join(
-            ["CLMS", "WSI", "FSC", "020m", l2a_tile_id, "T".join([l2a_measurement_date, l2a_measurement_time]),
-             l2a_mission_id, "V200"])
-        output_dst_path = "/".join([self.S3_FSC_ROOT, self.tile_id, year, month, day, product_title, ''])
-
-        config_template["output"]["src"] = "/".join(["", "opt", "wsi", "output", product_title, ""])
-        config_template["output"]["dst"] = output_dst_path
+        s2_mission_id = f"S2{l2a_mission_id[-1]}"
+        product_title = f"CLMS_WSI_FSC_020m_{l2a_tile_id}_{l2a_measurement_date}T{l2a_measurement_time}_{s2_mission_id}_V200"
+        tile_date_path = f"{self.tile_id}/{year}/{month}/{day}"
+        output_dst_path = f"{self.S3_FSC_ROOT}/{tile_date_path}/{product_title}/"
+
+        output["src"] = f"{self.WORK_DIR_OUTPUT}/{product_title}/"
+        output["dst"] = output_dst_path
         
-        output_dst_path = "/".join([self.S3_GVM_ROOT, self.tile_id, year, month, day, product_title, f"{product_title}_GV_mask.tif"])
-        config_template["intermediates"]["GVmask"]["src"] = "/".join(["", "opt", "wsi", "intermediate", f"{product_title}_GV_mask.tif"])
-        config_template["intermediates"]["GVmask"]["dst"] = output_dst_path
+        output_dst_path = f"{self.S3_GVM_ROOT}/{tile_date_path}/{product_title}/{product_title}_GV_mask.tif"
+        gv_mask["src"] = f"/opt/wsi/intermediate/{product_title}_GV_mask.tif"
+        gv_mask["dst"] = output_dst_path
 
         #### Setting up log path section
-        logs_out_path = "/".join(["s3://HRWSI-LOGS", "FSC", self.tile_id, year, month, day,
-                                  f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_title}_processing_routine.stdout.log"])
-        logs_err_path = "/".join(["s3://HRWSI-LOGS", "FSC", self.tile_id, year, month, day,
-                                  f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_title}_processing_routine.stderr.log"])
+        logs_out_path, logs_err_path = self._build_log_paths("FSC", f"{product_title}_processing_routine", year, month, day, now_str)
 
-        config_template["log"]["STDOUT"]["src"] = "/".join(["", "opt", "wsi", "logs", "processing_routine.stdout.log"])
-        config_template["log"]["STDOUT"]["dst"] = logs_out_path
+        stdout_log["src"] = self.STDOUT_LOG_SRC
+        stdout_log["dst"] = logs_out_path
 
-        config_template["log"]["STDERR"]["src"] = "/".join(["", "opt", "wsi", "logs", "processing_routine.stderr.log"])
-        config_template["log"]["STDERR"]["dst"] = logs_err_path
+        stderr_log["src"] = self.STDERR_LOG_SRC
+        stderr_log["dst"] = logs_err_path
 
         #### Setting up KPI path section
-        config_template["qas"]["src"] = "/".join(["","opt","wsi","output","tmp",product_title+"_QAS.yaml"])
-        config_template["qas"]["dst"] = "/".join([self.S3_QAS_ROOT,self.tile_id, year, month, day,product_title+"_QAS.yaml"])
+        qas["src"] = f"{self.WORK_DIR_OUTPUT}/tmp/{product_title}_QAS.yaml"
+        qas["dst"] = f"{self.S3_QAS_ROOT}/{tile_date_path}/{product_title}_QAS.yaml"
 
         #### Writting the configuration file to /tmp/configuration_file.yml
-        with open("/".join(["", "tmp", "configuration_file.yml"]),
-                  "w+", encoding="UTF-8") as config_stream:
-            yaml.safe_dump(config_template, config_stream, encoding="UTF-8")
-        return
+        self._write_configuration_file(config_template)
 
 
 if __name__ == "__main__": # pragma no cover
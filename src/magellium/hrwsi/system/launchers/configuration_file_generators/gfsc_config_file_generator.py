@@ -1,14 +1,12 @@
 #!/usr/bin/env python3
 """This script is to  be used at integration stage to generate configuration YAML files at will."""
-import logging
 from datetime import datetime
 from typing import List
 
-import yaml
+from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator, parse_ymd
 
-from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator
-from magellium.hrwsi.utils.logger import LogUtil
 
+MIN_PROCESSING_DATE = datetime(2016, 9, 1)
 
 class GFSCConfigFileGenerator(AbstractConfigurationFileGenerator):
     """Main class of the YAML config file generator for the GFSC processing routine.
@@ -20,6 +18,7 @@ class GFSCConfigFileGenerator(AbstractConfigurationFileGenerator):
     S3_LOGS_ROOT="s3://HRWSI-LOGS"
     PRODUCT_VERSION="V102"
     S3_QAS_ROOT="s3://HRWSI-KPI-FILES/GFSC"
+    __slots__ = ("sws_list", "fsc_list", "processing_date", "aggregation_timespan")
 
     def __init__(self,
                  tile_id:str,
@@ -28,7 +27,6 @@ class GFSCConfigFileGenerator(AbstractConfigurationFileGenerator):
                  fsc_list:List[str],
                  aggregation_timespan:str=None) -> None:
         """Initialization function."""
-        self.logger = LogUtil.get_logger("ConfigFileGenerator", logging.INFO)
         super().__init__(tile_id)
         self.tile_id = tile_id
         self.sws_list = sws_list
@@ -42,25 +40,32 @@ class GFSCConfigFileGenerator(AbstractConfigurationFileGenerator):
         """Fills the YAML template located at config/configuration_file.yml with values
         depending on the calss attributes for the SWS processing routine execution.
         """
-        config_file_template_path = "/".join(["HRWSI_System","launcher","config_file_generation","configuration_file_template.yml"])
-        with open(config_file_template_path,
-                  "r", encoding="UTF-8") as config_template_stream:
-                config_template = yaml.safe_load(config_template_stream)
+        config_template = self._get_template()
+        # Fixed template layout: the sections written below are looked up once
+        auxiliaries = config_template["auxiliaries"]
+        inputs = config_template["input"]
+        output = config_template["output"]
+        stdout_log = config_template["log"]["STDOUT"]
+        stderr_log = config_template["log"]["STDERR"]
+        qas = config_template["qas"]
+        # A single timestamp for the whole build, so that the STDOUT and STDERR log paths match
+        now = datetime.now()
+        now_str = now.strftime('%Y%m%dT%H%M%S')
 
         #### Setting up measurement date section
         ## Checking input data
         try:
-            date = datetime.strptime(self.processing_date,"%Y-%m-%d")
-            assert datetime.now() > date > datetime(2016,9,1)
+            year, month, day, date = parse_ymd(self.processing_date)
+            assert now > date > MIN_PROCESSING_DATE
 
         ## Storing data into template
         except ValueError as error:
-            self.logger.critical( f"Wrong format for processing date, should be YYYY-mm-dd, got {self.processing_date}.")
+            self.logger.critical("Wrong format for processing date, should be YYYY-mm-dd, got %s.", self.processing_date)
             raise error
         except AssertionError as error:
-            self.logger.critical(f"Measurement date must be contained between {datetime(2016,9,1)} and {datetime.now()}, got {date}")
+            self.logger.critical("Measurement date must be contained between %s and %s, got %s", MIN_PROCESSING_DATE, now, date)
             raise error
-        config_template["date"] = datetime.strftime(date,"%Y-%m-%d")
+        config_template["date"] = self.processing_date
 
         ##### Setting up INPUT path section
         ## Checking input data
@@ -68,45 +73,37 @@ class GFSCConfigFileGenerator(AbstractConfigurationFileGenerator):
         ## Storing data into template
         config_template["tile"] = self.tile_id
         #TODO this is to be adapted for the launcher to use as this strange looking contraption comes from bash behaviour.
-        config_template["input"]["SWS"] = [sws_name for sws_name in self.sws_list]
-        config_template["input"]["FSC"] = [fsc_name for fsc_name in self.fsc_list]
+        inputs["SWS"] = list(self.sws_list)
+        inputs["FSC"] = list(self.fsc_list)
         config_template["aggregation_timespan"] = self.aggregation_timespan
         
         #### Setting up auxiliaries section
-        water_mask_name = "".join(["WL_2018_60m_",self.tile_id,".tif"])
-        config_template["auxiliaries"]["WATER_MASK"] = "/".join([self.S3_AUX_ROOT,"WL","60m",water_mask_name])
+        auxiliaries["WATER_MASK"] = f"{self.S3_AUX_ROOT}/WL/60m/WL_2018_60m_{self.tile_id}.tif"
 
         #### Setting up output path section
 
-        product_title = "_".join(["CLMS","WSI","GFSC","060m",f"T{self.tile_id}",
-                                 f"{datetime.strftime(date,'%Y%m%d')}P{self.aggregation_timespan}D",
-                                 "COMB",
-                                 self.PRODUCT_VERSION])
-        year, month, day = self.processing_date.split("-")
-        output_dst_path = "/".join([self.S3_GFSC_ROOT,self.tile_id, year, month, day, product_title, ''])
+        product_title = f"CLMS_WSI_GFSC_060m_T{self.tile_id}_{year}{month}{day}P{self.aggregation_timespan}D_COMB_{self.PRODUCT_VERSION}"
+        tile_date_path = f"{self.tile_id}/{year}/{month}/{day}"
+        output_dst_path = f"{self.S3_GFSC_ROOT}/{tile_date_path}/{product_title}/"
 
-        config_template["output"]["src"] = "/".join(["","opt","wsi","output", product_title, ""])
-        config_template["output"]["dst"] = output_dst_path
+        output["src"] = f"{self.WORK_DIR_OUTPUT}/{product_title}/"
+        output["dst"] = output_dst_path
 
         #### Setting up log path section
-        logs_out_path="/".join([self.S3_LOGS_ROOT, "GFSC",self.tile_id,year,month,day,f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_title}.stdout.log"])
-        logs_err_path="/".join([self.S3_LOGS_ROOT, "GFSC",self.tile_id,year,month,day,f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_title}.stderr.log"])
+        logs_out_path, logs_err_path = self._build_log_paths("GFSC", product_title, year, month, day, now_str)
 
-        config_template["log"]["STDOUT"]["src"] = "/".join(["","opt","wsi","logs","processing_routine.stdout.log"])
-        config_template["log"]["STDOUT"]["dst"] = logs_out_path
+        stdout_log["src"] = self.STDOUT_LOG_SRC
+        stdout_log["dst"] = logs_out_path
 
-        config_template["log"]["STDERR"]["src"] = "/".join(["","opt","wsi","logs","processing_routine.stderr.log"])
-        config_template["log"]["STDERR"]["dst"] = logs_err_path
+        stderr_log["src"] = self.STDERR_LOG_SRC
+        stderr_log["dst"] = logs_err_path
 
         #### Setting up KPI path section
-        config_template["qas"]["src"] = "/".join(["","opt","wsi","output",product_title+"_QAS.yaml"])
-        config_template["qas"]["dst"] = "/".join([self.S3_QAS_ROOT,self.tile_id, year, month, day,product_title+"_QAS.yaml"])
+        qas["src"] = f"{self.WORK_DIR_OUTPUT}/{product_title}_QAS.yaml"
+        qas["dst"] = f"{self.S3_QAS_ROOT}/{tile_date_path}/{product_title}_QAS.yaml"
 
         #### Writting the configuration file to /tmp/configuration_file.yml
-        with open("/".join(["","tmp","configuration_file.yml"]),
-                  "w+", encoding="UTF-8") as config_stream:
-            yaml.safe_dump(config_template, config_stream, encoding="UTF-8")
-        return
+        self._write_configuration_file(config_template)
 
 if __name__ == "__main__": # pragma no cover
 
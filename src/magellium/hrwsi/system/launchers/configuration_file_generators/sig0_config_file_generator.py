@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 """This script is to be used at integration stage to generate configuration YAML files at will."""
-import logging
+import re
 from datetime import datetime
 from typing import List
 
-import yaml
+from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator, MIN_MEASUREMENT_DATE, S1_MISSION_ID, parse_ymd
 
-from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator
-from magellium.hrwsi.utils.logger import LogUtil
+
+# GRDs measured up to this date are stored under the older EODATA layout
+EODATA_LAYOUT_CHANGE_DATE = datetime(2023, 2, 21)
+
+# e.g. S1A_IW_GRDH_1SDV_20211227T052658_20211227T052723_041190_04E503_C194.SAFE
+GRD_NAME_PATTERN = re.compile(
+    r"^(?P<mission>[^_]*)_[^_]*_[^_]*_[^_]*_(?P<date>[^_T]*)T(?P<start_time>[^_T]*)[^_]*_[^_T]*T(?P<end_time>[^_T]*)[^_]*_[^_]*_(?P<acquisition_id>[^_]*)")
 
 
 class Sig0ConfigFileGenerator(AbstractConfigurationFileGenerator):
@@ -17,13 +22,13 @@ class Sig0ConfigFileGenerator(AbstractConfigurationFileGenerator):
     S3_SIGMA0_ROOT="s3://HRWSI-INTERMEDIATE-RESULTS/Backscatter_10m"
     S3_EODATA_ROOT="s3://EODATA/Sentinel-1/SAR/IW_GRDH_1S"
     S3_EODATA_ROOT_OLDER="s3://EODATA/Sentinel-1/SAR/GRD"
+    __slots__ = ("measurement_date", "grd_list", "relative_orbit")
 
     def __init__(self, tile_id:str,
                  measurement_date:str,
                  grd_list:List[str],
                  relative_orbit:str) -> None:
         """Initialization function."""
-        self.logger = LogUtil.get_logger("ConfigFileGenerator", logging.INFO)
         super().__init__(tile_id)
         self.tile_id = tile_id
         self.measurement_date = measurement_date
@@ -35,89 +40,85 @@ class Sig0ConfigFileGenerator(AbstractConfigurationFileGenerator):
         depending on the calss attributes for the SWS processing routine execution.
         """
 
-        with open("/".join(["HRWSI_System","launcher","config_file_generation","configuration_file_template.yml"]),
-                  "r",encoding="UTF-8") as config_template_stream:
-            config_template = yaml.safe_load(config_template_stream)
+        config_template = self._get_template()
+        # Fixed template layout: the sections written below are looked up once
+        auxiliaries = config_template["auxiliaries"]
+        inputs = config_template["input"]
+        output = config_template["output"]
+        stdout_log = config_template["log"]["STDOUT"]
+        stderr_log = config_template["log"]["STDERR"]
+        # A single timestamp for the whole build, so that the STDOUT and STDERR log paths match
+        now = datetime.now()
+        now_str = now.strftime('%Y%m%dT%H%M%S')
         #### Setting up measurement date section
         ## Checking input data
         try:
-            date = datetime.strptime(self.measurement_date,"%Y-%m-%d")
-            assert datetime.now() > date > datetime(2016,8,1)
-            if date <= datetime(year=2023, month=2, day=21):
+            year, month, day, date = parse_ymd(self.measurement_date)
+            assert now > date > MIN_MEASUREMENT_DATE
+            if date <= EODATA_LAYOUT_CHANGE_DATE:
                 s3_eodata_root = self.S3_EODATA_ROOT_OLDER
             else:
                 s3_eodata_root = self.S3_EODATA_ROOT
 
         ## Storing data into template
         except ValueError as error:
-            self.logger.critical( f"Wrong format for measurement date, should be YYYY-mm-dd, got {self.measurement_date}.")
+            self.logger.critical("Wrong format for measurement date, should be YYYY-mm-dd, got %s.", self.measurement_date)
             raise error
         except AssertionError as error:
-            self.logger.critical(f"Measurement date must be contained between {datetime(2016,8,1)} and {datetime.now()}, got {date}")
+            self.logger.critical("Measurement date must be contained between %s and %s, got %s", MIN_MEASUREMENT_DATE, now, date)
             raise error
-        config_template["date"] = datetime.strftime(date,"%Y%m%d")
+        config_template["date"] = f"{year}{month}{day}"
 
         ##### Setting up INPUT path section
         ## Checking input data
         # S1A_IW_GRDH_1SDV_20211227T052658_20211227T052723_041190_04E503_C194.SAFE
-        year, month, day = self.measurement_date.split("-")
+        expected_date = f"{year}{month}{day}"
         for index, grd_path in enumerate(self.grd_list):
-            grd_name = grd_path.split("/")[-1]
-            grd_mission_id = grd_name.split("_")[0]
-            grd_measurement_date = grd_name.split("_")[4].split("T")[0]
+            grd_name = grd_path.rsplit("/", maxsplit=1)[-1]
+            grd_match = GRD_NAME_PATTERN.match(grd_name)
+            if grd_match is None:
+                self.logger.critical("Wrong GRD name provided: %s", grd_path)
+                raise ValueError(f"Malformed GRD name: {grd_name}")
+            grd_mission_id, grd_measurement_date, grd_start_time, grd_end_measurement_time, grd_acquisition_id = grd_match.group(
+                "mission", "date", "start_time", "end_time", "acquisition_id")
+            # The product starts with the first GRD and ends with the last one
             if index == 0:
-                grd_start_measurement_time = grd_name.split("_")[4].split("T")[1]
-                grd_end_measurement_time = grd_name.split("_")[5].split("T")[1]
-            else:
-                grd_end_measurement_time = grd_name.split("_")[5].split("T")[1]
-            grd_acquisition_id = grd_name.split("_")[7]
-            try:
-                assert "".join([year, month, day]) == grd_measurement_date
-                assert grd_mission_id in ["S1A", "S1B", "S1C"]
-            except AssertionError as error:
-                self.logger.critical(f"Wrong GRD name provided: {grd_path}")
-                raise error
+                grd_start_measurement_time = grd_start_time
+            if (grd_mission_id not in S1_MISSION_ID or grd_measurement_date != expected_date):
+                self.logger.critical("Wrong GRD name provided: %s", grd_path)
+                raise AssertionError(f"GRD {grd_name} does not match mission {sorted(S1_MISSION_ID)} and date {expected_date}")
 
         ## Storing data into template
-        config_template["input"]["GRD"] = [ "/".join([s3_eodata_root,year,month,day,grd_name]) for grd_name in self.grd_list]
+        inputs["GRD"] = [f"{s3_eodata_root}/{year}/{month}/{day}/{grd_name}" for grd_name in self.grd_list]
         config_template["tile"] = self.tile_id
         
         #### Setting up auxiliaries section
-        config_template["auxiliaries"]["DEM"] = '/'.join([self.S3_AUX_ROOT,"DEM","10m",f"Copernicus_DSM_04_N02_00_00_DEM_10m_{self.tile_id}_b60m_wgs84.tif"])
-        config_template["auxiliaries"]["TILES_UTM"] = '/'.join([self.S3_AUX_ROOT,"TILES_UTM",'tiles_utm.yml'])
+        auxiliaries["DEM"] = f"{self.S3_AUX_ROOT}/DEM/10m/Copernicus_DSM_04_N02_00_00_DEM_10m_{self.tile_id}_b60m_wgs84.tif"
+        auxiliaries["TILES_UTM"] = f"{self.S3_AUX_ROOT}/TILES_UTM/tiles_utm.yml"
 
         #### Setting up output path section
-        while len(str(self.relative_orbit)) <=2:
-            self.relative_orbit=f"0{self.relative_orbit}"
-        product_title = "_".join(["SIG0",
-                                 "T".join([grd_measurement_date, grd_start_measurement_time]),
-                                 "T".join([grd_measurement_date, grd_end_measurement_time]),
-                                 f"{grd_acquisition_id}",
-                                 f"{self.relative_orbit}",
-                                 f"T{self.tile_id}",
-                                 "10m",
-                                 f"{grd_mission_id}IWGRDH_ENVEO.tif"])
-        output_dst_path = "/".join([self.S3_SIGMA0_ROOT,self.tile_id, year, month, day, product_title])
-
-        config_template["output"]["src"] = "/".join(["","opt","wsi","output", product_title])
-        config_template["output"]["dst"] = output_dst_path
+        # Local copy: padding must not mutate the instance, or a second build would differ
+        relative_orbit = str(self.relative_orbit).zfill(3)
+        product_title = (f"SIG0_{grd_measurement_date}T{grd_start_measurement_time}_{grd_measurement_date}T{grd_end_measurement_time}"
+                         f"_{grd_acquisition_id}_{relative_orbit}_T{self.tile_id}_10m_{grd_mission_id}IWGRDH_ENVEO.tif")
+        tile_date_path = f"{self.tile_id}/{year}/{month}/{day}"
+        output_dst_path = f"{self.S3_SIGMA0_ROOT}/{tile_date_path}/{product_title}"
+
+        output["src"] = f"{self.WORK_DIR_OUTPUT}/{product_title}"
+        output["dst"] = output_dst_path
 
         #### Setting up log path section
-        logs_out_path="/".join([self.S3_LOGS_ROOT,"Backscatter_10m",self.tile_id,year,month,day,f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_title}.stdout.log"])
-        logs_err_path="/".join([self.S3_LOGS_ROOT,"Backscatter_10m",self.tile_id,year,month,day,f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_title}.stderr.log"])
+        logs_out_path, logs_err_path = self._build_log_paths("Backscatter_10m", product_title, year, month, day, now_str)
 
-        config_template["log"]["STDOUT"]["src"] = "/".join(["","opt","wsi","logs","processing_routine.stdout.log"])
-        config_template["log"]["STDOUT"]["dst"] = logs_out_path
+        stdout_log["src"] = self.STDOUT_LOG_SRC
+        stdout_log["dst"] = logs_out_path
 
-        config_template["log"]["STDERR"]["src"] = "/".join(["","opt","wsi","logs","processing_routine.stderr.log"])
-        config_template["log"]["STDERR"]["dst"] = logs_err_path
+        stderr_log["src"] = self.STDERR_LOG_SRC
+        stderr_log["dst"] = logs_err_path
 
 
         #### Writting the configuration file to /tmp/configuration_file.yml
-        with open("/".join(["","tmp","configuration_file.yml"]),
-                  "w+", encoding="UTF-8") as config_stream:
-            yaml.safe_dump(config_template, config_stream, encoding="UTF-8")
-        return
+        self._write_configuration_file(config_template)
 
 if __name__ == "__main__": # pragma no cover
 
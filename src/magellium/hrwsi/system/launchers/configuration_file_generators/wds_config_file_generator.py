@@ -1,14 +1,10 @@
 #!/usr/bin/env python3
 """This script is to be used at integration stage to generate configuration YAML files at will."""
 
-import logging
 from datetime import datetime
 from typing import List
 
-import yaml
-
-from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator
-from magellium.hrwsi.utils.logger import LogUtil
+from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator, MIN_MEASUREMENT_DATE, parse_ymd
 
 
 class WDSConfigFileGenerator(AbstractConfigurationFileGenerator):
@@ -19,6 +15,7 @@ class WDSConfigFileGenerator(AbstractConfigurationFileGenerator):
     S3_SIGMA0_ROOT = "s3://HRWSI-INTERMEDIATE-RESULTS/Backscatter_10m"
     S3_FSC_ROOT = "s3://HRWSI/FSC"
     S3_QAS_ROOT="s3://HRWSI-KPI-FILES/WDS"
+    __slots__ = ("sigma0_name", "fsc_list", "measurement_date")
 
     def __init__(self, tile_id: str,
                  measurement_date: str,
@@ -26,7 +23,6 @@ class WDSConfigFileGenerator(AbstractConfigurationFileGenerator):
                  fsc_list: List[str]) -> None:
         """Initialization function."""
 
-        self.logger = LogUtil.get_logger("SWS ConfigFileGenerator", logging.INFO)
         super().__init__(tile_id)
         self.sigma0_name = sigma0_name
         self.fsc_list = fsc_list
@@ -38,100 +34,54 @@ class WDSConfigFileGenerator(AbstractConfigurationFileGenerator):
         with values depending on the class attributes for the WDS processing routine execution.
         """
 
-        with open("/".join(["HRWSI_System", "launcher", "config_file_generation", "configuration_file_template.yml"]),
-                  "r",
-                  encoding="UTF-8") as config_template_stream:
-            config_template = yaml.safe_load(config_template_stream)
+        config_template = self._get_template()
+        # A single timestamp for the whole build, so that the STDOUT and STDERR log paths match
+        now = datetime.now()
+        now_str = now.strftime('%Y%m%dT%H%M%S')
 
         #### Setting up measurement date section
         ## Checking input data
         try:
-            date = datetime.strptime(self.measurement_date, "%Y-%m-%d")
-            assert datetime.now() > date > datetime(2016, 8, 1)
-
-        ## Storing data into template
+            year, month, day, date = parse_ymd(self.measurement_date)
         except ValueError as error:
             self.logger.critical(f"Wrong format for measurement date, should be YYYY-mm-dd, got {self.measurement_date}.")
             raise error
-        except AssertionError as error:
-            self.logger.critical(
-                f"Measurement date must be contained between {datetime(2016, 8, 1)} and {datetime.now()}, got {date}")
-            raise error
-        config_template["date"] = datetime.strftime(date, "%Y%m%d")
+        # Explicit check rather than assert, so that it still runs under python -O
+        if not (now > date > MIN_MEASUREMENT_DATE):
+            self.logger.critical(f"Measurement date must be contained between {MIN_MEASUREMENT_DATE} and {now}, got {date}")
+            raise AssertionError(f"Measurement date {self.measurement_date} out of range")
 
         ##### Setting up INPUT path section
         ## Checking input data
-        year, month, day = self.measurement_date.split("-")
-        sigma0_mission_id = self.sigma0_name.split("_")[-2][:3]
-        sigma0_measurement_date = self.sigma0_name.split("_")[1].split("T")[0]
-        sigma0_measurement_time = self.sigma0_name.split("_")[1].split("T")[1]
-        sigma0_tile_id = self.sigma0_name.split("_")[5][1:]
-        sigma0_relative_orbit = self.sigma0_name.split("_")[4]
-
-        try:
-            assert "".join([year, month, day]) == sigma0_measurement_date
-            assert sigma0_mission_id in ["S1A", "S1B", "S1C"]
-            assert sigma0_tile_id == self.tile_id
-        except AssertionError as error:
-            self.logger.critical(f"Wrong Backscatter at 10m name provided: {self.sigma0_name}")
-            raise error
+        sigma0 = self._parse_sigma0(self.sigma0_name, year, month, day)
 
         ## Storing data into template
-        config_template["input"]["SIGMA0"] = "/".join(
-            [self.S3_SIGMA0_ROOT, self.tile_id, year, month, day, self.sigma0_name])
-        config_template["input"]["FSCs"] = ["/".join([self.S3_FSC_ROOT, self.tile_id, year, month, day, fsc_name]) for
-                                            fsc_name in self.fsc_list]
+        tile_date_path = f"{self.tile_id}/{year}/{month}/{day}"
+        config_template["input"]["SIGMA0"] = f"{self.S3_SIGMA0_ROOT}/{tile_date_path}/{self.sigma0_name}"
+        config_template["input"]["FSCs"] = [f"{self.S3_FSC_ROOT}/{tile_date_path}/{fsc_name}" for fsc_name in self.fsc_list]
 
         #### Setting up auxiliaries section
-        mask_forest_urban_water_name = "".join(["MASK_FOREST_URBAN_WATER_T", self.tile_id, "_60m_V20240827.tif"])
-        config_template["auxiliaries"]["MASK_FOREST_URBAN_WATER"] = "/".join(
-            [self.S3_AUX_ROOT, "MASK_FOREST_URBAN_WATER", mask_forest_urban_water_name])
+        mask_forest_urban_water_name = f"MASK_FOREST_URBAN_WATER_T{self.tile_id}_60m_V20240827.tif"
+        config_template["auxiliaries"]["MASK_FOREST_URBAN_WATER"] = f"{self.S3_AUX_ROOT}/MASK_FOREST_URBAN_WATER/{mask_forest_urban_water_name}"
 
-        s1_reference_name = "".join(["S1_REFERENCE_T", self.tile_id, f"_60m_t{sigma0_relative_orbit}_V20240827.tif"])
-        config_template["auxiliaries"]["S1_REFERENCE"] = "/".join([self.S3_AUX_ROOT, "S1_REFERENCE", s1_reference_name])
+        # Shared by the relative-orbit dependent auxiliaries
+        orbit_suffix = f"_60m_t{sigma0.orbit}_V20240827.tif"
+        s1_reference_name = f"S1_REFERENCE_T{self.tile_id}{orbit_suffix}"
+        config_template["auxiliaries"]["S1_REFERENCE"] = f"{self.S3_AUX_ROOT}/S1_REFERENCE/{s1_reference_name}"
 
-        s1_radar_shadow_layover_name = "".join(["S1_RADAR_SHADOW_LAYOVER_T",self.tile_id,f"_60m_t{sigma0_relative_orbit}_V20240827.tif"])
-        config_template["auxiliaries"]["S1_RADAR_SHADOW_LAYOVER"] = "/".join(
-            [self.S3_AUX_ROOT, "S1_RADAR_SHADOW_LAYOVER", s1_radar_shadow_layover_name])
+        s1_radar_shadow_layover_name = f"S1_RADAR_SHADOW_LAYOVER_T{self.tile_id}{orbit_suffix}"
+        config_template["auxiliaries"]["S1_RADAR_SHADOW_LAYOVER"] = f"{self.S3_AUX_ROOT}/S1_RADAR_SHADOW_LAYOVER/{s1_radar_shadow_layover_name}"
 
-        s1_incidence_angle_name = "".join(["S1_INCIDENCE_ANGLE_T", self.tile_id, f"_60m_t{sigma0_relative_orbit}_V20240827.tif"])
-        config_template["auxiliaries"]["S1_INCIDENCE_ANGLE"] = "/".join(
-            [self.S3_AUX_ROOT, "S1_INCIDENCE_ANGLE", s1_incidence_angle_name])
+        s1_incidence_angle_name = f"S1_INCIDENCE_ANGLE_T{self.tile_id}{orbit_suffix}"
+        config_template["auxiliaries"]["S1_INCIDENCE_ANGLE"] = f"{self.S3_AUX_ROOT}/S1_INCIDENCE_ANGLE/{s1_incidence_angle_name}"
 
         #### Setting up output path section
 
-        product_title = "_".join(["CLMS", "WSI", "WDS", "060m",
-                                 f"T{self.tile_id}",
-                                 "T".join([sigma0_measurement_date, sigma0_measurement_time]),
-                                 f"{sigma0_mission_id}",
-                                 "V200"])
-        output_dst_path = "/".join([self.S3_WDS_ROOT, self.tile_id, year, month, day, product_title, ''])
-
-        config_template["output"]["src"] = "/".join(["", "opt", "wsi", "output", product_title, ""])
-        config_template["output"]["dst"] = output_dst_path
-
-        #### Setting up log path section
-        logs_out_path = "/".join([self.S3_LOGS_ROOT, "WDS", self.tile_id, year, month, day,
-                                  f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_title}.stdout.log"])
-        logs_err_path = "/".join([self.S3_LOGS_ROOT, "WDS", self.tile_id, year, month, day,
-                                  f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_title}.stderr.log"])
-
-        config_template["log"]["STDOUT"]["src"] = "/".join(["", "opt", "wsi", "logs", "processing_routine.stdout.log"])
-        config_template["log"]["STDOUT"]["dst"] = logs_out_path
-
-        config_template["log"]["STDERR"]["src"] = "/".join(["", "opt", "wsi", "logs", "processing_routine.stderr.log"])
-        config_template["log"]["STDERR"]["dst"] = logs_err_path
-
-        #### Setting up KPI path section
-        config_template["qas"]["src"] = "/".join(["","opt","wsi","output",product_title+"_QAS.yaml"])
-        config_template["qas"]["dst"] = "/".join([self.S3_QAS_ROOT,self.tile_id, year, month, day,product_title+"_QAS.yaml"])
-
+        product_title = f"CLMS_WSI_WDS_060m_T{self.tile_id}_{sigma0.date}T{sigma0.time}_{sigma0.mission}_V200"
+        self._populate_common(config_template, product_title, "WDS", self.S3_WDS_ROOT, year, month, day, now_str)
 
         #### Writting the configuration file to /tmp/configuration_file.yml
-        with open("/".join(["", "tmp", "configuration_file.yml"]),
-                  "w+", encoding="UTF-8") as config_stream:
-            yaml.safe_dump(config_template, config_stream, encoding="UTF-8")
-        return
+        self._write_configuration_file(config_template)
 
 
 if __name__ == "__main__": # pragma no cover
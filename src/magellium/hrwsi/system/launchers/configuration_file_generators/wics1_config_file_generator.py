@@ -1,15 +1,34 @@
 #!/usr/bin/env python3
 """This script is to be used at integration stage to generate configuration YAML files at will."""
 
-import logging
 from datetime import datetime
 
-import yaml
+from magellium.hrwsi.system.common.caches import TTLCache
+from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import (
+    AbstractConfigurationFileGenerator,
+    MIN_MEASUREMENT_DATE,
+    get_s3_client,
+    parse_ymd,
+    reset_s3_client
+)
 
-from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator
-from magellium.hrwsi.utils.logger import LogUtil
-from magellium.hrwsi.utils.s3_client import S3Client
-from magellium.hrwsi.utils.vault_client import VaultClient
+
+# The wind speed and temperature dynamic auxiliaries both live under FMI_ folders: one listing answers for the two files
+FMI_AUXILIARIES_PREFIX = "FMI_"
+
+# Keyed by (bucket, prefix). A listing is reused while it holds every requested key; a missing key triggers a fresh one
+_fmi_auxiliaries_keys_cache: TTLCache = TTLCache(maxsize=4, ttl=300)
+
+
+def _list_keys(s3_client, bucket_name: str, prefix: str) -> frozenset:
+    """Lists every key under the prefix, following the list_objects_v2 pages past the first 1000 keys."""
+    try:
+        keys = set()
+        for page in s3_client.client.get_paginator("list_objects_v2").paginate(Bucket=bucket_name, Prefix=prefix):
+            keys.update(s3_object["Key"] for s3_object in page.get("Contents", ()))
+    except Exception as error:
+        raise RuntimeError(f"Unable to list s3://{bucket_name}/{prefix}") from error
+    return frozenset(keys)
 
 
 class WICS1ConfigFileGenerator(AbstractConfigurationFileGenerator):
@@ -19,13 +38,13 @@ class WICS1ConfigFileGenerator(AbstractConfigurationFileGenerator):
     S3_WIC_S1_ROOT="s3://HRWSI/WIC_S1"
     S3_SIGMA0_ROOT="s3://HRWSI-INTERMEDIATE-RESULTS/Backscatter_10m"
     S3_QAS_ROOT="s3://HRWSI-KPI-FILES/WIC_S1"
+    __slots__ = ("sigma0_name", "measurement_date")
 
     def __init__(self, tile_id:str,
                  measurement_date:str,
                  sigma0_name:str) -> None: # pragma no cover
         """Initialization function."""
 
-        self.logger = LogUtil.get_logger("WIC S1 ConfigFileGenerator", logging.INFO)
         super().__init__(tile_id)
         self.sigma0_name = sigma0_name
         self.measurement_date = measurement_date
@@ -36,125 +55,83 @@ class WICS1ConfigFileGenerator(AbstractConfigurationFileGenerator):
         with values depending on the calss attributes for the WIC S1 processing routine execution.
         """
 
-        with open("/".join(["HRWSI_System","launcher","config_file_generation","configuration_file_template.yml"]),
-                "r",
-                encoding="UTF-8") as config_template_stream:
-            config_template = yaml.safe_load(config_template_stream)
-
-
-        #### Setting up auxiliaries section
-        grassland_name = "".join(["GRA_2018_010m_eu_03035_V1_0_60m_",self.tile_id,".tif"])
-        config_template["auxiliaries"]["GRASSLAND"] = "/".join([self.S3_AUX_ROOT,"GRASSLAND","60m",grassland_name])
-
-        imperviousness_name = "".join(["IMD_2018_010m_eu_03035_V2_0_60m_",self.tile_id,".tif"])
-        config_template["auxiliaries"]["IMPERVIOUSNESS"] = "/".join([self.S3_AUX_ROOT,"IMPERVIOUSNESS","60m", imperviousness_name])
-
-        tree_cover_density_name = "".join(["TCD_2018_010m_eu_03035_V2_0_60m_",self.tile_id,".tif"])
-        config_template["auxiliaries"]["TREE_COVER"] = "/".join([self.S3_AUX_ROOT,"TCD", "60m", tree_cover_density_name])
-
-        water_layer_name = "".join(["WL_2018_60m_",self.tile_id,".tif"])
-        config_template["auxiliaries"]["WATER_LAYER"] = "/".join([self.S3_AUX_ROOT,"WL","60m",water_layer_name])
+        # A single timestamp for the whole build, so that the STDOUT and STDERR log paths match
+        now = datetime.now()
+        now_str = now.strftime('%Y%m%dT%H%M%S')
 
         #### Setting up measurement date section
         ## Checking input data
         try:
-            date = datetime.strptime(self.measurement_date,"%Y-%m-%d")
-            assert datetime.now() > date > datetime(2016,8,1)
-
-        ## Storing data into template
+            year, month, day, date = parse_ymd(self.measurement_date)
         except ValueError as error:
             self.logger.critical(f"Wrong format for measurement date, should be YYYY-mm-dd, got {self.measurement_date}.")
             raise error
-        except AssertionError as error:
-            self.logger.critical(f"Measurement date must be contained between {datetime(2016,8,1)} and {datetime.now()}, got {date}")
-            raise error
-        config_template["date"] = datetime.strftime(date,"%Y%m%d")
+        # Explicit check rather than assert, so that it still runs under python -O
+        if not (now > date > MIN_MEASUREMENT_DATE):
+            self.logger.critical(f"Measurement date must be contained between {MIN_MEASUREMENT_DATE} and {now}, got {date}")
+            raise AssertionError(f"Measurement date {self.measurement_date} out of range")
 
         ##### Setting up INPUT path section
         ## Checking input data
-        year, month, day = self.measurement_date.split("-")
-        sigma0_mission_id = self.sigma0_name.split("_")[-2][:3]
-        sigma0_measurement_date = self.sigma0_name.split("_")[1].split("T")[0]
-        sigma0_measurement_time = self.sigma0_name.split("_")[1].split("T")[1]
-        sigma0_tile_id = self.sigma0_name.split("_")[5][1:]
-        sigma0_relative_orbit = self.sigma0_name.split("_")[4]
-
-        try:
-            assert "".join([year, month, day]) == sigma0_measurement_date
-            assert sigma0_mission_id in ["S1A", "S1B", "S1C"]
-            assert sigma0_tile_id == self.tile_id
-        except AssertionError as error:
-            self.logger.critical(f"Wrong Backscatter at 10m name provided: {self.sigma0_name}")
-            raise error
-
-        ## Storing data into template
-        windspeed_filename_path = "/".join(["FMI_WINDSPEED", f"{year}{month}{day}_wind_speed.nc"])
-        temperature_filename_path = "/".join(["FMI_TEMPERATURE", f"{year}{month}{day}_t2m_sum.nc"])
-        config_template["tile_id"] = self.tile_id
-        config_template["input"]["SIGMA0"] = "/".join([self.S3_SIGMA0_ROOT, self.tile_id, year, month, day, self.sigma0_name])
-        config_template["input"]["CLASSIFICATION_COEFFICIENTS"] = "/".join([self.S3_AUX_ROOT, "WIC_S1_CLASSIFICATION_COEFFICIENTS", f"cc_60m_{self.tile_id}.tif"])
-        config_template["input"]["RADARSHADOW"] = "/".join([self.S3_AUX_ROOT, "S1_RADAR_SHADOW_LAYOVER", "".join(["S1_RADAR_SHADOW_LAYOVER_T",self.tile_id,f"_60m_t{sigma0_relative_orbit}_V20240827.tif"])])
-        config_template["input"]["TEMPERATURE"] = "/".join([self.S3_AUX_ROOT, temperature_filename_path])
-        config_template["input"]["WATER_CATEGORY"] = "/".join([self.S3_AUX_ROOT, "WIC_S1_WATER_CLASSIFICATION",  f"wc_60m_{self.tile_id}.tif"])
-        config_template["input"]["WIND_SPEED"] = "/".join([self.S3_AUX_ROOT, windspeed_filename_path])
-
-        #### Setting up output path section
-        product_title = "_".join(["CLMS","WSI","WIC", "060m", f"T{self.tile_id}", "T".join([sigma0_measurement_date, sigma0_measurement_time]),
-                                 f"{sigma0_mission_id}",
-                                 "V100"])
-        output_dst_path = "/".join([self.S3_WIC_S1_ROOT,self.tile_id, year, month, day, product_title, ''])
-
-        config_template["output"]["src"] = "/".join(["","opt","wsi","output", product_title, ""])
-        config_template["output"]["dst"] = output_dst_path
+        sigma0 = self._parse_sigma0(self.sigma0_name, year, month, day)
+        product_title = f"CLMS_WSI_WIC_060m_T{self.tile_id}_{sigma0.date}T{sigma0.time}_{sigma0.mission}_V100"
 
         # Check existence of FMI_WINDSPEED and FMI_TEMPERATURE dynamic auxiliaries files
-        # If at least one of them not exists, return
+        # If at least one of them not exists, return before the template is even loaded
         # temperature example: 's3://HRWSI-AUX/FMI_TEMPERATURE/20250126_t2m_sum.nc'
         # wind example: 's3://HRWSI-AUX/FMI_WINDSPEED/20250126_wind_speed.nc'
-
-        unavailable_dynamic_aux = []
+        windspeed_filename_path = f"FMI_WINDSPEED/{year}{month}{day}_wind_speed.nc"
+        temperature_filename_path = f"FMI_TEMPERATURE/{year}{month}{day}_t2m_sum.nc"
         filenames_path = [windspeed_filename_path, temperature_filename_path]
         bucket_name = self.S3_AUX_ROOT[5:]
 
         try:
-            # Get the security credentials needed to connect to the S3
-            vault_client = VaultClient()
-            s3_credentials = vault_client.read_secret('s3cfg_HRWSI')
-            s3_access_key_id = s3_credentials['access_key']
-            s3_secret_access_key = s3_credentials['secret_key']
-            endpoint_url = s3_credentials['endpoint_url']
-            region_name = s3_credentials['region_name']
-
-            # Connect to the S3
-            s3_client = S3Client(s3_access_key_id, s3_secret_access_key, endpoint_url, region_name)
+            fmi_cache_key = (bucket_name, FMI_AUXILIARIES_PREFIX)
+            available_keys = _fmi_auxiliaries_keys_cache.get(fmi_cache_key, frozenset())
+            if not all(path in available_keys for path in filenames_path):
+                available_keys = _list_keys(get_s3_client(), bucket_name, FMI_AUXILIARIES_PREFIX)
+                _fmi_auxiliaries_keys_cache.set(fmi_cache_key, available_keys)
 
-            for dynamic_auxiliary_path in filenames_path:
-                if not s3_client.check_file_exists(bucket_name, dynamic_auxiliary_path):
-                    unavailable_dynamic_aux.append(dynamic_auxiliary_path)
+            unavailable_dynamic_aux = [path for path in filenames_path if path not in available_keys]
 
             if unavailable_dynamic_aux:
                 self.logger.info(f"The following dynamic auxiliaries are not available for the product {product_title}: {unavailable_dynamic_aux}")
                 return True
         except RuntimeError as error:
+            # Credentials may have been rotated: rebuild the client on the next call
+            reset_s3_client()
             raise RuntimeError from error
 
-        #### Setting up log path section
-        logs_out_path="/".join([self.S3_LOGS_ROOT,"WIC_S1",self.tile_id,year,month,day,f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_title}.stdout.log"])
-        logs_err_path="/".join([self.S3_LOGS_ROOT,"WIC_S1",self.tile_id,year,month,day,f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_title}.stderr.log"])
+        config_template = self._get_template()
+
+        #### Setting up auxiliaries section
+        grassland_name = f"GRA_2018_010m_eu_03035_V1_0_60m_{self.tile_id}.tif"
+        config_template["auxiliaries"]["GRASSLAND"] = f"{self.S3_AUX_ROOT}/GRASSLAND/60m/{grassland_name}"
 
-        config_template["log"]["STDOUT"]["src"] = "/".join(["","opt","wsi","logs","processing_routine.stdout.log"])
-        config_template["log"]["STDOUT"]["dst"] = logs_out_path
+        imperviousness_name = f"IMD_2018_010m_eu_03035_V2_0_60m_{self.tile_id}.tif"
+        config_template["auxiliaries"]["IMPERVIOUSNESS"] = f"{self.S3_AUX_ROOT}/IMPERVIOUSNESS/60m/{imperviousness_name}"
 
-        config_template["log"]["STDERR"]["src"] = "/".join(["","opt","wsi","logs","processing_routine.stderr.log"])
-        config_template["log"]["STDERR"]["dst"] = logs_err_path
+        tree_cover_density_name = f"TCD_2018_010m_eu_03035_V2_0_60m_{self.tile_id}.tif"
+        config_template["auxiliaries"]["TREE_COVER"] = f"{self.S3_AUX_ROOT}/TCD/60m/{tree_cover_density_name}"
 
-        config_template["qas"]["src"] = "/".join(["","opt","wsi","output",product_title+"_QAS.yaml"])
-        config_template["qas"]["dst"] = "/".join([self.S3_QAS_ROOT,self.tile_id, year, month, day,product_title+"_QAS.yaml"])
+        water_layer_name = f"WL_2018_60m_{self.tile_id}.tif"
+        config_template["auxiliaries"]["WATER_LAYER"] = f"{self.S3_AUX_ROOT}/WL/60m/{water_layer_name}"
 
-        #### Writting the configuration file to /opt/wsi/config/configuration_file.yml
-        with open("/".join(["","tmp","configuration_file.yml"]),
-                  "w+", encoding="UTF-8") as config_stream:
-            yaml.safe_dump(config_template, config_stream, encoding="UTF-8")
+        ## Storing data into template
+        tile_date_path = f"{self.tile_id}/{year}/{month}/{day}"
+        config_template["tile_id"] = self.tile_id
+        config_template["input"]["SIGMA0"] = f"{self.S3_SIGMA0_ROOT}/{tile_date_path}/{self.sigma0_name}"
+        config_template["input"]["CLASSIFICATION_COEFFICIENTS"] = f"{self.S3_AUX_ROOT}/WIC_S1_CLASSIFICATION_COEFFICIENTS/cc_60m_{self.tile_id}.tif"
+        s1_radar_shadow_layover_name = f"S1_RADAR_SHADOW_LAYOVER_T{self.tile_id}_60m_t{sigma0.orbit}_V20240827.tif"
+        config_template["input"]["RADARSHADOW"] = f"{self.S3_AUX_ROOT}/S1_RADAR_SHADOW_LAYOVER/{s1_radar_shadow_layover_name}"
+        config_template["input"]["TEMPERATURE"] = f"{self.S3_AUX_ROOT}/{temperature_filename_path}"
+        config_template["input"]["WATER_CATEGORY"] = f"{self.S3_AUX_ROOT}/WIC_S1_WATER_CLASSIFICATION/wc_60m_{self.tile_id}.tif"
+        config_template["input"]["WIND_SPEED"] = f"{self.S3_AUX_ROOT}/{windspeed_filename_path}"
+
+        self._populate_common(config_template, product_title, "WIC_S1", self.S3_WIC_S1_ROOT, year, month, day, now_str)
+
+        #### Writting the configuration file to /tmp/configuration_file.yml
+        self._write_configuration_file(config_template)
 
         return False
 
@@ -1,14 +1,10 @@
 #!/usr/bin/env python3
 """This script is to be used at integration stage to generate configuration YAML files at will."""
 
-import logging
 from datetime import datetime
 from typing import List
 
-import yaml
-
-from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator
-from magellium.hrwsi.utils.logger import LogUtil
+from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator, MIN_MEASUREMENT_DATE, parse_ymd
 
 
 class WICS1S2ConfigFileGenerator(AbstractConfigurationFileGenerator):
@@ -19,16 +15,18 @@ class WICS1S2ConfigFileGenerator(AbstractConfigurationFileGenerator):
     S3_WICS1_ROOT="s3://HRWSI/WIC_S1"
     S3_WICS2_ROOT="s3://HRWSI/WIC_S2"
     S3_QAS_ROOT="s3://HRWSI-KPI-FILES/WIC_S1S2"
-    WORK_DIR = "/".join(["","opt","wsi"])
+    WORK_DIR = "/opt/wsi"
     PRODUCT_VERSION="V100"
 
+    # Constant path prefixes, joined once at class-load time
+    WORK_DIR_TEMP_PREFIX = f"{WORK_DIR}/temp/"
+
     def __init__(self, tile_id:str,
                  measurement_date:str,
                  wic_s1_list:List[str],
                  wic_s2_list:List[str],
                  hour:str) -> None:
         """Initialization function."""
-        self.logger = LogUtil.get_logger("WIC S1 S2 ConfigFileGenerator", logging.INFO)
         super().__init__(tile_id)
         self.wic_s1_list = wic_s1_list
         self.wic_s2_list = wic_s2_list
@@ -41,36 +39,34 @@ class WICS1S2ConfigFileGenerator(AbstractConfigurationFileGenerator):
         with values depending on the calss attributes for the WIC S1S2 processing routine execution.
         """
 
-        with open("/".join(["HRWSI_System","launcher","config_file_generation","configuration_file_template.yml"]),
-                "r",
-                encoding="UTF-8") as config_template_stream:
-            config_template = yaml.safe_load(config_template_stream)
+        config_template = self._get_template()
+        # A single timestamp for the whole build, so that the STDOUT and STDERR log paths match
+        now = datetime.now()
+        now_str = now.strftime('%Y%m%dT%H%M%S')
 
         #### Setting up measurement date section
         ## Checking input data
         try:
-            date = datetime.strptime(self.measurement_date,"%Y-%m-%d")
-            assert datetime.now() > date > datetime(2016,8,1)
-
-        ## Storing data into template
+            year, month, day, date = parse_ymd(self.measurement_date)
         except ValueError as error:
-            self.logger.critical( f"Wrong format for measurement date, should be YYYY-mm-dd, got {self.measurement_date}.")
-            raise error
-        except AssertionError as error:
-            self.logger.critical(f"Measurement date must be contained between {datetime(2016,8,1)} and {datetime.now()}, got {date}")
+            self.logger.critical(f"Wrong format for measurement date, should be YYYY-mm-dd, got {self.measurement_date}.")
             raise error
+        if not (now > date > MIN_MEASUREMENT_DATE):
+            self.logger.critical(f"Measurement date must be contained between {MIN_MEASUREMENT_DATE} and {now}, got {date}")
+            raise AssertionError(f"Measurement date {self.measurement_date} out of range")
 
         ##### Setting up INPUT path section
         ## Storing data into template
-        config_template["input"]["measurement_date"] = datetime.strftime(date,"%Y%m%d")
+        date_ymd = f"{year}{month}{day}"
+        config_template["input"]["measurement_date"] = date_ymd
         config_template["input"]["S2_tile"] = self.tile_id
 
-        config_template["input"]["WIC_S1"] = [wic_s1_name for wic_s1_name in self.wic_s1_list]
-        config_template["input"]["WIC_S2"] = [wic_s2_name for wic_s2_name in self.wic_s2_list]
+        config_template["input"]["WIC_S1"] = list(self.wic_s1_list)
+        config_template["input"]["WIC_S2"] = list(self.wic_s2_list)
         
         #### Setting up auxiliaries section
-        water_mask_name = "".join(["WL_2018_20m_",self.tile_id,".tif"])
-        config_template["auxiliaries"]["WATER_MASK"] = "/".join([self.S3_AUX_ROOT,"WL","20m",water_mask_name])
+        water_mask_name = f"WL_2018_20m_{self.tile_id}.tif"
+        config_template["auxiliaries"]["WATER_MASK"] = f"{self.S3_AUX_ROOT}/WL/20m/{water_mask_name}"
 
         #### Setting up output path section
         if int(self.hour) < 12:
@@ -78,36 +74,29 @@ class WICS1S2ConfigFileGenerator(AbstractConfigurationFileGenerator):
         else:
             date_time = "120000"
 
-        product_name = "_".join(["CLMS","WSI","WIC","020m",f"T{self.tile_id}",
-                                    f"{datetime.strftime(date,'%Y%m%d')}T{date_time}P12H",
-                                    "COMB",
-                                    self.PRODUCT_VERSION])
+        product_name = f"CLMS_WSI_WIC_020m_T{self.tile_id}_{date_ymd}T{date_time}P12H_COMB_{self.PRODUCT_VERSION}"
 
-        year, month, day = self.measurement_date.split("-")
-        output_dst_path = "/".join([self.S3_WICS1S2_ROOT,self.tile_id, year, month, day, product_name, ''])
+        tile_date_path = f"{self.tile_id}/{year}/{month}/{day}"
+        output_dst_path = f"{self.S3_WICS1S2_ROOT}/{tile_date_path}/{product_name}/"
 
-        config_template["output"]["src"] = "/".join([self.WORK_DIR,"output", product_name, ""])
+        config_template["output"]["src"] = f"{self.WORK_DIR_OUTPUT}/{product_name}/"
         config_template["output"]["dst"] = output_dst_path
 
         #### Setting up log path section
-        logs_out_path="/".join([self.S3_LOGS_ROOT,"WIC_S1S2",self.tile_id,year,month,day,f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_name}.stdout.log"])
-        logs_err_path="/".join([self.S3_LOGS_ROOT,"WIC_S1S2",self.tile_id,year,month,day,f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_name}.stderr.log"])
+        logs_out_path, logs_err_path = self._build_log_paths("WIC_S1S2", product_name, year, month, day, now_str)
 
-        config_template["log"]["STDOUT"]["src"] = "/".join([self.WORK_DIR,"logs","processing_routine.stdout.log"])
+        config_template["log"]["STDOUT"]["src"] = self.STDOUT_LOG_SRC
         config_template["log"]["STDOUT"]["dst"] = logs_out_path
 
-        config_template["log"]["STDERR"]["src"] = "/".join([self.WORK_DIR,"logs","processing_routine.stderr.log"])
+        config_template["log"]["STDERR"]["src"] = self.STDERR_LOG_SRC
         config_template["log"]["STDERR"]["dst"] = logs_err_path
 
         #### Setting up KPI path section
-        config_template["qas"]["src"] = "/".join([self.WORK_DIR,"temp",product_name+'temp',product_name+"_QAS.yaml"])
-        config_template["qas"]["dst"] = "/".join([self.S3_QAS_ROOT,self.tile_id, year, month, day,product_name+"_QAS.yaml"])
+        config_template["qas"]["src"] = f"{self.WORK_DIR_TEMP_PREFIX}{product_name}temp/{product_name}_QAS.yaml"
+        config_template["qas"]["dst"] = f"{self.S3_QAS_ROOT}/{tile_date_path}/{product_name}_QAS.yaml"
 
         #### Writting the configuration file to /tmp/configuration_file.yml
-        with open("/".join(["","tmp","configuration_file.yml"]),
-                  "w+", encoding="UTF-8") as config_stream:
-            yaml.safe_dump(config_template, config_stream, encoding="UTF-8")
-        return
+        self._write_configuration_file(config_template, sort_keys=True)
 
 if __name__ == "__main__": # pragma no cover
 
@@ -1,32 +1,34 @@
 #!/usr/bin/env python3
 """This script is to be used at integration stage to generate configuration YAML files at will."""
 
-import logging
+import re
 from datetime import datetime
 
-import yaml
+from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator, MIN_MEASUREMENT_DATE, parse_ymd
 
-from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import AbstractConfigurationFileGenerator
-from magellium.hrwsi.utils.logger import LogUtil
+
+# e.g. SENTINEL2B_20201215-103755-817_L2A_T32TMS_C_V1-0
+L2A_NAME_PATTERN = re.compile(r"^(?P<mission>[^_]*)_(?P<date>[^_-]*)-(?P<time>[^_-]*)[^_]*_[^_]*_(?P<tile>[^_]*)")
 
 
 class WICS2ConfigFileGenerator(AbstractConfigurationFileGenerator):
     """Main class of the YAML config file generator for the WIC S2 processing routine.
     """
 
-    S3_AUX_ROOT="s3://HRWSI-AUX"
     S3_WIC_S2_ROOT="s3://HRWSI/WIC_S2"
     S3_L2A_ROOT="s3://HRWSI-INTERMEDIATE-RESULTS/L2A"
     S3_QAS_ROOT="s3://HRWSI-KPI-FILES/WIC_S2"
-    S3_LOGS_ROOT="s3://HRWSI-LOGS"
-    WORK_DIR = "/".join(["","opt","wsi"])
+    WORK_DIR = "/opt/wsi"
     PRODUCT_VERSION="V100"
+    S2_MISSION_ID: frozenset = frozenset({"S2A", "S2B", "S2C"})
+
+    # Constant path prefixes, joined once at class-load time
+    WORK_DIR_TEMP_PREFIX = f"{WORK_DIR}/temp/"
 
     def __init__(self, tile_id:str,
                  measurement_date:str,
                  l2a_name:str) -> None:
         """Initialization function."""
-        self.logger = LogUtil.get_logger("WICS2ConfigFileGenerator", logging.INFO)
         super().__init__(tile_id)
         self.tile_id = tile_id
         self.l2a_name = l2a_name
@@ -37,82 +39,76 @@ class WICS2ConfigFileGenerator(AbstractConfigurationFileGenerator):
         depending on the calss attributes for the WIC S2 processing routine execution.
         """
 
-        with open("/".join(["HRWSI_System","launcher","config_file_generation","configuration_file_template.yml"]),
-                "r",
-                encoding="UTF-8") as config_template_stream:
-            config_template = yaml.safe_load(config_template_stream)
+        config_template = self._get_template()
+        # A single timestamp for the whole build, so that the STDOUT and STDERR log paths match
+        now = datetime.now()
+        now_str = now.strftime('%Y%m%dT%H%M%S')
 
         #### Setting up auxiliaries section
-        dem_name = "".join(["Copernicus_DSM_04_N02_00_00_DEM_20m_",self.tile_id,".tif"])
-        config_template["auxiliaries"]["DEM"] = "/".join([self.S3_AUX_ROOT,"DEM","20m",dem_name])
+        dem_name = f"Copernicus_DSM_04_N02_00_00_DEM_20m_{self.tile_id}.tif"
+        config_template["auxiliaries"]["DEM"] = f"{self.S3_AUX_ROOT}/DEM/20m/{dem_name}"
 
-        water_layer_name = "".join(["WL_2018_20m_",self.tile_id,".tif"])
-        config_template["auxiliaries"]["WATER_LAYER"] = "/".join([self.S3_AUX_ROOT,"WL","20m",water_layer_name])
+        water_layer_name = f"WL_2018_20m_{self.tile_id}.tif"
+        config_template["auxiliaries"]["WATER_LAYER"] = f"{self.S3_AUX_ROOT}/WL/20m/{water_layer_name}"
 
-        slope_name = "_".join(["S2__TEST_AUX_REFDE2",self.tile_id,"1001_SLP_R2.TIF"])
-        slope_directory = "_".join(["S2__TEST_AUX_REFDE2",self.tile_id,"1001.DBL.DIR"])
-        config_template["auxiliaries"]["SLOPE"] = "/".join([self.S3_AUX_ROOT,"DTM",self.tile_id, slope_directory, slope_name])
+        slope_name = f"S2__TEST_AUX_REFDE2_{self.tile_id}_1001_SLP_R2.TIF"
+        slope_directory = f"S2__TEST_AUX_REFDE2_{self.tile_id}_1001.DBL.DIR"
+        config_template["auxiliaries"]["SLOPE"] = f"{self.S3_AUX_ROOT}/DTM/{self.tile_id}/{slope_directory}/{slope_name}"
 
         #### Setting up measurement date section
         ## Checking input data
         try:
-            date = datetime.strptime(self.measurement_date,"%Y-%m-%d")
-            assert datetime.now() >= date >= datetime(2016,8,1)
-
-        ## Storing data into template
+            year, month, day, date = parse_ymd(self.measurement_date)
         except ValueError as error:
-            self.logger.critical( f"Wrong format for measurement date, should be YYYY-mm-dd, got {self.measurement_date}.")
-            raise error
-        except AssertionError as error:
-            self.logger.critical(f"Measurement date must be contained between {datetime(2016,8,1)} and {datetime.now()}, got {date}")
+            self.logger.critical(f"Wrong format for measurement date, should be YYYY-mm-dd, got {self.measurement_date}.")
             raise error
-        config_template["date"] = datetime.strftime(date,"%Y%m%d")
+        if not (now >= date >= MIN_MEASUREMENT_DATE):
+            self.logger.critical(f"Measurement date must be contained between {MIN_MEASUREMENT_DATE} and {now}, got {date}")
+            raise AssertionError(f"Measurement date {self.measurement_date} out of range")
+
+        ## Storing data into template
+        config_template["date"] = f"{year}{month}{day}"
 
         ##### Setting up L2A path section
         ## Checking input data
-        year, month, day = self.measurement_date.split("-")
-        l2a_mission_id = f"S{self.l2a_name.split('_', maxsplit=1)[0][-2:]}"
-        l2a_measurement_day = self.l2a_name.split("-", maxsplit=1)[0].split("_")[1]
-        l2a_measurement_time = self.l2a_name.split("-", maxsplit=2)[1]
-        l2a_tile_id = self.l2a_name.split("_")[3]
-        try:
-            assert "".join([year, month, day]) == l2a_measurement_day
-            assert l2a_mission_id in ["S2A", "S2B", "S2C"]
-            assert l2a_tile_id[1:] == self.tile_id
-        except AssertionError as error:
-            raise error
+        l2a_match = L2A_NAME_PATTERN.match(self.l2a_name)
+        if l2a_match is None:
+            self.logger.critical("Wrong L2A name provided: %s", self.l2a_name)
+            raise ValueError(f"Malformed L2A name: {self.l2a_name}")
+        l2a_mission, l2a_measurement_day, l2a_measurement_time, l2a_tile_id = l2a_match.group("mission", "date", "time", "tile")
+        l2a_mission_id = f"S{l2a_mission[-2:]}"
+        if (l2a_measurement_day != f"{year}{month}{day}"
+                or l2a_mission_id not in self.S2_MISSION_ID
+                or l2a_tile_id[1:] != self.tile_id):
+            self.logger.critical("Wrong L2A name provided: %s", self.l2a_name)
+            raise AssertionError(f"L2A {self.l2a_name} does not match mission {sorted(self.S2_MISSION_ID)}, date {year}{month}{day} and tile {self.tile_id}")
         ## Storing data into template
-        config_template["input"]["L2A"] = "/".join([self.S3_L2A_ROOT, l2a_tile_id[1:], year, month, day, self.l2a_name])
+        tile_date_path = f"{self.tile_id}/{year}/{month}/{day}"
+        config_template["input"]["L2A"] = f"{self.S3_L2A_ROOT}/{tile_date_path}/{self.l2a_name}"
 
         #### Setting up output path section
-        product_name = "_".join(["CLMS","WSI","WIC","020m",
-                                 f"T{self.tile_id}","T".join([l2a_measurement_day, l2a_measurement_time]),
-                                 l2a_mission_id,self.PRODUCT_VERSION])
+        product_name = f"CLMS_WSI_WIC_020m_T{self.tile_id}_{l2a_measurement_day}T{l2a_measurement_time}_{l2a_mission_id}_{self.PRODUCT_VERSION}"
 
-        output_dst_path = "/".join([self.S3_WIC_S2_ROOT,self.tile_id, year, month, day, ''])
+        output_dst_path = f"{self.S3_WIC_S2_ROOT}/{tile_date_path}/"
 
-        config_template["output"]["src"] = "/".join([self.WORK_DIR,"output",product_name])
+        config_template["output"]["src"] = f"{self.WORK_DIR_OUTPUT}/{product_name}"
         config_template["output"]["dst"] = output_dst_path
 
         #### Setting up log path section
-        logs_out_path="/".join([self.S3_LOGS_ROOT,"WIC_S2",self.tile_id,year,month,day,f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_name}.stdout.log"])
-        logs_err_path="/".join([self.S3_LOGS_ROOT,"WIC_S2",self.tile_id,year,month,day,f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{product_name}.stderr.log"])
+        logs_out_path, logs_err_path = self._build_log_paths("WIC_S2", product_name, year, month, day, now_str)
 
-        config_template["log"]["STDOUT"]["src"] = "/".join([self.WORK_DIR,"logs","processing_routine.stdout.log"])
+        config_template["log"]["STDOUT"]["src"] = self.STDOUT_LOG_SRC
         config_template["log"]["STDOUT"]["dst"] = logs_out_path
 
-        config_template["log"]["STDERR"]["src"] = "/".join([self.WORK_DIR,"logs","processing_routine.stderr.log"])
+        config_template["log"]["STDERR"]["src"] = self.STDERR_LOG_SRC
         config_template["log"]["STDERR"]["dst"] = logs_err_path
 
         #### Setting up KPI path section
-        config_template["qas"]["src"] = "/".join([self.WORK_DIR, "temp", product_name + "_temp", product_name+"_QAS.yaml"])
-        config_template["qas"]["dst"] = "/".join([self.S3_QAS_ROOT,self.tile_id, year, month, day,product_name+"_QAS.yaml"])
+        config_template["qas"]["src"] = f"{self.WORK_DIR_TEMP_PREFIX}{product_name}_temp/{product_name}_QAS.yaml"
+        config_template["qas"]["dst"] = f"{self.S3_QAS_ROOT}/{tile_date_path}/{product_name}_QAS.yaml"
 
         #### Writing the configuration file to /tmp/configuration_file.yml
-        with open("/".join(["","tmp","configuration_file.yml"]),
-                  "w+", encoding="UTF-8") as config_stream:
-            yaml.safe_dump(config_template, config_stream, encoding="UTF-8")
-        return
+        self._write_configuration_file(config_template, sort_keys=True)
 
 if __name__ == "__main__": # pragma no cover
 
@@ -1,14 +1,16 @@
-from magellium.hrwsi.system.harvesters.application.ports.inputs.user_interface import UserInterface
-from magellium.hrwsi.system.harvesters.infrastructure.adapters.outputs.repository import HarvesterRepository, PostgreSqlHarvesterRepository
-from magellium.hrwsi.system.harvesters.application.ports.outputs.notifier import Notifier
-from magellium.hrwsi.system.harvesters.application.business.services.harvester import HarvesterService, HarvesterServiceImpl
+from magellium.hrwsi.system.launchers.application.ports.inputs.user_interface import UserInterface
+from magellium.hrwsi.system.launchers.application.ports.outputs.repository import LauncherRepository
+from magellium.hrwsi.system.launchers.infrastructure.adapters.outputs.repository import PostgreSqlLauncherRepository
+from magellium.hrwsi.system.launchers.application.business.services.launcher import LauncherService
+from magellium.hrwsi.system.launchers.application.business.services.launcher_factory import LauncherServiceFactory
 from magellium.hrwsi.system.common.modes import RunMode
-from magellium.hrwsi.system.harvesters.application.process_manager import HarvesterProcessManager
+from magellium.hrwsi.system.common.environment import EnvironmentVariablesSchema, load_environment_variables, parse_port, parse_run_mode
+from magellium.hrwsi.system.launchers.application.process_manager import LauncherProcessManager
 from magellium.hrwsi.system.common.logger import LoggerFactory
 
 
+from dataclasses import dataclass
 from enum import Enum
-from os import environ
 from datetime import datetime as DateTime
 
 
@@ -25,87 +27,76 @@ class EnvironmentVariablesNames(Enum):
     HRWSI_HARVESTER_ARCHIVE_END_DATE = "HRWSI_HARVESTER_ARCHIVE_END_DATE"
 
 
+@dataclass(slots=True)
+class Configuration:
+    run_mode: RunMode
+    database_host: str
+    database_port: int
+    database_username: str
+    database_password: str
+    database_name: str
+    archive_start_date: DateTime|None = None
+    archive_end_date: DateTime|None = None
+
+
+ENVIRONMENT_VARIABLES_SCHEMA: EnvironmentVariablesSchema = (
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_RUN_MODE, "run_mode", parse_run_mode, None, f"one of {[mode.value for mode in RunMode]}", True),
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_HOST, "database_host", str, None, "a string", True),
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_PORT, "database_port", parse_port, lambda port: 1 <= port <= 65534, "an integer between 1 and 65534", True),
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_USER, "database_username", str, None, "a string", True),
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_PASSWORD, "database_password", str, None, "a string", True),
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_NAME, "database_name", str, None, "a string", True),
+)
+
+# Only read in ARCHIVE mode, so that a stale value left in the environment cannot stop another run mode from starting
+ARCHIVE_ENVIRONMENT_VARIABLES_SCHEMA: EnvironmentVariablesSchema = (
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_ARCHIVE_START_DATE, "archive_start_date", DateTime.fromisoformat, None, "a date in the format YYYY-MM-DD", False),
+    (EnvironmentVariablesNames.HRWSI_HARVESTER_ARCHIVE_END_DATE, "archive_end_date", DateTime.fromisoformat, None, "a date in the format YYYY-MM-DD", False),
+)
+
+
+def load_configuration_from_environment() -> Configuration:
+    return Configuration(**load_environment_variables(ENVIRONMENT_VARIABLES_SCHEMA, ARCHIVE_ENVIRONMENT_VARIABLES_SCHEMA))
+
+
 class CommandLineUserInterface(UserInterface):
 
     LOGGER = LoggerFactory.get_logger(__name__)
 
 
     def __init__(self):
-        self.__manager: HarvesterProcessManager|None = None
+        self.__manager: LauncherProcessManager|None = None
 
     def start(self) -> None:
         if (self.__manager is None):
             self.LOGGER.info("Starting Command Line User Interface...")
 
-            run_mode_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_RUN_MODE.value)
-            if (run_mode_value is None):
-                raise ValueError("HRWSI_HARVESTER_RUN_MODE environment variable is not set")
-            run_mode: RunMode = RunMode.from_string(run_mode_value)
-
-            database_host_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_HOST.value)
-            if (database_host_value is None):
-                raise ValueError("HRWSI_HARVESTER_DATABASE_HOST environment variable is not set")
-            
-            database_port_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_PORT.value)
-            if (database_port_value is None):
-                raise ValueError("HRWSI_HARVESTER_DATABASE_PORT environment variable is not set")
-            try:
-                database_port_value = int(database_port_value)
-            except ValueError:
-                raise ValueError("HRWSI_HARVESTER_DATABASE_PORT environment variable must be an integer")
-            if ((database_port_value < 1) or (database_port_value > 65534)):
-                raise ValueError("HRWSI_HARVESTER_DATABASE_PORT environment variable must be between 1 and 65534")
-
-            database_username_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_USER.value)
-            if (database_username_value is None):
-                raise ValueError("HRWSI_HARVESTER_DATABASE_USER environment variable is not set")
-            
-            database_password_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_PASSWORD.value)
-            if (database_password_value is None):
-                raise ValueError("HRWSI_HARVESTER_DATABASE_PASSWORD environment variable is not set")
-            
-            database_name_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_DATABASE_NAME.value)
-            if (database_name_value is None):
-                raise ValueError("HRWSI_HARVESTER_DATABASE_NAME environment variable is not set")
-
-            archive_start_date_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_ARCHIVE_START_DATE.value)
-            archive_end_date_value: str | None = environ.get(EnvironmentVariablesNames.HRWSI_HARVESTER_ARCHIVE_END_DATE.value)
-
-
-            repository: HarvesterRepository = PostgreSqlHarvesterRepository(
-                host=database_host_value,
-                port=int(database_port_value),
-                username=database_username_value,
-                password=database_password_value,
-                database_name=database_name_value
+            configuration: Configuration = load_configuration_from_environment()
+
+            repository: LauncherRepository = PostgreSqlLauncherRepository(
+                host=configuration.database_host,
+                port=configuration.database_port,
+                username=configuration.database_username,
+                password=configuration.database_password,
+                database_name=configuration.database_name
             )
 
-            service: HarvesterService = HarvesterServiceImpl(
-                run_mode=run_mode, 
+            service: LauncherService = LauncherServiceFactory.create_launcher_service(
+                run_mode=configuration.run_mode,
                 repository=repository
             )
 
             archive_start_date: DateTime|None = None
             archive_end_date: DateTime|None = None
 
-            if (run_mode == RunMode.ARCHIVE):
-                if (archive_start_date_value is not None):
-                    try:
-                        archive_start_date = DateTime.fromisoformat(archive_start_date_value)
-                    except ValueError:
-                        raise ValueError("HRWSI_HARVESTER_ARCHIVE_START_DATE environment variable must be a date in the format YYYY-MM-DD")
-
-                if (archive_end_date_value is not None):
-                    try:
-                        archive_end_date = DateTime.fromisoformat(archive_end_date_value)
-                    except ValueError:
-                        raise ValueError("HRWSI_HARVESTER_ARCHIVE_END_DATE environment variable must be a date in the format YYYY-MM-DD")
-
+            if (configuration.run_mode == RunMode.ARCHIVE):
+                archive_start_date = configuration.archive_start_date
+                archive_end_date = configuration.archive_end_date
                 if (archive_start_date and archive_end_date and (archive_start_date > archive_end_date)):
                     raise ValueError("ARCHIVE start date must be earlier than end date")
 
 
-            self.__manager = HarvesterProcessManager(
+            self.__manager = LauncherProcessManager(
                 service=service,
                 harvest_from_date=archive_start_date,
                 harvest_to_date=archive_end_date
@@ -1,9 +1,88 @@
-from magellium.hrwsi.system.harvesters.application.ports.outputs.repository import HarvesterRepository
-
-class PostgreSqlHarvesterRepository(HarvesterRepository):
-    def __init__(self, host: str, port: int, username: str, password: str, database_name: str):
-        self.__host: str = host
-        self.__port: int = port
-        self.__username: str = username
-        self.__password: str = password
-        self.__database_name: str = database_name
\ No newline at end of file
+import psycopg2
+from psycopg2.extras import NamedTupleCursor
+from psycopg2.pool import ThreadedConnectionPool
+from collections.abc import Iterator
+from datetime import datetime as DateTime
+
+from magellium.hrwsi.system.launchers.application.ports.outputs.repository import LauncherRepository
+from magellium.hrwsi.system.core.sentinel_tiles import SELECT_SENTINEL_TILES, SENTINEL_TILES_TABLE, SentinelTile
+from magellium.hrwsi.system.common.logger import LoggerFactory
+from magellium.hrwsi.system.common.states import TileProcessState
+
+
+# Cheap emptiness probe: stops at the first matching row
+EXISTS_SENTINEL_TILES = f"SELECT 1 FROM {SENTINEL_TILES_TABLE}"
+
+
+class PostgreSqlLauncherRepository(LauncherRepository):
+
+    LOGGER = LoggerFactory.get_logger(__name__)
+    FETCH_SIZE: int = 2000
+
+    def __init__(self, host: str, port: int, username: str, password: str, database_name: str, minconn: int = 1, maxconn: int = 5):
+        dsn = f"host={host} port={port} user={username} password={password} dbname={database_name}"
+        self.__pool: ThreadedConnectionPool = ThreadedConnectionPool(minconn, maxconn, dsn)
+        self.LOGGER.info("SQL connection pool initialized [min=%s, max=%s]", minconn, maxconn)
+
+    def find_tiles_by_state_and_range(self, state: TileProcessState, from_date: DateTime|None = None, to_date: DateTime|None = None) -> Iterator[SentinelTile]:
+        self.LOGGER.info("Finding SentinelTiles with state: %s [from=%s, to=%s]", state.name, from_date, to_date)
+        return self.__find_in_range("state = %s", state.value, from_date, to_date)
+
+    def find_tiles_by_states(self, states: tuple[TileProcessState, ...], from_date: DateTime|None = None, to_date: DateTime|None = None) -> Iterator[SentinelTile]:
+        self.LOGGER.info("Finding SentinelTiles with states: %s [from=%s, to=%s]", [state.name for state in states], from_date, to_date)
+        return self.__find_in_range("state = ANY(%s)", [state.value for state in states], from_date, to_date)
+
+    def exists_tiles_by_states(self, states: tuple[TileProcessState, ...], from_date: DateTime|None = None, to_date: DateTime|None = None) -> bool:
+        query, parameters = self.__build_range_query(EXISTS_SENTINEL_TILES, "state = ANY(%s)", [state.value for state in states], from_date, to_date)
+        query += " LIMIT 1"
+        sql_connection: psycopg2.extensions.connection = self.__pool.getconn()
+        broken: bool = False
+        try:
+            with sql_connection.cursor() as sql_cursor:
+                self.LOGGER.debug("Executing SQL query: %s with parameters %s", query, parameters)
+                sql_cursor.execute(query, parameters)
+                exists: bool = sql_cursor.fetchone() is not None
+            sql_connection.commit()
+            return exists
+        except psycopg2.Error as exception:
+            broken = True
+            self.LOGGER.error("SQL error in query [%s] with params %s: %s", query, parameters, exception, exc_info=True)
+            raise
+        finally:
+            self.__pool.putconn(sql_connection, close=broken)
+
+    def __find_in_range(self, state_predicate: str, state_parameter: object, from_date: DateTime|None, to_date: DateTime|None) -> Iterator[SentinelTile]:
+        query, parameters = self.__build_range_query(SELECT_SENTINEL_TILES, state_predicate, state_parameter, from_date, to_date)
+        query += " ORDER BY acquisition_date"
+        return map(SentinelTile.map_from_named_tuple, self.__stream_query(query, parameters))
+
+    @staticmethod
+    def __build_range_query(select: str, state_predicate: str, state_parameter: object, from_date: DateTime|None, to_date: DateTime|None) -> tuple[str, tuple]:
+        query = f"{select} WHERE {state_predicate}"
+        parameters: list = [state_parameter]
+        # An unbounded side of the range is left out of the WHERE clause rather than compared to NULL
+        if (from_date is not None):
+            query += " AND acquisition_date >= %s"
+            parameters.append(from_date)
+        if (to_date is not None):
+            query += " AND acquisition_date < %s"
+            parameters.append(to_date)
+        return query, tuple(parameters)
+
+    def __stream_query(self, query: str, parameters: tuple) -> Iterator[tuple]:
+        sql_connection: psycopg2.extensions.connection = self.__pool.getconn()
+        broken: bool = False
+        try:
+            # Named cursor: rows stay server-side and are pulled FETCH_SIZE at a time
+            with sql_connection.cursor(name="launcher_tiles_cursor", cursor_factory=NamedTupleCursor) as sql_cursor:
+                sql_cursor.itersize = self.FETCH_SIZE
+                self.LOGGER.debug("Executing SQL query: %s with parameters %s", query, parameters)
+                sql_cursor.execute(query, parameters)
+                yield from sql_cursor
+            sql_connection.commit()
+        except psycopg2.Error as exception:
+            broken = True
+            self.LOGGER.error("SQL error in query [%s] with params %s: %s", query, parameters, exception, exc_info=True)
+            raise
+        finally:
+            self.__pool.putconn(sql_connection, close=broken)
@@ -1,34 +1,88 @@
+import heapq
 import time
 import os
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
+
+def _available_cpu_count() -> int|None:
+    """
+    Nombre de CPU utilisables par le processus, en tenant compte de l'affinité (taskset, cgroups cpuset).
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity n'existe pas sur toutes les plateformes (macOS, Windows)
+        return os.cpu_count()
+
+
+class _Job:
+    # pas de __dict__ par tâche : la boucle ne lit que next_time, puis func et ses arguments au déclenchement
+    __slots__ = ("interval", "func", "args", "kwargs", "next_time", "future")
+
+    def __init__(self, interval, func, args, kwargs):
+        self.interval = interval
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.next_time = 0.0
+        # dernière exécution soumise au pool, encore en attente ou en cours tant qu'elle n'est pas terminée
+        self.future = None
+
+
 class Scheduler:
     def __init__(self, max_workers: int|None = None):
         if max_workers is not None and max_workers < 1:
             raise ValueError("max_workers doit être supérieur ou égal à 1")
-        self.max_workers = max_workers or os.cpu_count()
+        self.max_workers = max_workers or _available_cpu_count()
         self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
         self.jobs = []
+        self._jobs_lock = threading.Lock()
         self._stop_event = threading.Event()
         self._thread = threading.Thread(target=self._run, daemon=True)
 
     def add_job(self, func, interval, *args, **kwargs):
         """
         Ajoute une tâche répétée toutes les `interval` secondes.
+        Un déclenchement est sauté tant que l'exécution précédente de la tâche n'est pas terminée.
+        """
+        with self._jobs_lock:
+            self.jobs.append(_Job(interval, func, args, kwargs))
+
+    def reschedule(self, func, interval):
+        """
+        Modifie l'intervalle d'une tâche déjà ajoutée, pris en compte à partir de sa prochaine exécution.
         """
-        self.jobs.append((interval, func, args, kwargs))
+        with self._jobs_lock:
+            for job in self.jobs:
+                if job.func == func:
+                    job.interval = interval
+                    return
+        raise ValueError("Tâche inconnue du scheduler")
 
     def _run(self):
-        next_times = [time.time() + interval for interval, *_ in self.jobs]
+        now = time.time()
+        for job in self.jobs:
+            job.next_time = now + job.interval
+        # tas de (prochaine exécution, indice de la tâche) : la tâche la plus proche est toujours en tête
+        heap = [(job.next_time, i) for i, job in enumerate(self.jobs)]
+        heapq.heapify(heap)
         while not self._stop_event.is_set():
-            now = time.time()
-            for i, (interval, func, args, kwargs) in enumerate(self.jobs):
-                if now >= next_times[i]:
-                    # planifier l’exécution dans le pool
-                    self.executor.submit(func, *args, **kwargs)
-                    next_times[i] += interval
-            time.sleep(0.01)  # petite pause pour éviter de brûler du CPU
+            if not heap:
+                self._stop_event.wait()
+                break
+            _, i = heap[0]
+            job = self.jobs[i]
+            wait = job.next_time - time.time()
+            # attente sur l'événement plutôt que time.sleep, pour que stop() réveille la boucle immédiatement
+            if wait > 0 and self._stop_event.wait(wait):
+                break
+            # planifier l’exécution dans le pool, sauf si la précédente est encore en attente ou en cours :
+            # deux exécutions de la même tâche ne se chevauchent ni ne s'accumulent dans la file du pool
+            if job.future is None or job.future.done():
+                job.future = self.executor.submit(job.func, *job.args, **job.kwargs)
+            job.next_time += job.interval
+            heapq.heapreplace(heap, (job.next_time, i))
 
     def start(self):
         self._thread.start()
@@ -1,8 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-
-import boto3
-from retry import retry
+from threading import Lock
 
 from magellium.hrwsi.system.common.logger import LoggerFactory
 
@@ -21,31 +19,62 @@ class S3ServiceProvider(ABC):
 
 class S3Client(S3ServiceProvider):
     __instances = {}
+    __instances_lock = Lock()
     
     LOGGER = LoggerFactory.get_logger(__name__)
 
-    def __new__(cls, endpoint_url: str, access_key: str, secret_key: str, region: str):
-        key = (endpoint_url, access_key, secret_key, region)
-        if key not in cls.__instances:
-            cls.__instances[key] = super().__new__(cls)
-        return cls.__instances[key]
+    TRANSFER_MAX_CONCURRENCY = 8
+    TRANSFER_MULTIPART_THRESHOLD = 64 * 1024 * 1024
+
+    def __new__(cls, endpoint_url: str, access_key_id: str, secret_access_key: str, region_name: str):
+        # The secret is not part of the key: a rotated secret rebuilds the client of the same instance
+        key = (endpoint_url, access_key_id, region_name)
+        with cls.__instances_lock:
+            if key not in cls.__instances:
+                instance = super().__new__(cls)
+                instance.__secret_access_key: str|None = None
+                instance.__init_lock: Lock = Lock()
+                cls.__instances[key] = instance
+            return cls.__instances[key]
     
     
     def __init__(self, endpoint_url: str, access_key_id: str, secret_access_key: str, region_name: str):
-        self.s3 = boto3.resource(
+        # Concurrent first calls build the client once, the other threads wait for it and reuse it
+        with self.__init_lock:
+            if (self.__secret_access_key == secret_access_key):
+                # Already initialized with these credentials: keep the client and its connection pool
+                return
+            self.__build_client(endpoint_url, access_key_id, secret_access_key, region_name)
+
+    def __build_client(self, endpoint_url: str, access_key_id: str, secret_access_key: str, region_name: str) -> None:
+        # Imported on first use only: boto3 loads hundreds of modules that a process without S3 access never needs
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config
+
+        # Objects above the threshold are split in parts, transferred concurrently over the pooled connections
+        self.__transfer_config = TransferConfig(multipart_threshold=self.TRANSFER_MULTIPART_THRESHOLD,
+                                                max_concurrency=self.TRANSFER_MAX_CONCURRENCY, use_threads=True)
+        self.s3 = boto3.client(
                 service_name='s3',
                 aws_access_key_id=access_key_id,
                 aws_secret_access_key=secret_access_key,
                 endpoint_url=endpoint_url,
-                region_name=region_name
+                region_name=region_name,
+                config=Config(
+                    max_pool_connections=2 * self.TRANSFER_MAX_CONCURRENCY,
+                    # Botocore retries on the pooled connection, and backs off when the endpoint throttles
+                    retries={"max_attempts": 3, "mode": "adaptive"}
+                )
             )
+        self.__secret_access_key = secret_access_key
 
         self.LOGGER.info("S3 client initialized and authenticated")
 
-    @retry(tries=3, delay=2, backoff=2, jitter=(1, 3))
-    def download_file(self, bucket_name: str, source_file_path: str, destination_file_path: Path):
-        return super().download_file()
+    def download_file(self, bucket_name: str, source_file_path: str, destination_file_path: Path) -> Path:
+        self.s3.download_file(Bucket=bucket_name, Key=source_file_path, Filename=str(destination_file_path), Config=self.__transfer_config)
+        return destination_file_path
     
-    @retry(tries=3, delay=2, backoff=2, jitter=(1, 3))
-    def upload_file(self, bucket_name: str, source_file_path: Path, destination_file_path: str):
-        return super().upload_file()
\ No newline at end of file
+    def upload_file(self, bucket_name: str, source_file_path: Path, destination_file_path: str) -> Path:
+        self.s3.upload_file(Filename=str(source_file_path), Bucket=bucket_name, Key=destination_file_path, Config=self.__transfer_config)
+        return source_file_path
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from threading import Lock
+from time import monotonic
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-from hvac import Client
 from retry import retry
 from magellium.hrwsi.system.common.logger import LoggerFactory
 
@@ -12,35 +14,80 @@ class VaultServiceProvider(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def read_secret(self, key: str, path: str) -> Optional[dict[str, str]]:
+    def read_secret(self, key: str, path: str) -> Optional[Mapping[str, str]]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def clear_secrets_cache(self) -> None:
         raise NotImplementedError()
 
 
 class HashcorpVaultClient(VaultServiceProvider):
 
     __instances = {}
+    __instances_lock = Lock()
 
     LOGGER = LoggerFactory.get_logger(__name__)
 
+    # Cached secrets are read again from Vault after this delay, so that rotated credentials are picked up
+    SECRETS_CACHE_TTL_IN_SECONDS: float = 60.0
+
     def __new__(cls, url: str, token: str):
         key = (url, token)
-        if key not in cls.__instances:
-            cls.__instances[key] = super().__new__(cls)
-        return cls.__instances[key]
+        with cls.__instances_lock:
+            if key not in cls.__instances:
+                instance = super().__new__(cls)
+                # Created once per singleton so that re-running __init__ keeps the cached secrets
+                instance.__secrets_cache: dict[tuple[str, str], tuple[float, Mapping[str, str]]] = {}
+                instance.__secrets_cache_lock: Lock = Lock()
+                instance.__client = None
+                instance.__init_lock: Lock = Lock()
+                cls.__instances[key] = instance
+            return cls.__instances[key]
 
     def __init__(self, url: str, token: str):
-        self.__url: str = url
-        self.__token: str = token
-        self.__client: Client = Client(url=self.__url, token=self.__token)
-
-        if not self.__client.is_authenticated():
-            error_message = "Vault client is not authenticated at init"
-            self.LOGGER.error(error_message)
-            raise RuntimeError(error_message)
+        # Concurrent first calls authenticate once, the other threads wait for it and reuse the client
+        with self.__init_lock:
+            if (self.__client is not None):
+                # Already authenticated: url and token are the singleton key, so nothing can have changed
+                return
+
+            # Imported on first use only, hvac and its requests stack are not needed until a client is built
+            from hvac import Client
+
+            client: Client = Client(url=url, token=token)
+            if not client.is_authenticated():
+                error_message = "Vault client is not authenticated at init"
+                self.LOGGER.error(error_message)
+                raise RuntimeError(error_message)
+            self.__url: str = url
+            self.__token: str = token
+            self.__client = client
         self.LOGGER.info("Vault client initialized and authenticated")
 
+    def read_secret(self, key: str, path: str = "secrets") -> Optional[Mapping[str, str]]:
+        """
+        Lire un secret depuis Vault, au plus une fois par couple (path, key) pendant SECRETS_CACHE_TTL_IN_SECONDS
+        """
+        cache_key = (path, key)
+        with self.__secrets_cache_lock:
+            now = monotonic()
+            cached = self.__secrets_cache.get(cache_key)
+            if ((cached is None) or (cached[0] <= now)):
+                secret = MappingProxyType(dict(self.__fetch_secret(key, path)))
+                self.__secrets_cache[cache_key] = (now + self.SECRETS_CACHE_TTL_IN_SECONDS, secret)
+            else:
+                secret = cached[1]
+                self.LOGGER.debug(f"Secret '{key}' served from cache")
+        return secret
+
+    def clear_secrets_cache(self) -> None:
+        with self.__secrets_cache_lock:
+            self.__secrets_cache.clear()
+        self.LOGGER.info("Vault secrets cache cleared")
+
     @retry(tries=3, delay=2, backoff=2, jitter=(1, 3))
-    def read_secret(self, key: str, path: str = "secrets") -> Optional[dict[str, str]]:
+    def __fetch_secret(self, key: str, path: str) -> dict[str, str]:
         """
         Lire un secret depuis Vault avec retry automatique
         """
@@ -0,0 +1,140 @@
+import logging
+import unittest
+from datetime import datetime
+
+from magellium.hrwsi.system.launchers.configuration_file_generators.cc_config_file_generator import (
+    L1C_NAME_PATTERN,
+    L2A_NAME_PATTERN
+)
+from magellium.hrwsi.system.launchers.configuration_file_generators.configuration_file_generator import (
+    SIGMA0_NAME_PATTERN,
+    Sigma0Info,
+    parse_ymd
+)
+from magellium.hrwsi.system.launchers.configuration_file_generators.sig0_config_file_generator import GRD_NAME_PATTERN
+from magellium.hrwsi.system.launchers.configuration_file_generators.sws_config_file_generator import SWSConfigFileGenerator
+
+
+SIGMA0_NAME = "SIG0_20211227T052658_20211227T052723_04E503_022_T32TMS_10m_S1AIWGRDH_ENVEO.tif"
+L1C_NAME = "S2B_MSI1C_20200905T124309_N0500_R095_T28WET_20230328T093834.SAFE"
+L2A_NAME = "SENTINEL2B_20201215-103755-817_L2A_T32TMS_C_V1-0"
+GRD_NAME = "S1A_IW_GRDH_1SDV_20211227T052658_20211227T052723_041190_04E503_C194.SAFE"
+
+
+class TestParseYmd(unittest.TestCase):
+
+    def test_valid_date(self):
+        self.assertEqual(parse_ymd("2021-12-27"), ("2021", "12", "27", datetime(2021, 12, 27)))
+
+    def test_leap_day(self):
+        self.assertEqual(parse_ymd("2024-02-29")[3], datetime(2024, 2, 29))
+
+    def test_malformed_dates(self):
+        for value in ("20211227", "2021-2-27", "2021-12-7", "21-12-27", "2021/12/27", "2021-12-27 ", " 2021-12-27", "2021-12-27T00:00:00", ""):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_ymd(value)
+
+    def test_out_of_range_month_or_day(self):
+        for value in ("2021-00-10", "2021-13-10", "2021-12-00", "2021-12-32"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_ymd(value)
+
+    def test_dates_matching_the_pattern_but_not_existing(self):
+        for value in ("2021-02-30", "2021-02-29", "2021-04-31", "2100-02-29"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_ymd(value)
+
+
+class TestSigma0NamePattern(unittest.TestCase):
+
+    def test_known_good_name(self):
+        sigma0_match = SIGMA0_NAME_PATTERN.match(SIGMA0_NAME)
+        self.assertIsNotNone(sigma0_match)
+        self.assertEqual(sigma0_match.group("mission", "date", "time", "tile", "orbit"),
+                         ("S1A", "20211227", "052658", "32TMS", "022"))
+
+    def test_malformed_names(self):
+        for name in ("", "SIG0_20211227.tif", "SIG0_20211227T052658_20211227T052723_04E503_022_T32TMS",
+                     "SIG0_20211227_20211227T052723_04E503_022_T32TMS_10m_S1AIWGRDH_ENVEO.tif"):
+            with self.subTest(name=name):
+                self.assertIsNone(SIGMA0_NAME_PATTERN.match(name))
+
+
+class TestParseSigma0(unittest.TestCase):
+
+    def setUp(self):
+        self.generator = SWSConfigFileGenerator("32TMS", "2021-12-27", SIGMA0_NAME)
+        # Keeps LoggerFactory from creating its log file in the working directory
+        self.generator._logger = logging.getLogger(__name__)
+
+    def test_known_good_name(self):
+        self.assertEqual(self.generator._parse_sigma0(SIGMA0_NAME, "2021", "12", "27"),
+                         Sigma0Info("S1A", "20211227", "052658", "32TMS", "022"))
+
+    def test_malformed_name(self):
+        with self.assertLogs(__name__, level=logging.CRITICAL):
+            with self.assertRaises(ValueError):
+                self.generator._parse_sigma0("SIG0_20211227.tif", "2021", "12", "27")
+
+    def test_mission_mismatch(self):
+        with self.assertLogs(__name__, level=logging.CRITICAL):
+            with self.assertRaises(AssertionError):
+                self.generator._parse_sigma0(SIGMA0_NAME.replace("S1AIWGRDH", "S2AIWGRDH"), "2021", "12", "27")
+
+    def test_date_mismatch(self):
+        with self.assertLogs(__name__, level=logging.CRITICAL):
+            with self.assertRaises(AssertionError):
+                self.generator._parse_sigma0(SIGMA0_NAME, "2021", "12", "28")
+
+    def test_tile_mismatch(self):
+        with self.assertLogs(__name__, level=logging.CRITICAL):
+            with self.assertRaises(AssertionError):
+                self.generator._parse_sigma0(SIGMA0_NAME.replace("T32TMS", "T31TCH"), "2021", "12", "27")
+
+
+class TestL1CNamePattern(unittest.TestCase):
+
+    def test_known_good_name(self):
+        l1c_match = L1C_NAME_PATTERN.match(L1C_NAME)
+        self.assertIsNotNone(l1c_match)
+        self.assertEqual(l1c_match.group("mission", "date", "tile"), ("S2B", "20200905", "28WET"))
+
+    def test_malformed_names(self):
+        for name in ("", "S2B_MSI1C", "S2B_MSI1C_20200905T124309_N0500_R095"):
+            with self.subTest(name=name):
+                self.assertIsNone(L1C_NAME_PATTERN.match(name))
+
+
+class TestL2ANamePattern(unittest.TestCase):
+
+    def test_known_good_name(self):
+        l2a_match = L2A_NAME_PATTERN.match(L2A_NAME)
+        self.assertIsNotNone(l2a_match)
+        self.assertEqual(l2a_match.group("mission", "year", "month", "day", "tile"),
+                         ("SENTINEL2B", "2020", "12", "15", "T32TMS"))
+
+    def test_malformed_names(self):
+        for name in ("", "SENTINEL2B_2020-12-15_L2A_T32TMS_C_V1-0", "SENTINEL2B_20201215-103755-817_L2A"):
+            with self.subTest(name=name):
+                self.assertIsNone(L2A_NAME_PATTERN.match(name))
+
+
+class TestGrdNamePattern(unittest.TestCase):
+
+    def test_known_good_name(self):
+        grd_match = GRD_NAME_PATTERN.match(GRD_NAME)
+        self.assertIsNotNone(grd_match)
+        self.assertEqual(grd_match.group("mission", "date", "start_time", "end_time", "acquisition_id"),
+                         ("S1A", "20211227", "052658", "052723", "04E503"))
+
+    def test_malformed_names(self):
+        for name in ("", "S1A_IW_GRDH.SAFE", "S1A_IW_GRDH_1SDV_20211227_20211227_041190_04E503_C194.SAFE"):
+            with self.subTest(name=name):
+                self.assertIsNone(GRD_NAME_PATTERN.match(name))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import threading
+import time
+import unittest
+
+from magellium.scheduler import Scheduler
+
+
+class TestScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.calls_lock = threading.Lock()
+
+    def record(self, name):
+        with self.calls_lock:
+            self.calls.append((name, time.monotonic()))
+
+    def test_invalid_max_workers(self):
+        with self.assertRaises(ValueError):
+            Scheduler(max_workers=0)
+
+    def test_stop_wakes_the_loop_immediately(self):
+        scheduler = Scheduler(max_workers=1)
+        scheduler.add_job(self.record, 60, "job")
+        scheduler.start()
+        time.sleep(0.05)
+        started = time.monotonic()
+        scheduler.stop()
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(self.calls, [])
+
+    def test_stop_without_jobs(self):
+        scheduler = Scheduler(max_workers=1)
+        scheduler.start()
+        started = time.monotonic()
+        scheduler.stop()
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_jobs_fire_in_next_time_order(self):
+        scheduler = Scheduler(max_workers=3)
+        scheduler.add_job(self.record, 0.3, "slow")
+        scheduler.add_job(self.record, 0.1, "fast")
+        scheduler.add_job(self.record, 0.2, "medium")
+        scheduler.start()
+        time.sleep(0.35)
+        scheduler.stop()
+        first_calls = []
+        for name, _ in self.calls:
+            if name not in first_calls:
+                first_calls.append(name)
+        self.assertEqual(first_calls, ["fast", "medium", "slow"])
+
+    def test_reschedule_applies_from_the_next_run(self):
+        first_call = threading.Event()
+
+        def job():
+            self.record("job")
+            first_call.set()
+
+        scheduler = Scheduler(max_workers=1)
+        scheduler.add_job(job, 0.1)
+        scheduler.start()
+        self.assertTrue(first_call.wait(1))
+        scheduler.reschedule(job, 60)
+        time.sleep(0.5)
+        scheduler.stop()
+        # The run following the reschedule was already planned with the former interval, the ones after use the new one
+        self.assertEqual(len(self.calls), 2)
+
+    def test_reschedule_unknown_job(self):
+        scheduler = Scheduler(max_workers=1)
+        scheduler.add_job(self.record, 1, "job")
+        with self.assertRaises(ValueError):
+            scheduler.reschedule(print, 1)
+
+    def test_tick_skipped_while_previous_run_in_flight(self):
+        running = []
+        peak = []
+
+        def job():
+            with self.calls_lock:
+                running.append(None)
+                peak.append(len(running))
+            time.sleep(0.3)
+            with self.calls_lock:
+                running.pop()
+
+        scheduler = Scheduler(max_workers=4)
+        scheduler.add_job(job, 0.05)
+        scheduler.start()
+        time.sleep(0.5)
+        scheduler.stop()
+        self.assertEqual(max(peak), 1)
+        self.assertLessEqual(len(peak), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()